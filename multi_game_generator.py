@@ -3,79 +3,133 @@
 Generate a multi-tab word game interface with different game variations
 """
 
-import re
 import html
-import json
+import os
+import gzip
+import mmap
 import random
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+# Same page-safe JSON as the single game: '<' is written as \u003c, so no string can end the <script>
+from word_game_generator import dump_game_data
+
+# Lines made only of dashes, at least this many, separate entries and sections
+SEPARATOR_LINE_MIN_DASHES = 10
+
+# Entries are separated by lines of 25 or more dashes; the input is memory-mapped and
+# each entry is decoded straight from the mapping when it is handed to the parser
+SEPARATOR_MIN_DASHES = 25
+_SEPARATOR_START = b'\n' + b'-' * SEPARATOR_MIN_DASHES
+WRITE_BUFFER_SIZE = 1 << 20  # The page is written section by section through this buffer
+GZIP_LEVEL = 6  # A pre-compressed copy (.html.gz) is written next to the page
+
+# Entries are parsed across all CPU cores, unless there are too few to pay for the worker processes
+PARALLEL_MIN_ENTRIES = 200
+PARSE_CHUNK_SIZE = 64
+
+# Line dispatch: section headers by exact line, labelled fields by the text before ':'
+_SECTIONS = {'Synonyms:': 'synonyms', 'Antonyms:': 'antonyms', 'Sentences:': 'sentences'}
+_LABELS = {'Word': 'word', 'Meaning': 'meaning', 'Origin': 'origin'}
+
+def iter_entries(input_file):
+    """Yield the text of each entry in input_file, found with mmap.find rather than read into memory."""
+    with open(input_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield ''  # An empty file cannot be mapped
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = search = 0
+            while (sep := mm.find(_SEPARATOR_START, search)) >= 0:
+                line_end = mm.find(b'\n', sep + 1)
+                if line_end < 0:
+                    break  # A last line without a newline is not a separator
+                if not mm[sep + 1:line_end].rstrip(b'\r').strip(b'-'):
+                    yield mm[start:sep].decode('utf-8')
+                    start = line_end + 1
+                search = line_end
+            yield mm[start:].decode('utf-8')
+
+def new_word_data():
+    """An empty parsed entry."""
+    return {'word': '', 'meaning': '', 'synonyms': [], 'antonyms': [], 'sentences': [], 'origin': ''}
 
 def parse_word_entry(entry_text):
-    """Parse a single word entry from the text."""
+    """Parse a single word entry from the text; None if it has no word or no meaning."""
     lines = entry_text.strip().split('\n')
     
-    word_data = {
-        'word': '',
-        'meaning': '',
-        'synonyms': [],
-        'antonyms': [],
-        'sentences': [],
-        'origin': ''
-    }
+    word_data = new_word_data()
     
     current_section = None
     
-    for line in lines:
-        line = line.strip()
-        
-        if not line or re.match(r'^-{10,}$', line):
+    for line in map(str.strip, lines):
+        if not line:
             continue
+        
+        if line[0].isdecimal():
+            # Numbered list items make up most of an entry, and no header or label starts
+            # with a digit, so they skip the header and label lookups entirely
+            if not current_section:
+                continue
+            number, dot, rest = line.partition('.')
+            clean_line = rest.strip() if dot and number.isdecimal() else line
+        else:
+            if line[0] == '-' and len(line) >= SEPARATOR_LINE_MIN_DASHES and not line.strip('-'):
+                continue
             
-        if line.startswith('Word: '):
-            word_data = {
-                'word': '',
-                'meaning': '',
-                'synonyms': [],
-                'antonyms': [],
-                'sentences': [],
-                'origin': ''
-            }
-            current_section = None
+            section = _SECTIONS.get(line)
+            if section:
+                current_section = section
+                continue
             
-            word_line = line[6:]
-            if ';' in word_line:
-                word_data['word'], word_data['meaning'] = word_line.split(';', 1)
-            else:
-                word_data['word'] = word_line
-        elif line.startswith('Meaning: '):
-            word_data['meaning'] = line[9:]
-        elif line == 'Synonyms:':
-            current_section = 'synonyms'
-        elif line == 'Antonyms:':
-            current_section = 'antonyms'
-        elif line == 'Sentences:':
-            current_section = 'sentences'
-        elif line.startswith('Origin:'):
-            current_section = 'origin'
-            if len(line) > 7:
-                word_data['origin'] = line[7:].strip()
-        elif line and current_section:
-            clean_line = re.sub(r'^\d+\.\s*', '', line)
-            clean_line = clean_line.strip()
-            
-            if current_section == 'origin':
-                if word_data['origin']:
-                    word_data['origin'] += ' ' + clean_line
+            label, colon, rest = line.partition(':')
+            kind = _LABELS.get(label) if colon else None
+            
+            if kind == 'word' and rest.startswith(' '):
+                word_data = new_word_data()
+                current_section = None
+                
+                word_line = rest[1:]
+                if ';' in word_line:
+                    word_data['word'], word_data['meaning'] = word_line.split(';', 1)
                 else:
-                    word_data['origin'] = clean_line
-            elif clean_line:
-                word_data[current_section].append(clean_line)
+                    word_data['word'] = word_line
+                continue
+            elif kind == 'meaning' and rest.startswith(' '):
+                word_data['meaning'] = rest[1:]
+                continue
+            elif kind == 'origin':
+                current_section = 'origin'
+                if rest:
+                    word_data['origin'] = rest.strip()
+                continue
+            elif not current_section:
+                continue
+            clean_line = line
+        
+        if current_section == 'origin':
+            if word_data['origin']:
+                word_data['origin'] += ' ' + clean_line
+            else:
+                word_data['origin'] = clean_line
+        elif clean_line:
+            word_data[current_section].append(clean_line)
     
+    if not (word_data['word'] and word_data['meaning']):
+        return None
     return word_data
 
+# Silly-definition clue templates, filled with the lowercased meaning
+_SILLY_CLUES = (
+    "🤪 I'm what happens when {meaning} gets fancy",
+    "😄 Imagine {meaning} wearing a tuxedo - that's me!",
+    "🎭 I'm the drama queen version of {meaning}"
+)
+
 def generate_funny_clues(word_data):
     """Generate funny and creative clues for the word."""
     word = word_data['word'].lower()
-    meaning = word_data['meaning']
+    meaning_lower = word_data['meaning'].lower()
     synonyms = word_data['synonyms']
     antonyms = word_data['antonyms']
     origin = word_data['origin']
@@ -84,11 +138,11 @@ def generate_funny_clues(word_data):
     
     # Rhyme clue
     if word.endswith('ate'):
-        clues.append(f"🎵 This word rhymes with 'fate' and means to {meaning.lower()}")
+        clues.append(f"🎵 This word rhymes with 'fate' and means to {meaning_lower}")
     elif word.endswith('ous'):
-        clues.append(f"🎵 This '-ous' word describes something {meaning.lower()}")
+        clues.append(f"🎵 This '-ous' word describes something {meaning_lower}")
     elif word.endswith('ent'):
-        clues.append(f"🎵 This '-ent' word is about {meaning.lower()}")
+        clues.append(f"🎵 This '-ent' word is about {meaning_lower}")
     
     # Synonym riddle
     if synonyms:
@@ -105,99 +159,76 @@ def generate_funny_clues(word_data):
     
     # Origin clue
     if origin and 'Latin' in origin:
-        clues.append(f"🏛️ My ancestors spoke Latin, and I mean {meaning.lower()}")
+        clues.append(f"🏛️ My ancestors spoke Latin, and I mean {meaning_lower}")
     
-    # Silly definition
-    silly_meanings = [
-        f"🤪 I'm what happens when {meaning.lower()} gets fancy",
-        f"😄 Imagine {meaning.lower()} wearing a tuxedo - that's me!",
-        f"🎭 I'm the drama queen version of {meaning.lower()}"
-    ]
-    clues.append(random.choice(silly_meanings))
+    # Silly definition; only the chosen template is formatted
+    clues.append(_SILLY_CLUES[random.randrange(len(_SILLY_CLUES))].format(meaning=meaning_lower))
     
     return clues
 
-def create_multi_game_html(words_data):
-    """Create the multi-tab game HTML."""
-    
-    # Convert words data to JSON for JavaScript
-    game_data = []
-    for word_data in words_data:
-        if word_data['word'] and word_data['meaning']:
-            clues = generate_funny_clues(word_data)
-            game_data.append({
-                'word': word_data['word'],
-                'meaning': word_data['meaning'],
-                'synonyms': word_data['synonyms'][:5],
-                'antonyms': word_data['antonyms'][:5],
-                'sentences': word_data['sentences'][:3],
-                'origin': word_data['origin'],
-                'clues': clues,
-                'difficulty': len(word_data['word']) + len(word_data['synonyms']) # Simple difficulty metric
-            })
-    
-    html_content = f"""<!DOCTYPE html>
+# The whole page as a plain constant; only the game data marker is filled in per call
+_MULTI_GAME_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>🎮 Word Games Collection</title>
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: 'Comic Sans MS', cursive, sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
             color: #333;
-        }}
+        }
         
-        .game-container {{
+        .game-container {
             max-width: 900px;
             margin: 0 auto;
             padding: 20px;
-        }}
+        }
         
-        .game-header {{
+        .game-header {
             text-align: center;
             background: white;
             border-radius: 20px;
             padding: 30px;
             margin-bottom: 30px;
             box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-        }}
+        }
         
-        .game-title {{
+        .game-title {
             font-size: 3em;
             color: #667eea;
             margin-bottom: 10px;
             text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
-        }}
+        }
         
-        .game-subtitle {{
+        .game-subtitle {
             font-size: 1.2em;
             color: #666;
-        }}
+        }
         
         /* Tab Styles */
-        .tab-container {{
+        .tab-container {
             background: white;
             border-radius: 20px 20px 0 0;
             box-shadow: 0 5px 15px rgba(0,0,0,0.1);
             overflow: hidden;
-        }}
+        }
         
-        .tab-nav {{
+        .tab-nav {
             display: flex;
             background: #f8f9fa;
             border-bottom: 3px solid #e9ecef;
-        }}
+        }
         
-        .tab-btn {{
+        .tab-btn {
             flex: 1;
             padding: 20px;
             background: none;
@@ -209,52 +240,52 @@ def create_multi_game_html(words_data):
             transition: all 0.3s ease;
             border-bottom: 4px solid transparent;
             font-family: inherit;
-        }}
+        }
         
-        .tab-btn:hover {{
+        .tab-btn:hover {
             background: #e9ecef;
             color: #333;
-        }}
+        }
         
-        .tab-btn.active {{
+        .tab-btn.active {
             color: #667eea;
             background: white;
             border-bottom-color: #667eea;
-        }}
+        }
         
-        .tab-icon {{
+        .tab-icon {
             font-size: 1.3em;
             margin-bottom: 5px;
             display: block;
-        }}
+        }
         
-        .tab-label {{
+        .tab-label {
             font-size: 0.9em;
             display: block;
-        }}
+        }
         
         /* Game Content */
-        .tab-content {{
+        .tab-content {
             display: none;
             padding: 40px;
             background: white;
             border-radius: 0 0 20px 20px;
             box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-        }}
+        }
         
-        .tab-content.active {{
+        .tab-content.active {
             display: block;
-        }}
+        }
         
-        .game-description {{
+        .game-description {
             background: linear-gradient(135deg, #e8f5e8 0%, #c6f6d5 100%);
             padding: 20px;
             border-radius: 15px;
             margin-bottom: 30px;
             border-left: 5px solid #38a169;
-        }}
+        }
         
-        .question-card {{
+        .question-card {
             background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
             color: white;
             padding: 30px;
@@ -263,9 +294,9 @@ def create_multi_game_html(words_data):
             font-size: 1.3em;
             line-height: 1.6;
             text-align: center;
-        }}
+        }
         
-        .clue {{
+        .clue {
             background: #fff3cd;
             color: #856404;
             padding: 15px;
@@ -273,25 +304,25 @@ def create_multi_game_html(words_data):
             margin: 10px 0;
             border: 2px dashed #ffeaa7;
             font-size: 1.1em;
-        }}
+        }
         
-        .multiple-choice-clue {{
+        .multiple-choice-clue {
             background: linear-gradient(135deg, #e8f5e8 0%, #c6f6d5 100%);
             color: #22543d;
             border: 2px solid #38a169;
             padding: 20px;
             border-radius: 15px;
             font-weight: bold;
-        }}
+        }
         
-        .choice-options {{
+        .choice-options {
             display: flex;
             flex-direction: column;
             gap: 10px;
             margin-top: 15px;
-        }}
+        }
         
-        .choice-option {{
+        .choice-option {
             background: #38a169;
             color: white;
             padding: 12px 20px;
@@ -301,26 +332,26 @@ def create_multi_game_html(words_data):
             transition: all 0.3s ease;
             text-align: left;
             border: 2px solid transparent;
-        }}
+        }
         
-        .choice-option:hover {{
+        .choice-option:hover {
             background: #2f855a;
             transform: translateY(-2px);
             box-shadow: 0 4px 12px rgba(56, 161, 105, 0.3);
-        }}
+        }
         
-        .choice-option.selected {{
+        .choice-option.selected {
             background: #2f855a;
             border-color: #22543d;
             box-shadow: 0 4px 12px rgba(56, 161, 105, 0.4);
-        }}
+        }
         
-        .input-area {{
+        .input-area {
             margin: 30px 0;
             text-align: center;
-        }}
+        }
         
-        .game-input {{
+        .game-input {
             padding: 15px;
             font-size: 1.2em;
             border: 3px solid #667eea;
@@ -329,22 +360,22 @@ def create_multi_game_html(words_data):
             max-width: 400px;
             text-align: center;
             font-family: inherit;
-        }}
+        }
         
-        .game-input:focus {{
+        .game-input:focus {
             outline: none;
             box-shadow: 0 0 20px rgba(102, 126, 234, 0.3);
-        }}
+        }
         
-        .btn-group {{
+        .btn-group {
             display: flex;
             gap: 15px;
             justify-content: center;
             margin: 20px 0;
             flex-wrap: wrap;
-        }}
+        }
         
-        .game-btn {{
+        .game-btn {
             padding: 12px 25px;
             font-size: 1.1em;
             border: none;
@@ -352,175 +383,175 @@ def create_multi_game_html(words_data):
             cursor: pointer;
             font-family: inherit;
             transition: all 0.3s ease;
-        }}
+        }
         
-        .submit-btn {{
+        .submit-btn {
             background: #48bb78;
             color: white;
-        }}
+        }
         
-        .submit-btn:hover {{
+        .submit-btn:hover {
             background: #38a169;
             transform: translateY(-2px);
-        }}
+        }
         
-        .hint-btn {{
+        .hint-btn {
             background: #ed8936;
             color: white;
-        }}
+        }
         
-        .hint-btn:hover {{
+        .hint-btn:hover {
             background: #dd6b20;
             transform: translateY(-2px);
-        }}
+        }
         
-        .skip-btn {{
+        .skip-btn {
             background: #e53e3e;
             color: white;
-        }}
+        }
         
-        .skip-btn:hover {{
+        .skip-btn:hover {
             background: #c53030;
             transform: translateY(-2px);
-        }}
+        }
         
-        .primary-btn {{
+        .primary-btn {
             background: #667eea;
             color: white;
-        }}
+        }
         
-        .primary-btn:hover {{
+        .primary-btn:hover {
             background: #5a67d8;
             transform: translateY(-2px);
-        }}
+        }
         
-        .score-board {{
+        .score-board {
             display: flex;
             justify-content: space-around;
             background: #f7fafc;
             padding: 20px;
             border-radius: 15px;
             margin-bottom: 20px;
-        }}
+        }
         
-        .score-item {{
+        .score-item {
             text-align: center;
-        }}
+        }
         
-        .score-number {{
+        .score-number {
             font-size: 2em;
             font-weight: bold;
             color: #667eea;
-        }}
+        }
         
-        .score-label {{
+        .score-label {
             color: #666;
             font-size: 0.9em;
-        }}
+        }
         
-        .feedback {{
+        .feedback {
             padding: 20px;
             border-radius: 15px;
             margin: 20px 0;
             font-size: 1.2em;
             font-weight: bold;
             text-align: center;
-        }}
+        }
         
-        .correct {{
+        .correct {
             background: #c6f6d5;
             color: #22543d;
             border: 2px solid #38a169;
-        }}
+        }
         
-        .incorrect {{
+        .incorrect {
             background: #fed7d7;
             color: #742a2a;
             border: 2px solid #e53e3e;
-        }}
+        }
         
-        .answer-reveal {{
+        .answer-reveal {
             background: #bee3f8;
             color: #2a4365;
             border: 2px solid #3182ce;
             padding: 20px;
             border-radius: 15px;
             margin: 20px 0;
-        }}
+        }
         
-        .word-details {{
+        .word-details {
             text-align: left;
             margin-top: 15px;
-        }}
+        }
         
-        .detail-section {{
+        .detail-section {
             margin: 10px 0;
-        }}
+        }
         
-        .detail-title {{
+        .detail-title {
             font-weight: bold;
             color: #667eea;
-        }}
+        }
         
-        .synonym-tag, .antonym-tag {{
+        .synonym-tag, .antonym-tag {
             display: inline-block;
             padding: 5px 10px;
             margin: 3px;
             border-radius: 15px;
             font-size: 0.9em;
-        }}
+        }
         
-        .synonym-tag {{
+        .synonym-tag {
             background: #c6f6d5;
             color: #22543d;
-        }}
+        }
         
-        .antonym-tag {{
+        .antonym-tag {
             background: #fed7d7;
             color: #742a2a;
-        }}
+        }
         
-        .example-sentence {{
+        .example-sentence {
             background: #f7fafc;
             padding: 10px;
             border-radius: 8px;
             margin: 5px 0;
             border-left: 4px solid #667eea;
             font-style: italic;
-        }}
+        }
         
         /* Speed Mode Specific */
-        .timer-display {{
+        .timer-display {
             font-size: 2em;
             font-weight: bold;
             color: #e53e3e;
             text-align: center;
             margin: 20px 0;
-        }}
+        }
         
-        .progress-bar {{
+        .progress-bar {
             background: #e2e8f0;
             border-radius: 25px;
             overflow: hidden;
             height: 10px;
             margin: 20px 0;
-        }}
+        }
         
-        .progress-fill {{
+        .progress-fill {
             background: linear-gradient(90deg, #48bb78, #38a169);
             height: 100%;
             transition: width 0.3s ease;
-        }}
+        }
         
         /* Difficulty Settings */
-        .difficulty-selector {{
+        .difficulty-selector {
             display: flex;
             gap: 10px;
             justify-content: center;
             margin: 20px 0;
-        }}
+        }
         
-        .difficulty-btn {{
+        .difficulty-btn {
             padding: 10px 20px;
             border: 2px solid #667eea;
             background: white;
@@ -529,67 +560,67 @@ def create_multi_game_html(words_data):
             cursor: pointer;
             font-family: inherit;
             transition: all 0.3s ease;
-        }}
+        }
         
-        .difficulty-btn.active {{
+        .difficulty-btn.active {
             background: #667eea;
             color: white;
-        }}
+        }
         
         /* Memory Game Cards */
-        .memory-card {{
+        .memory-card {
             transition: all 0.3s ease;
             user-select: none;
             font-weight: bold;
-        }}
+        }
         
-        .memory-card:hover {{
+        .memory-card:hover {
             transform: scale(1.05);
             box-shadow: 0 4px 12px rgba(0,0,0,0.2);
-        }}
+        }
         
-        @keyframes bounce {{
-            0%, 20%, 60%, 100% {{
+        @keyframes bounce {
+            0%, 20%, 60%, 100% {
                 transform: translateY(0);
-            }}
-            40% {{
+            }
+            40% {
                 transform: translateY(-10px);
-            }}
-            80% {{
+            }
+            80% {
                 transform: translateY(-5px);
-            }}
-        }}
+            }
+        }
         
-        .bounce {{
+        .bounce {
             animation: bounce 1s;
-        }}
+        }
         
-        .hidden {{
+        .hidden {
             display: none;
-        }}
+        }
         
-        @media (max-width: 768px) {{
-            .game-container {{
+        @media (max-width: 768px) {
+            .game-container {
                 padding: 10px;
-            }}
+            }
             
-            .game-header, .tab-content {{
+            .game-header, .tab-content {
                 padding: 20px;
-            }}
+            }
             
-            .game-title {{
+            .game-title {
                 font-size: 2em;
-            }}
+            }
             
-            .tab-nav {{
+            .tab-nav {
                 flex-direction: column;
-            }}
+            }
             
-            .btn-group {{
+            .btn-group {
                 flex-direction: column;
                 align-items: center;
-            }}
-        }}
+            }
+        }
     </style>
 </head>
 <body>
@@ -841,12 +872,22 @@ def create_multi_game_html(words_data):
     </div>
 
     <script>
-        const gameData = {json.dumps(game_data)};
+        const gameColumns = __GAME_DATA__;
+        const gameData = gameColumns.word.map((word, i) => ({
+            word: word,
+            meaning: gameColumns.meaning[i],
+            synonyms: gameColumns.synonyms[i],
+            antonyms: gameColumns.antonyms[i],
+            sentences: gameColumns.sentences[i],
+            origin: gameColumns.origin[i],
+            clues: gameColumns.clues[i],
+            difficulty: gameColumns.difficulty[i]
+        }));
         
         // Global game state
         let activeTab = 'classic';
-        let gameStates = {{
-            classic: {{
+        let gameStates = {
+            classic: {
                 currentWord: null,
                 gameMode: 'word-to-meaning',
                 hintsUsed: 0,
@@ -854,8 +895,8 @@ def create_multi_game_html(words_data):
                 totalQuestions: 0,
                 currentStreak: 0,
                 difficulty: 'easy'
-            }},
-            speed: {{
+            },
+            speed: {
                 timeLeft: 60,
                 totalTime: 60,
                 correctAnswers: 0,
@@ -863,23 +904,23 @@ def create_multi_game_html(words_data):
                 isActive: false,
                 startTime: 0,
                 timer: null
-            }},
-            quiz: {{
+            },
+            quiz: {
                 currentQuestion: 0,
                 totalQuestions: 10,
                 correctAnswers: 0,
                 questions: [],
                 isActive: false
-            }},
-            memory: {{
+            },
+            memory: {
                 cards: [],
                 flippedCards: [],
                 matchedPairs: 0,
                 attempts: 0,
                 startTime: 0,
                 isActive: false
-            }},
-            battle: {{
+            },
+            battle: {
                 level: 1,
                 lives: 3,
                 score: 0,
@@ -887,25 +928,25 @@ def create_multi_game_html(words_data):
                 isActive: false,
                 currentWord: null,
                 timer: null
-            }}
-        }};
+            }
+        };
         
         // Initialize the game
-        document.addEventListener('DOMContentLoaded', function() {{
+        document.addEventListener('DOMContentLoaded', function() {
             initializeTabs();
             initializeClassicMode();
             initializeSpeedMode();
             initializeQuizMode();
             initializeMemoryMode();
             initializeBattleMode();
-        }});
+        });
         
-        function initializeTabs() {{
+        function initializeTabs() {
             const tabButtons = document.querySelectorAll('.tab-btn');
             const tabContents = document.querySelectorAll('.tab-content');
             
-            tabButtons.forEach(btn => {{
-                btn.addEventListener('click', () => {{
+            tabButtons.forEach(btn => {
+                btn.addEventListener('click', () => {
                     const targetTab = btn.dataset.tab;
                     
                     // Update active tab
@@ -916,48 +957,48 @@ def create_multi_game_html(words_data):
                     document.getElementById(targetTab + '-tab').classList.add('active');
                     
                     activeTab = targetTab;
-                }});
-            }});
-        }}
+                });
+            });
+        }
         
         // Classic Mode Functions
-        function initializeClassicMode() {{
+        function initializeClassicMode() {
             const state = gameStates.classic;
             
             // Mode buttons
-            document.getElementById('classic-word-meaning').addEventListener('click', () => {{
+            document.getElementById('classic-word-meaning').addEventListener('click', () => {
                 state.gameMode = 'word-to-meaning';
                 highlightActiveMode('classic', 'word-to-meaning');
                 generateClassicQuestion();
-            }});
+            });
             
-            document.getElementById('classic-meaning-word').addEventListener('click', () => {{
+            document.getElementById('classic-meaning-word').addEventListener('click', () => {
                 state.gameMode = 'meaning-to-word';
                 highlightActiveMode('classic', 'meaning-to-word');
                 generateClassicQuestion();
-            }});
+            });
             
-            document.getElementById('classic-sentence-clue').addEventListener('click', () => {{
+            document.getElementById('classic-sentence-clue').addEventListener('click', () => {
                 state.gameMode = 'sentence-clue';
                 highlightActiveMode('classic', 'sentence-clue');
                 generateClassicQuestion();
-            }});
+            });
             
-            document.getElementById('classic-fun-clues').addEventListener('click', () => {{
+            document.getElementById('classic-fun-clues').addEventListener('click', () => {
                 state.gameMode = 'fun-clues';
                 highlightActiveMode('classic', 'fun-clues');
                 generateClassicQuestion();
-            }});
+            });
             
             // Difficulty buttons
-            document.querySelectorAll('#classic-tab .difficulty-btn').forEach(btn => {{
-                btn.addEventListener('click', () => {{
+            document.querySelectorAll('#classic-tab .difficulty-btn').forEach(btn => {
+                btn.addEventListener('click', () => {
                     document.querySelectorAll('#classic-tab .difficulty-btn').forEach(b => b.classList.remove('active'));
                     btn.classList.add('active');
                     state.difficulty = btn.dataset.difficulty;
                     generateClassicQuestion();
-                }});
-            }});
+                });
+            });
             
             // Game controls
             document.getElementById('classic-new-question').addEventListener('click', generateClassicQuestion);
@@ -967,49 +1008,49 @@ def create_multi_game_html(words_data):
             
             // Input handling
             const answerInput = document.getElementById('classic-answer-input');
-            answerInput.addEventListener('keypress', (e) => {{
-                if (e.key === 'Enter') {{
+            answerInput.addEventListener('keypress', (e) => {
+                if (e.key === 'Enter') {
                     checkClassicAnswer();
-                }}
-            }});
+                }
+            });
             
-            answerInput.addEventListener('input', () => {{
+            answerInput.addEventListener('input', () => {
                 document.getElementById('classic-submit-btn').disabled = answerInput.value.trim() === '';
-            }});
+            });
             
             // Highlight first mode as active
             highlightActiveMode('classic', 'word-to-meaning');
-        }}
+        }
         
-        function highlightActiveMode(tab, mode) {{
-            const buttons = {{
+        function highlightActiveMode(tab, mode) {
+            const buttons = {
                 'word-to-meaning': document.getElementById(tab + '-word-meaning'),
                 'meaning-to-word': document.getElementById(tab + '-meaning-word'),
                 'sentence-clue': document.getElementById(tab + '-sentence-clue'),
                 'fun-clues': document.getElementById(tab + '-fun-clues')
-            }};
+            };
             
-            Object.values(buttons).forEach(btn => {{
+            Object.values(buttons).forEach(btn => {
                 if (btn) btn.style.background = '#48bb78';
-            }});
+            });
             
-            if (buttons[mode]) {{
+            if (buttons[mode]) {
                 buttons[mode].style.background = '#38a169';
-            }}
-        }}
+            }
+        }
         
-        function generateClassicQuestion() {{
+        function generateClassicQuestion() {
             const state = gameStates.classic;
             
             // Filter words by difficulty
             let filteredWords = gameData;
-            if (state.difficulty === 'easy') {{
+            if (state.difficulty === 'easy') {
                 filteredWords = gameData.filter(w => w.word.length <= 6 && w.synonyms.length >= 2);
-            }} else if (state.difficulty === 'medium') {{
+            } else if (state.difficulty === 'medium') {
                 filteredWords = gameData.filter(w => w.word.length > 6 && w.word.length <= 10);
-            }} else {{
+            } else {
                 filteredWords = gameData.filter(w => w.word.length > 10 || w.synonyms.length < 2);
-            }}
+            }
             
             state.currentWord = filteredWords[Math.floor(Math.random() * filteredWords.length)];
             state.hintsUsed = 0;
@@ -1027,15 +1068,15 @@ def create_multi_game_html(words_data):
             
             // Generate and show multiple choice options
             generateClassicOptions();
-        }}
+        }
         
-        function generateClassicOptions() {{
+        function generateClassicOptions() {
             const state = gameStates.classic;
             let options = [];
             let correctAnswer = '';
             
             // Generate options based on game mode
-            switch(state.gameMode) {{
+            switch(state.gameMode) {
                 case 'word-to-meaning':
                     // Show 4 meanings, one is correct
                     const wrongMeanings = gameData
@@ -1070,16 +1111,16 @@ def create_multi_game_html(words_data):
                     options = [...wrongSentenceWords, state.currentWord.word].sort(() => Math.random() - 0.5);
                     correctAnswer = state.currentWord.word;
                     
-                    if (state.currentWord.sentences.length > 0) {{
+                    if (state.currentWord.sentences.length > 0) {
                         const sentence = state.currentWord.sentences[Math.floor(Math.random() * state.currentWord.sentences.length)];
                         const hiddenSentence = sentence.replace(new RegExp(state.currentWord.word, 'gi'), '____');
                         document.getElementById('classic-question').innerHTML = '<strong>Fill in the blank:</strong><br>"' + hiddenSentence + '"';
-                    }} else {{
+                    } else {
                         // Fallback to word-to-meaning
                         state.gameMode = 'word-to-meaning';
                         generateClassicOptions();
                         return;
-                    }}
+                    }
                     break;
                     
                 case 'fun-clues':
@@ -1095,32 +1136,34 @@ def create_multi_game_html(words_data):
                     const randomClue = state.currentWord.clues[Math.floor(Math.random() * state.currentWord.clues.length)];
                     document.getElementById('classic-question').innerHTML = '<strong>Guess the word:</strong><br>' + randomClue;
                     break;
-            }}
+            }
             
             state.correctAnswer = correctAnswer;
             state.options = options;
             
             // Display options
             displayClassicOptions(options);
-        }}
+        }
         
-        function displayClassicOptions(options) {{
+        function displayClassicOptions(options) {
             const optionsArea = document.getElementById('classic-clues-area');
             optionsArea.innerHTML = '<div style="margin: 20px 0; font-weight: bold; color: #667eea;">Choose the correct answer:</div>';
             
-            options.forEach((option, index) => {{
+            // Built off-DOM and added with one insertion
+            const fragment = document.createDocumentFragment();
+            options.forEach((option, index) => {
                 const optionDiv = document.createElement('div');
                 optionDiv.className = 'choice-option';
                 optionDiv.style.margin = '10px 0';
                 optionDiv.style.cursor = 'pointer';
                 optionDiv.textContent = (index + 1) + '. ' + option;
                 
-                optionDiv.onclick = function() {{
+                optionDiv.onclick = function() {
                     // Clear previous selections
-                    document.querySelectorAll('#classic-clues-area .choice-option').forEach(opt => {{
+                    document.querySelectorAll('#classic-clues-area .choice-option').forEach(opt => {
                         opt.classList.remove('selected');
                         opt.style.background = '#38a169';
-                    }});
+                    });
                     
                     // Mark this as selected
                     optionDiv.classList.add('selected');
@@ -1128,38 +1171,39 @@ def create_multi_game_html(words_data):
                     
                     gameStates.classic.selectedAnswer = option;
                     document.getElementById('classic-submit-btn').disabled = false;
-                }};
+                };
                 
-                optionsArea.appendChild(optionDiv);
-            }});
-        }}
+                fragment.appendChild(optionDiv);
+            });
+            optionsArea.appendChild(fragment);
+        }
         
         // Helper function to extract context from sentences
-        function getContextClue(word) {{
-            if (!word.sentences || word.sentences.length === 0) {{
+        function getContextClue(word) {
+            if (!word.sentences || word.sentences.length === 0) {
                 // Fallback context based on synonyms/antonyms
-                if (word.synonyms.length > 0) {{
+                if (word.synonyms.length > 0) {
                     return 'situations involving ' + word.synonyms.slice(0, 2).join(' or ');
-                }}
+                }
                 return 'formal or literary contexts';
-            }}
+            }
             
             const sentence = word.sentences[0];
             // Try to extract meaningful context
-            if (sentence.includes('person') || sentence.includes('people')) {{
+            if (sentence.includes('person') || sentence.includes('people')) {
                 return 'describing people or personalities';
-            }} else if (sentence.includes('feeling') || sentence.includes('emotion')) {{
+            } else if (sentence.includes('feeling') || sentence.includes('emotion')) {
                 return 'emotions and feelings';
-            }} else if (sentence.includes('action') || sentence.includes('do')) {{
+            } else if (sentence.includes('action') || sentence.includes('do')) {
                 return 'actions and behaviors';
-            }} else if (sentence.includes('place') || sentence.includes('location')) {{
+            } else if (sentence.includes('place') || sentence.includes('location')) {
                 return 'places and locations';
-            }} else {{
+            } else {
                 return 'everyday situations';
-            }}
-        }}
+            }
+        }
         
-        function showClassicHint() {{
+        function showClassicHint() {
             const state = gameStates.classic;
             state.hintsUsed++;
             
@@ -1168,8 +1212,8 @@ def create_multi_game_html(words_data):
             
             // Generate multiple choice options 
             let multipleChoiceOptions = [];
-            if ((state.gameMode === 'word-to-meaning' && state.hintsUsed >= 3) || state.hintsUsed === 6) {{
-                if (state.gameMode === 'word-to-meaning') {{
+            if ((state.gameMode === 'word-to-meaning' && state.hintsUsed >= 3) || state.hintsUsed === 6) {
+                if (state.gameMode === 'word-to-meaning') {
                     const wrongMeanings = gameData
                         .filter(w => w.word !== state.currentWord.word && w.meaning.length > 10)
                         .sort(() => Math.random() - 0.5)
@@ -1177,7 +1221,7 @@ def create_multi_game_html(words_data):
                         .map(w => w.meaning);
                     
                     multipleChoiceOptions = [...wrongMeanings, state.currentWord.meaning].sort(() => Math.random() - 0.5);
-                }} else {{
+                } else {
                     const wrongOptions = gameData
                         .filter(w => w.word !== state.currentWord.word && w.word.length >= state.currentWord.word.length - 2 && w.word.length <= state.currentWord.word.length + 2)
                         .sort(() => Math.random() - 0.5)
@@ -1185,12 +1229,12 @@ def create_multi_game_html(words_data):
                         .map(w => w.word);
                     
                     multipleChoiceOptions = [...wrongOptions, state.currentWord.word].sort(() => Math.random() - 0.5);
-                }}
-            }}
+                }
+            }
             
             let hints = [];
             
-            if (state.gameMode === 'word-to-meaning') {{
+            if (state.gameMode === 'word-to-meaning') {
                 hints = [
                     '💡 Hint ' + state.hintsUsed + ': This word is often used when talking about ' + getContextClue(state.currentWord),
                     '💡 Hint ' + state.hintsUsed + ': It means something similar to: ' + state.currentWord.synonyms.slice(0, 2).join(' or '),
@@ -1199,7 +1243,7 @@ def create_multi_game_html(words_data):
                     '', // Skip hint 5
                     '🎯 Final Hint: Choose one of these options: ' + multipleChoiceOptions.join(' | ')
                 ];
-            }} else {{
+            } else {
                 hints = [
                     '💡 Hint ' + state.hintsUsed + ': The word has ' + state.currentWord.word.length + ' letters',
                     '💡 Hint ' + state.hintsUsed + ': It starts with "' + state.currentWord.word[0].toUpperCase() + '"',
@@ -1208,12 +1252,12 @@ def create_multi_game_html(words_data):
                     '💡 Hint ' + state.hintsUsed + ': ' + state.currentWord.origin.substring(0, 50) + '...',
                     '🎯 Final Hint: Choose one of these options: ' + multipleChoiceOptions.join(' | ')
                 ];
-            }}
+            }
             
-            if (state.hintsUsed <= hints.length) {{
+            if (state.hintsUsed <= hints.length) {
                 const shouldShowMultipleChoice = (state.gameMode === 'word-to-meaning' && state.hintsUsed >= 3) || state.hintsUsed === 6;
                 
-                if (shouldShowMultipleChoice && multipleChoiceOptions.length > 0) {{
+                if (shouldShowMultipleChoice && multipleChoiceOptions.length > 0) {
                     // Special styling for multiple choice hint
                     clue.className = 'clue multiple-choice-clue';
                     clue.innerHTML = (state.gameMode === 'word-to-meaning' && state.hintsUsed === 3) ? 
@@ -1224,189 +1268,190 @@ def create_multi_game_html(words_data):
                     const optionsDiv = document.createElement('div');
                     optionsDiv.className = 'choice-options';
                     
-                    multipleChoiceOptions.forEach(option => {{
+                    multipleChoiceOptions.forEach(option => {
                         const optionDiv = document.createElement('div');
                         optionDiv.className = 'choice-option';
                         optionDiv.textContent = option;
-                        optionDiv.onclick = function() {{
+                        optionDiv.onclick = function() {
                             const answerInput = document.getElementById('classic-answer-input');
                             answerInput.value = option;
                             answerInput.focus();
                             answerInput.dispatchEvent(new Event('input'));
                             document.querySelectorAll('.choice-option').forEach(opt => opt.classList.remove('selected'));
                             optionDiv.classList.add('selected');
-                        }};
+                        };
                         optionsDiv.appendChild(optionDiv);
-                    }});
+                    });
                     
                     clue.appendChild(optionsDiv);
                     
                     // For word-to-meaning mode, disable further hints after multiple choice appears
-                    if (state.gameMode === 'word-to-meaning' && state.hintsUsed >= 3) {{
+                    if (state.gameMode === 'word-to-meaning' && state.hintsUsed >= 3) {
                         document.getElementById('classic-hint-btn').disabled = true;
-                    }}
-                }} else if (hints[state.hintsUsed - 1] && hints[state.hintsUsed - 1] !== '') {{
+                    }
+                } else if (hints[state.hintsUsed - 1] && hints[state.hintsUsed - 1] !== '') {
                     clue.textContent = hints[state.hintsUsed - 1];
-                }} else {{
+                } else {
                     // Skip empty hints and try next one
-                    if (state.hintsUsed < 6) {{
+                    if (state.hintsUsed < 6) {
                         state.hintsUsed++;
                         showClassicHint();
                         return;
-                    }}
-                }}
+                    }
+                }
                 
                 document.getElementById('classic-clues-area').appendChild(clue);
                 clue.classList.add('bounce');
-            }}
+            }
             
-            if (state.hintsUsed >= 6) {{
+            if (state.hintsUsed >= 6) {
                 document.getElementById('classic-hint-btn').disabled = true;
-            }}
-        }}
+            }
+        }
         
-        function checkClassicAnswer() {{
+        function checkClassicAnswer() {
             const state = gameStates.classic;
             const userAnswer = state.selectedAnswer;
             
-            if (!userAnswer) {{
+            if (!userAnswer) {
                 alert('Please select an answer first!');
                 return;
-            }}
+            }
             
             const isCorrect = userAnswer === state.correctAnswer;
             
             state.totalQuestions++;
             
-            if (isCorrect) {{
+            if (isCorrect) {
                 state.correctAnswers++;
                 state.currentStreak++;
                 showClassicFeedback(true);
-            }} else {{
+            } else {
                 state.currentStreak = 0;
                 showClassicFeedback(false);
-            }}
+            }
             
             updateClassicScores();
             disableClassicInputs();
-        }}
+        }
         
-        function showClassicSpecialFeedback(type) {{
+        function showClassicSpecialFeedback(type) {
             const state = gameStates.classic;
             const feedback = document.createElement('div');
             feedback.className = 'feedback incorrect';
             
-            if (type === 'word-instead-of-meaning') {{
+            if (type === 'word-instead-of-meaning') {
                 feedback.innerHTML = '🤔 Close! You typed the word "' + state.currentWord.word + '" but I need its <strong>meaning</strong>!<br>💡 Try: "' + state.currentWord.meaning + '"';
-            }}
+            }
             
-            document.getElementById('classic-feedback-area').innerHTML = '';
-            document.getElementById('classic-feedback-area').appendChild(feedback);
+            document.getElementById('classic-feedback-area').replaceChildren(feedback);
             
-            setTimeout(() => {{
+            setTimeout(() => {
                 feedback.innerHTML += '<br><br>🎯 Try again! What does "' + state.currentWord.word + '" mean?';
-            }}, 2000);
-        }}
+            }, 2000);
+        }
         
-        function showClassicFeedback(correct) {{
+        function showClassicFeedback(correct) {
             const state = gameStates.classic;
             const feedback = document.createElement('div');
             feedback.className = 'feedback ' + (correct ? 'correct' : 'incorrect');
             
-            if (correct) {{
+            if (correct) {
                 const messages = ['🎉 Excellent!', '✨ Perfect!', '🚀 Amazing!', '🏆 Brilliant!', '⭐ Outstanding!'];
                 feedback.innerHTML = messages[Math.floor(Math.random() * messages.length)];
-            }} else {{
+            } else {
                 feedback.innerHTML = '❌ Not quite right. The correct answer was: <strong>' + state.correctAnswer + '</strong>';
-            }}
+            }
             
-            document.getElementById('classic-feedback-area').innerHTML = '';
-            document.getElementById('classic-feedback-area').appendChild(feedback);
+            document.getElementById('classic-feedback-area').replaceChildren(feedback);
             
-            setTimeout(() => {{
+            setTimeout(() => {
                 showClassicWordDetails();
-            }}, 1000);
-        }}
+            }, 1000);
+        }
         
-        function showClassicWordDetails() {{
+        function showClassicWordDetails() {
             const state = gameStates.classic;
             const details = document.createElement('div');
             details.className = 'answer-reveal';
             
-            let detailsHTML = '<h3>' + state.currentWord.word + '</h3><div class="word-details">';
-            detailsHTML += '<div class="detail-section"><span class="detail-title">Meaning:</span> ' + state.currentWord.meaning + '</div>';
+            // Collect the fragments and join them once
+            const word = state.currentWord;
+            const parts = ['<h3>', word.word, '</h3><div class="word-details">',
+                '<div class="detail-section"><span class="detail-title">Meaning:</span> ', word.meaning, '</div>'];
             
-            if (state.currentWord.synonyms.length) {{
-                detailsHTML += '<div class="detail-section"><span class="detail-title">Synonyms:</span><br>';
-                detailsHTML += state.currentWord.synonyms.map(syn => '<span class="synonym-tag">' + syn + '</span>').join('');
-                detailsHTML += '</div>';
-            }}
+            if (word.synonyms.length) {
+                parts.push('<div class="detail-section"><span class="detail-title">Synonyms:</span><br>');
+                for (const syn of word.synonyms) parts.push('<span class="synonym-tag">', syn, '</span>');
+                parts.push('</div>');
+            }
             
-            if (state.currentWord.antonyms.length) {{
-                detailsHTML += '<div class="detail-section"><span class="detail-title">Antonyms:</span><br>';
-                detailsHTML += state.currentWord.antonyms.map(ant => '<span class="antonym-tag">' + ant + '</span>').join('');
-                detailsHTML += '</div>';
-            }}
+            if (word.antonyms.length) {
+                parts.push('<div class="detail-section"><span class="detail-title">Antonyms:</span><br>');
+                for (const ant of word.antonyms) parts.push('<span class="antonym-tag">', ant, '</span>');
+                parts.push('</div>');
+            }
             
-            if (state.currentWord.sentences.length) {{
-                detailsHTML += '<div class="detail-section"><span class="detail-title">Example:</span>';
-                detailsHTML += '<div class="example-sentence">' + state.currentWord.sentences[0] + '</div></div>';
-            }}
+            const example = word.sentences[0];
+            if (example !== undefined) {
+                parts.push('<div class="detail-section"><span class="detail-title">Example:</span>',
+                    '<div class="example-sentence">', example, '</div></div>');
+            }
             
-            detailsHTML += '</div>';
-            details.innerHTML = detailsHTML;
+            parts.push('</div>');
+            details.innerHTML = parts.join('');
             document.getElementById('classic-feedback-area').appendChild(details);
-        }}
+        }
         
-        function skipClassicQuestion() {{
+        function skipClassicQuestion() {
             const state = gameStates.classic;
             state.totalQuestions++;
             state.currentStreak = 0;
             showClassicFeedback(false);
             updateClassicScores();
             disableClassicInputs();
-        }}
+        }
         
-        function disableClassicInputs() {{
+        function disableClassicInputs() {
             // Disable all choice options
-            document.querySelectorAll('#classic-clues-area .choice-option').forEach(opt => {{
+            document.querySelectorAll('#classic-clues-area .choice-option').forEach(opt => {
                 opt.style.pointerEvents = 'none';
                 opt.style.opacity = '0.7';
-            }});
+            });
             document.getElementById('classic-submit-btn').disabled = true;
             document.getElementById('classic-hint-btn').disabled = true;
             document.getElementById('classic-skip-btn').disabled = true;
-        }}
+        }
         
-        function updateClassicScores() {{
+        function updateClassicScores() {
             const state = gameStates.classic;
             document.getElementById('classic-correct').textContent = state.correctAnswers;
             document.getElementById('classic-total').textContent = state.totalQuestions;
             document.getElementById('classic-streak').textContent = state.currentStreak;
-        }}
+        }
         
         // Speed Mode Functions
-        function initializeSpeedMode() {{
+        function initializeSpeedMode() {
             document.getElementById('speed-start-btn').addEventListener('click', startSpeedChallenge);
             document.getElementById('speed-skip-btn').addEventListener('click', skipSpeedQuestion);
             
             // Add keyboard support for A, B, C, D keys
-            document.addEventListener('keydown', (e) => {{
+            document.addEventListener('keydown', (e) => {
                 if (!gameStates.speed.isActive || activeTab !== 'speed') return;
                 
                 const key = e.key.toUpperCase();
-                if (['A', 'B', 'C', 'D'].includes(key)) {{
+                if (['A', 'B', 'C', 'D'].includes(key)) {
                     const options = document.querySelectorAll('#speed-feedback-area .choice-option');
                     const index = key.charCodeAt(0) - 65; // A=0, B=1, C=2, D=3
-                    if (options[index]) {{
+                    if (options[index]) {
                         const answer = options[index].dataset.answer;
                         selectSpeedAnswer(answer);
-                    }}
-                }}
-            }});
-        }}
+                    }
+                }
+            });
+        }
         
-        function startSpeedChallenge() {{
+        function startSpeedChallenge() {
             const state = gameStates.speed;
             state.timeLeft = state.totalTime;
             state.correctAnswers = 0;
@@ -1420,18 +1465,18 @@ def create_multi_game_html(words_data):
             
             generateSpeedQuestion();
             
-            state.timer = setInterval(() => {{
+            state.timer = setInterval(() => {
                 state.timeLeft--;
                 document.getElementById('speed-timer').textContent = state.timeLeft;
                 document.getElementById('speed-progress').style.width = (state.timeLeft / state.totalTime * 100) + '%';
                 
-                if (state.timeLeft <= 0) {{
+                if (state.timeLeft <= 0) {
                     endSpeedChallenge();
-                }}
-            }}, 1000);
-        }}
+                }
+            }, 1000);
+        }
         
-        function generateSpeedQuestion() {{
+        function generateSpeedQuestion() {
             const state = gameStates.speed;
             if (!state.isActive) return;
             
@@ -1447,7 +1492,7 @@ def create_multi_game_html(words_data):
             let correctAnswer = '';
             
             const questionElement = document.getElementById('speed-question');
-            if (questionType === 'word-to-meaning') {{
+            if (questionType === 'word-to-meaning') {
                 // Show 4 meanings
                 const wrongMeanings = gameData
                     .filter(w => w.word !== currentWord.word && w.meaning.length > 10)
@@ -1457,7 +1502,7 @@ def create_multi_game_html(words_data):
                 options = [...wrongMeanings, currentWord.meaning].sort(() => Math.random() - 0.5);
                 correctAnswer = currentWord.meaning;
                 questionElement.innerHTML = '<strong>What does "' + currentWord.word + '" mean?</strong>';
-            }} else {{
+            } else {
                 // Show 4 words
                 const wrongWords = gameData
                     .filter(w => w.word !== currentWord.word)
@@ -1467,23 +1512,23 @@ def create_multi_game_html(words_data):
                 options = [...wrongWords, currentWord.word].sort(() => Math.random() - 0.5);
                 correctAnswer = currentWord.word;
                 questionElement.innerHTML = '<strong>Which word means:</strong><br>"' + currentWord.meaning + '"';
-            }}
+            }
             
             state.correctAnswer = correctAnswer;
             state.selectedAnswer = null;
             
             // Display options with letters A, B, C, D for speed
             displaySpeedOptions(options);
-        }}
+        }
         
-        function displaySpeedOptions(options) {{
+        function displaySpeedOptions(options) {
             const optionsArea = document.getElementById('speed-feedback-area');
             optionsArea.innerHTML = '';
             
             const optionsContainer = document.createElement('div');
             optionsContainer.style.cssText = 'display: flex; flex-direction: column; gap: 8px; margin: 15px 0;';
             
-            options.forEach((option, index) => {{
+            options.forEach((option, index) => {
                 const optionDiv = document.createElement('div');
                 optionDiv.className = 'choice-option';
                 optionDiv.style.cssText = `
@@ -1502,12 +1547,12 @@ def create_multi_game_html(words_data):
                 optionDiv.dataset.answer = option;
                 optionDiv.dataset.key = letter;
                 
-                optionDiv.onclick = function() {{
+                optionDiv.onclick = function() {
                     selectSpeedAnswer(option);
-                }};
+                };
                 
                 optionsContainer.appendChild(optionDiv);
-            }});
+            });
             
             optionsArea.appendChild(optionsContainer);
             
@@ -1516,64 +1561,63 @@ def create_multi_game_html(words_data):
             keyboardHint.style.cssText = 'text-align: center; color: #666; font-size: 0.8em; margin-top: 10px;';
             keyboardHint.textContent = 'Click or press A, B, C, D keys';
             optionsArea.appendChild(keyboardHint);
-        }}
+        }
         
-        function selectSpeedAnswer(answer) {{
+        function selectSpeedAnswer(answer) {
             const state = gameStates.speed;
             if (!state.isActive) return;
             
             state.selectedAnswer = answer;
             checkSpeedAnswer();
-        }}
+        }
         
-        function checkSpeedAnswer() {{
+        function checkSpeedAnswer() {
             const state = gameStates.speed;
             if (!state.isActive || !state.selectedAnswer) return;
             
             const isCorrect = state.selectedAnswer === state.correctAnswer;
             
             state.totalQuestions++;
-            if (isCorrect) {{
+            if (isCorrect) {
                 state.correctAnswers++;
                 showSpeedFeedback(true);
-            }} else {{
+            } else {
                 showSpeedFeedback(false);
-            }}
+            }
             
             updateSpeedScores();
             
-            setTimeout(() => {{
-                if (state.isActive) {{
+            setTimeout(() => {
+                if (state.isActive) {
                     generateSpeedQuestion();
-                }}
-            }}, 800);
-        }}
+                }
+            }, 800);
+        }
         
-        function skipSpeedQuestion() {{
+        function skipSpeedQuestion() {
             const state = gameStates.speed;
             if (!state.isActive) return;
             
             state.totalQuestions++;
             generateSpeedQuestion();
-        }}
+        }
         
-        function showSpeedFeedback(correct) {{
+        function showSpeedFeedback(correct) {
             const feedback = document.createElement('div');
             feedback.className = 'feedback ' + (correct ? 'correct' : 'incorrect');
             feedback.style.padding = '10px';
             feedback.style.margin = '10px 0';
             
-            if (correct) {{
+            if (correct) {
                 feedback.innerHTML = '✅ Correct!';
-            }} else {{
+            } else {
                 feedback.innerHTML = '❌ Wrong';
-            }}
+            }
             
-            document.getElementById('speed-feedback-area').innerHTML = '';
-            document.getElementById('speed-feedback-area').appendChild(feedback);
-        }}
+            document.getElementById('speed-feedback-area').replaceChildren(feedback);
+        }
         
-        function updateSpeedScores() {{
+        function updateSpeedScores() {
             const state = gameStates.speed;
             document.getElementById('speed-correct').textContent = state.correctAnswers;
             document.getElementById('speed-total').textContent = state.totalQuestions;
@@ -1582,9 +1626,9 @@ def create_multi_game_html(words_data):
             const elapsedMinutes = (Date.now() - state.startTime) / 1000 / 60;
             const wpm = Math.round(state.correctAnswers / Math.max(elapsedMinutes, 0.1));
             document.getElementById('speed-wpm').textContent = wpm;
-        }}
+        }
         
-        function endSpeedChallenge() {{
+        function endSpeedChallenge() {
             const state = gameStates.speed;
             state.isActive = false;
             clearInterval(state.timer);
@@ -1602,17 +1646,16 @@ def create_multi_game_html(words_data):
                 '<p><strong>Speed:</strong> ' + document.getElementById('speed-wpm').textContent + ' WPM</p>' +
                 '<p>Great job! Click "Start Speed Challenge" to try again.</p>';
             
-            document.getElementById('speed-feedback-area').innerHTML = '';
-            document.getElementById('speed-feedback-area').appendChild(feedback);
-        }}
+            document.getElementById('speed-feedback-area').replaceChildren(feedback);
+        }
         
         // Quiz Mode Functions
-        function initializeQuizMode() {{
+        function initializeQuizMode() {
             document.getElementById('quiz-start-btn').addEventListener('click', startQuiz);
             document.getElementById('quiz-next-btn').addEventListener('click', nextQuizQuestion);
-        }}
+        }
         
-        function startQuiz() {{
+        function startQuiz() {
             const state = gameStates.quiz;
             state.currentQuestion = 0;
             state.correctAnswers = 0;
@@ -1622,7 +1665,7 @@ def create_multi_game_html(words_data):
             // Generate 10 random questions
             const shuffledWords = [...gameData].sort(() => Math.random() - 0.5).slice(0, 10);
             
-            shuffledWords.forEach(word => {{
+            shuffledWords.forEach(word => {
                 // Create multiple choice options
                 const wrongOptions = gameData
                     .filter(w => w.word !== word.word)
@@ -1632,22 +1675,22 @@ def create_multi_game_html(words_data):
                 
                 const options = [...wrongOptions, word.meaning].sort(() => Math.random() - 0.5);
                 
-                state.questions.push({{
+                state.questions.push({
                     word: word.word,
                     correctMeaning: word.meaning,
                     options: options,
                     userAnswer: null,
                     isCorrect: false
-                }});
-            }});
+                });
+            });
             
             document.getElementById('quiz-start-btn').style.display = 'none';
             document.getElementById('quiz-next-btn').disabled = false;
             
             showQuizQuestion();
-        }}
+        }
         
-        function showQuizQuestion() {{
+        function showQuizQuestion() {
             const state = gameStates.quiz;
             const question = state.questions[state.currentQuestion];
             
@@ -1656,20 +1699,21 @@ def create_multi_game_html(words_data):
                 'What does "' + question.word + '" mean?';
             
             // Create options
+            // Built off-DOM and swapped in with one insertion
             const optionsArea = document.getElementById('quiz-options-area');
-            optionsArea.innerHTML = '';
+            const fragment = document.createDocumentFragment();
             
-            question.options.forEach((option, index) => {{
+            question.options.forEach((option, index) => {
                 const optionDiv = document.createElement('div');
                 optionDiv.className = 'choice-option';
                 optionDiv.style.margin = '10px 0';
                 optionDiv.textContent = (index + 1) + '. ' + option;
-                optionDiv.onclick = function() {{
+                optionDiv.onclick = function() {
                     // Clear previous selections
-                    document.querySelectorAll('#quiz-options-area .choice-option').forEach(opt => {{
+                    document.querySelectorAll('#quiz-options-area .choice-option').forEach(opt => {
                         opt.classList.remove('selected');
                         opt.style.background = '#38a169';
-                    }});
+                    });
                     
                     // Mark this as selected
                     optionDiv.classList.add('selected');
@@ -1679,59 +1723,59 @@ def create_multi_game_html(words_data):
                     question.isCorrect = option === question.correctMeaning;
                     
                     // Show immediate feedback
-                    setTimeout(() => {{
+                    setTimeout(() => {
                         showQuizFeedback(question.isCorrect, question.correctMeaning);
-                    }}, 500);
-                }};
-                optionsArea.appendChild(optionDiv);
-            }});
+                    }, 500);
+                };
+                fragment.appendChild(optionDiv);
+            });
+            optionsArea.replaceChildren(fragment);
             
             // Update progress
             const progress = ((state.currentQuestion) / state.totalQuestions * 100);
             document.getElementById('quiz-progress-bar').style.width = progress + '%';
             document.getElementById('quiz-progress').textContent = (state.currentQuestion + 1) + '/10';
-        }}
+        }
         
-        function showQuizFeedback(correct, correctAnswer) {{
+        function showQuizFeedback(correct, correctAnswer) {
             const feedback = document.createElement('div');
             feedback.className = 'feedback ' + (correct ? 'correct' : 'incorrect');
             feedback.style.margin = '20px 0';
             
-            if (correct) {{
+            if (correct) {
                 feedback.innerHTML = '✅ Correct! Well done!';
-            }} else {{
+            } else {
                 feedback.innerHTML = '❌ Incorrect. The correct answer was:<br><strong>' + correctAnswer + '</strong>';
-            }}
+            }
             
-            document.getElementById('quiz-feedback-area').innerHTML = '';
-            document.getElementById('quiz-feedback-area').appendChild(feedback);
+            document.getElementById('quiz-feedback-area').replaceChildren(feedback);
             
             // Disable options after answering
-            document.querySelectorAll('#quiz-options-area .choice-option').forEach(opt => {{
+            document.querySelectorAll('#quiz-options-area .choice-option').forEach(opt => {
                 opt.style.pointerEvents = 'none';
                 opt.style.opacity = '0.7';
-            }});
-        }}
+            });
+        }
         
-        function nextQuizQuestion() {{
+        function nextQuizQuestion() {
             const state = gameStates.quiz;
             
             // Count correct answer if applicable
-            if (state.questions[state.currentQuestion] && state.questions[state.currentQuestion].isCorrect) {{
+            if (state.questions[state.currentQuestion] && state.questions[state.currentQuestion].isCorrect) {
                 state.correctAnswers++;
-            }}
+            }
             
             state.currentQuestion++;
             
-            if (state.currentQuestion >= state.totalQuestions) {{
+            if (state.currentQuestion >= state.totalQuestions) {
                 endQuiz();
-            }} else {{
+            } else {
                 document.getElementById('quiz-feedback-area').innerHTML = '';
                 showQuizQuestion();
-            }}
-        }}
+            }
+        }
         
-        function endQuiz() {{
+        function endQuiz() {
             const state = gameStates.quiz;
             const score = Math.round((state.correctAnswers / state.totalQuestions) * 100);
             
@@ -1755,20 +1799,19 @@ def create_multi_game_html(words_data):
             
             document.getElementById('quiz-question').innerHTML = 'Quiz Completed!';
             document.getElementById('quiz-options-area').innerHTML = '';
-            document.getElementById('quiz-feedback-area').innerHTML = '';
-            document.getElementById('quiz-feedback-area').appendChild(feedback);
+            document.getElementById('quiz-feedback-area').replaceChildren(feedback);
             
             document.getElementById('quiz-start-btn').style.display = 'inline-block';
             document.getElementById('quiz-next-btn').disabled = true;
-        }}
+        }
         
         // Memory Game Functions
-        function initializeMemoryMode() {{
+        function initializeMemoryMode() {
             document.getElementById('memory-start-btn').addEventListener('click', startMemoryGame);
             document.getElementById('memory-shuffle-btn').addEventListener('click', shuffleMemoryCards);
-        }}
+        }
         
-        function startMemoryGame() {{
+        function startMemoryGame() {
             const state = gameStates.memory;
             state.cards = [];
             state.flippedCards = [];
@@ -1781,25 +1824,25 @@ def create_multi_game_html(words_data):
             const selectedWords = gameData.sort(() => Math.random() - 0.5).slice(0, 8);
             
             // Create card pairs (word and meaning)
-            selectedWords.forEach(word => {{
-                state.cards.push({{
+            selectedWords.forEach(word => {
+                state.cards.push({
                     id: 'word-' + word.word,
                     type: 'word',
                     content: word.word,
                     pair: word.word,
                     isFlipped: false,
                     isMatched: false
-                }});
+                });
                 
-                state.cards.push({{
+                state.cards.push({
                     id: 'meaning-' + word.word,
                     type: 'meaning',
                     content: word.meaning.length > 50 ? word.meaning.substring(0, 50) + '...' : word.meaning,
                     pair: word.word,
                     isFlipped: false,
                     isMatched: false
-                }});
-            }});
+                });
+            });
             
             // Shuffle cards
             state.cards = state.cards.sort(() => Math.random() - 0.5);
@@ -1811,14 +1854,15 @@ def create_multi_game_html(words_data):
             
             // Start timer
             state.timer = setInterval(updateMemoryTimer, 1000);
-        }}
+        }
         
-        function renderMemoryGrid() {{
+        function renderMemoryGrid() {
             const state = gameStates.memory;
+            // Built off-DOM and swapped in with one insertion
             const grid = document.getElementById('memory-grid');
-            grid.innerHTML = '';
+            const fragment = document.createDocumentFragment();
             
-            state.cards.forEach((card, index) => {{
+            state.cards.forEach((card, index) => {
                 const cardElement = document.createElement('div');
                 cardElement.className = 'memory-card';
                 let cardBg = '#667eea';
@@ -1826,15 +1870,15 @@ def create_multi_game_html(words_data):
                 let cardCursor = 'pointer';
                 let cardBorder = 'transparent';
                 
-                if (card.isMatched) {{
+                if (card.isMatched) {
                     cardBg = '#c6f6d5';
                     cardColor = '#22543d';
                     cardCursor = 'default';
                     cardBorder = '#38a169';
-                }} else if (card.isFlipped) {{
+                } else if (card.isFlipped) {
                     cardBg = '#bee3f8';
                     cardColor = '#2a4365';
-                }}
+                }
                 
                 cardElement.style.cssText = 
                     'background: ' + cardBg + ';' +
@@ -1851,47 +1895,48 @@ def create_multi_game_html(words_data):
                     'border: 2px solid ' + cardBorder + ';' +
                     'transition: all 0.3s ease;';
                 
-                if (card.isFlipped || card.isMatched) {{
+                if (card.isFlipped || card.isMatched) {
                     cardElement.textContent = card.content;
-                }} else {{
+                } else {
                     cardElement.innerHTML = '<strong>?</strong>';
-                }}
+                }
                 
                 cardElement.onclick = () => flipMemoryCard(index);
-                grid.appendChild(cardElement);
-            }});
-        }}
+                fragment.appendChild(cardElement);
+            });
+            grid.replaceChildren(fragment);
+        }
         
-        function flipMemoryCard(index) {{
+        function flipMemoryCard(index) {
             const state = gameStates.memory;
             const card = state.cards[index];
             
-            if (!state.isActive || card.isFlipped || card.isMatched || state.flippedCards.length >= 2) {{
+            if (!state.isActive || card.isFlipped || card.isMatched || state.flippedCards.length >= 2) {
                 return;
-            }}
+            }
             
             card.isFlipped = true;
             state.flippedCards.push(index);
             
             renderMemoryGrid();
             
-            if (state.flippedCards.length === 2) {{
+            if (state.flippedCards.length === 2) {
                 state.attempts++;
                 updateMemoryScores();
                 
-                setTimeout(() => {{
+                setTimeout(() => {
                     checkMemoryMatch();
-                }}, 1000);
-            }}
-        }}
+                }, 1000);
+            }
+        }
         
-        function checkMemoryMatch() {{
+        function checkMemoryMatch() {
             const state = gameStates.memory;
             const [index1, index2] = state.flippedCards;
             const card1 = state.cards[index1];
             const card2 = state.cards[index2];
             
-            if (card1.pair === card2.pair) {{
+            if (card1.pair === card2.pair) {
                 // Match found!
                 card1.isMatched = true;
                 card2.isMatched = true;
@@ -1899,61 +1944,60 @@ def create_multi_game_html(words_data):
                 
                 showMemoryFeedback(true, card1.pair);
                 
-                if (state.matchedPairs === 8) {{
+                if (state.matchedPairs === 8) {
                     endMemoryGame();
-                }}
-            }} else {{
+                }
+            } else {
                 // No match
                 card1.isFlipped = false;
                 card2.isFlipped = false;
                 showMemoryFeedback(false);
-            }}
+            }
             
             state.flippedCards = [];
             renderMemoryGrid();
-        }}
+        }
         
-        function showMemoryFeedback(match, word = '') {{
+        function showMemoryFeedback(match, word = '') {
             const feedback = document.createElement('div');
             feedback.className = 'feedback ' + (match ? 'correct' : 'incorrect');
             feedback.style.padding = '10px';
             feedback.style.margin = '10px 0';
             
-            if (match) {{
+            if (match) {
                 feedback.innerHTML = '✅ Match found: ' + word + '!';
-            }} else {{
+            } else {
                 feedback.innerHTML = '❌ No match. Try again!';
-            }}
+            }
             
-            document.getElementById('memory-feedback-area').innerHTML = '';
-            document.getElementById('memory-feedback-area').appendChild(feedback);
+            document.getElementById('memory-feedback-area').replaceChildren(feedback);
             
-            setTimeout(() => {{
+            setTimeout(() => {
                 document.getElementById('memory-feedback-area').innerHTML = '';
-            }}, 2000);
-        }}
+            }, 2000);
+        }
         
-        function updateMemoryTimer() {{
+        function updateMemoryTimer() {
             const state = gameStates.memory;
             if (!state.isActive) return;
             
             const elapsed = Math.floor((Date.now() - state.startTime) / 1000);
             document.getElementById('memory-time').textContent = elapsed + 's';
-        }}
+        }
         
-        function updateMemoryScores() {{
+        function updateMemoryScores() {
             const state = gameStates.memory;
             document.getElementById('memory-matches').textContent = state.matchedPairs;
             document.getElementById('memory-attempts').textContent = state.attempts;
-        }}
+        }
         
-        function shuffleMemoryCards() {{
+        function shuffleMemoryCards() {
             const state = gameStates.memory;
             state.cards = state.cards.sort(() => Math.random() - 0.5);
             renderMemoryGrid();
-        }}
+        }
         
-        function endMemoryGame() {{
+        function endMemoryGame() {
             const state = gameStates.memory;
             state.isActive = false;
             clearInterval(state.timer);
@@ -1970,20 +2014,19 @@ def create_multi_game_html(words_data):
                 '<p><strong>Efficiency:</strong> ' + efficiency + '%</p>' +
                 '<p>' + (efficiency >= 80 ? 'Perfect memory! 🧠' : efficiency >= 60 ? 'Great job! 👍' : 'Good effort! Keep practicing! 💪') + '</p>';
             
-            document.getElementById('memory-feedback-area').innerHTML = '';
-            document.getElementById('memory-feedback-area').appendChild(feedback);
+            document.getElementById('memory-feedback-area').replaceChildren(feedback);
             
             document.getElementById('memory-start-btn').disabled = false;
             document.getElementById('memory-shuffle-btn').disabled = true;
-        }}
+        }
         
         // Word Battle Functions
-        function initializeBattleMode() {{
+        function initializeBattleMode() {
             document.getElementById('battle-start-btn').addEventListener('click', startWordBattle);
             document.getElementById('battle-surrender-btn').addEventListener('click', endWordBattle);
-        }}
+        }
         
-        function startWordBattle() {{
+        function startWordBattle() {
             const state = gameStates.battle;
             state.level = 1;
             state.lives = 3;
@@ -1999,21 +2042,21 @@ def create_multi_game_html(words_data):
             updateBattleUI();
             generateBattleQuestion();
             startBattleTimer();
-        }}
+        }
         
-        function generateBattleQuestion() {{
+        function generateBattleQuestion() {
             const state = gameStates.battle;
             if (!state.isActive) return;
             
             // Filter words by level difficulty
             let filteredWords = gameData;
-            if (state.level <= 3) {{
+            if (state.level <= 3) {
                 filteredWords = gameData.filter(w => w.word.length <= 7);
-            }} else if (state.level <= 6) {{
+            } else if (state.level <= 6) {
                 filteredWords = gameData.filter(w => w.word.length <= 10);
-            }} else {{
+            } else {
                 filteredWords = gameData.filter(w => w.word.length > 8);
-            }}
+            }
             
             state.currentWord = filteredWords[Math.floor(Math.random() * filteredWords.length)];
             
@@ -2026,7 +2069,7 @@ def create_multi_game_html(words_data):
             let correctAnswer = '';
             
             const questionElement = document.getElementById('battle-question');
-            if (questionType === 'word-to-meaning') {{
+            if (questionType === 'word-to-meaning') {
                 // Show 4 meanings
                 const wrongMeanings = gameData
                     .filter(w => w.word !== state.currentWord.word && w.meaning.length > 10)
@@ -2036,7 +2079,7 @@ def create_multi_game_html(words_data):
                 options = [...wrongMeanings, state.currentWord.meaning].sort(() => Math.random() - 0.5);
                 correctAnswer = state.currentWord.meaning;
                 questionElement.innerHTML = '<strong>Level ' + state.level + ':</strong><br>What does "' + state.currentWord.word + '" mean?';
-            }} else {{
+            } else {
                 // Show 4 words
                 const wrongWords = gameData
                     .filter(w => w.word !== state.currentWord.word)
@@ -2046,7 +2089,7 @@ def create_multi_game_html(words_data):
                 options = [...wrongWords, state.currentWord.word].sort(() => Math.random() - 0.5);
                 correctAnswer = state.currentWord.word;
                 questionElement.innerHTML = '<strong>Level ' + state.level + ':</strong><br>Which word means: "' + state.currentWord.meaning + '"?';
-            }}
+            }
             
             state.correctAnswer = correctAnswer;
             state.selectedAnswer = null;
@@ -2057,16 +2100,16 @@ def create_multi_game_html(words_data):
             // Adjust timer based on level
             state.timeLeft = Math.max(8 - Math.floor(state.level / 3), 5);
             updateBattleUI();
-        }}
+        }
         
-        function displayBattleOptions(options) {{
+        function displayBattleOptions(options) {
             const optionsArea = document.getElementById('battle-feedback-area');
             optionsArea.innerHTML = '';
             
             const optionsContainer = document.createElement('div');
             optionsContainer.style.cssText = 'display: grid; grid-template-columns: 1fr 1fr; gap: 10px; margin: 15px 0;';
             
-            options.forEach((option, index) => {{
+            options.forEach((option, index) => {
                 const optionDiv = document.createElement('div');
                 optionDiv.className = 'choice-option';
                 optionDiv.style.cssText = `
@@ -2085,107 +2128,106 @@ def create_multi_game_html(words_data):
                 optionDiv.innerHTML = '<strong>' + letter + '</strong><br>' + (option.length > 40 ? option.substring(0, 40) + '...' : option);
                 optionDiv.dataset.answer = option;
                 
-                optionDiv.onclick = function() {{
+                optionDiv.onclick = function() {
                     if (!gameStates.battle.isActive) return;
                     
                     // Visual feedback
-                    document.querySelectorAll('#battle-feedback-area .choice-option').forEach(opt => {{
+                    document.querySelectorAll('#battle-feedback-area .choice-option').forEach(opt => {
                         opt.style.background = '#667eea';
                         opt.style.border = '2px solid transparent';
-                    }});
+                    });
                     optionDiv.style.background = '#5a67d8';
                     optionDiv.style.border = '2px solid #4c51bf';
                     
                     gameStates.battle.selectedAnswer = option;
                     
                     // Auto-submit after selection
-                    setTimeout(() => {{
+                    setTimeout(() => {
                         checkBattleAnswer();
-                    }}, 300);
-                }};
+                    }, 300);
+                };
                 
                 optionsContainer.appendChild(optionDiv);
-            }});
+            });
             
             optionsArea.appendChild(optionsContainer);
-        }}
+        }
         
-        function startBattleTimer() {{
+        function startBattleTimer() {
             const state = gameStates.battle;
             
-            state.timer = setInterval(() => {{
+            state.timer = setInterval(() => {
                 state.timeLeft--;
                 updateBattleUI();
                 
-                if (state.timeLeft <= 0) {{
+                if (state.timeLeft <= 0) {
                     // Time's up - lose a life
                     loseLife();
-                }}
-            }}, 1000);
-        }}
+                }
+            }, 1000);
+        }
         
-        function checkBattleAnswer() {{
+        function checkBattleAnswer() {
             const state = gameStates.battle;
             if (!state.isActive || !state.selectedAnswer) return;
             
             const isCorrect = state.selectedAnswer === state.correctAnswer;
             
-            if (isCorrect) {{
+            if (isCorrect) {
                 // Correct answer
                 state.score += state.level * 10;
                 state.level++;
                 showBattleFeedback(true);
                 
-                setTimeout(() => {{
-                    if (state.isActive) {{
+                setTimeout(() => {
+                    if (state.isActive) {
                         generateBattleQuestion();
                         startBattleTimer();
-                    }}
-                }}, 1000);
-            }} else {{
+                    }
+                }, 1000);
+            } else {
                 // Wrong answer
                 loseLife();
-            }}
+            }
             
             clearInterval(state.timer);
-        }}
+        }
         
-        function loseLife() {{
+        function loseLife() {
             const state = gameStates.battle;
             state.lives--;
             
             showBattleFeedback(false);
             
-            if (state.lives <= 0) {{
+            if (state.lives <= 0) {
                 endWordBattle();
-            }} else {{
-                setTimeout(() => {{
-                    if (state.isActive) {{
+            } else {
+                setTimeout(() => {
+                    if (state.isActive) {
                         generateBattleQuestion();
                         startBattleTimer();
-                    }}
-                }}, 1500);
-            }}
-        }}
+                    }
+                }, 1500);
+            }
+        }
         
-        function showBattleFeedback(correct) {{
+        function showBattleFeedback(correct) {
             const feedback = document.createElement('div');
             feedback.className = 'feedback ' + (correct ? 'correct' : 'incorrect');
             feedback.style.padding = '10px';
             feedback.style.margin = '10px 0';
             
-            if (correct) {{
+            if (correct) {
                 feedback.innerHTML = '✅ Correct! +' + (gameStates.battle.level * 10) + ' points!';
-            }} else {{
+            } else {
                 feedback.innerHTML = '❌ Wrong! The answer was: ' + 
                     (gameStates.battle.questionType === 'word-to-meaning' ? gameStates.battle.currentWord.meaning : gameStates.battle.currentWord.word);
-            }}
+            }
             
-            document.getElementById('battle-feedback-area').innerHTML = '';
-            document.getElementById('battle-feedback-area').appendChild(feedback);
-        }}
+            document.getElementById('battle-feedback-area').replaceChildren(feedback);
+        }
         
-        function updateBattleUI() {{
+        function updateBattleUI() {
             const state = gameStates.battle;
             document.getElementById('battle-level').textContent = state.level;
             document.getElementById('battle-lives').textContent = '❤️'.repeat(state.lives);
@@ -2194,16 +2236,16 @@ def create_multi_game_html(words_data):
             
             // Change timer color based on urgency
             const timerElement = document.getElementById('battle-timer');
-            if (state.timeLeft <= 3) {{
+            if (state.timeLeft <= 3) {
                 timerElement.style.color = '#e53e3e';
-            }} else if (state.timeLeft <= 5) {{
+            } else if (state.timeLeft <= 5) {
                 timerElement.style.color = '#ed8936';
-            }} else {{
+            } else {
                 timerElement.style.color = '#48bb78';
-            }}
-        }}
+            }
+        }
         
-        function endWordBattle() {{
+        function endWordBattle() {
             const state = gameStates.battle;
             state.isActive = false;
             clearInterval(state.timer);
@@ -2228,14 +2270,45 @@ def create_multi_game_html(words_data):
                 '<p>' + (state.score >= 300 ? 'Legendary warrior! 🏆' : state.score >= 100 ? 'Brave fighter! ⚔️' : 'Keep training, warrior! 💪') + '</p>';
             
             document.getElementById('battle-question').innerHTML = 'Battle Complete!';
-            document.getElementById('battle-feedback-area').innerHTML = '';
-            document.getElementById('battle-feedback-area').appendChild(feedback);
-        }}
+            document.getElementById('battle-feedback-area').replaceChildren(feedback);
+        }
     </script>
 </body>
 </html>"""
+
+def minify_template(text):
+    """Drop the template's indentation, trailing spaces and blank lines; line breaks are kept for the JavaScript."""
+    return '\n'.join(line for line in map(str.strip, text.split('\n')) if line)
+
+# Split once at the marker so the page can be emitted as head, data and tail,
+# each minified once at load
+_MULTI_GAME_HEAD, _MULTI_GAME_TAIL = map(minify_template, _MULTI_GAME_TEMPLATE.split('__GAME_DATA__'))
+
+def build_game_data(words_data):
+    """Game data as parallel columns, one list per field, for every word that has a meaning; the page rebuilds the per-word objects."""
+    playable = [word_data for word_data in words_data if word_data['word'] and word_data['meaning']]
     
-    return html_content
+    return {
+        'word': [word_data['word'] for word_data in playable],
+        'meaning': [word_data['meaning'] for word_data in playable],
+        'synonyms': [word_data['synonyms'][:5] for word_data in playable],
+        'antonyms': [word_data['antonyms'][:5] for word_data in playable],
+        'sentences': [word_data['sentences'][:3] for word_data in playable],
+        'origin': [word_data['origin'] for word_data in playable],
+        'clues': [generate_funny_clues(word_data) for word_data in playable],
+        # Simple difficulty metric
+        'difficulty': [len(word_data['word']) + len(word_data['synonyms']) for word_data in playable]
+    }
+
+def iter_multi_game_html(words_data):
+    """Yield the multi-tab game HTML in sections, so it can be written without joining it first."""
+    yield _MULTI_GAME_HEAD
+    yield dump_game_data(build_game_data(words_data))
+    yield _MULTI_GAME_TAIL
+
+def create_multi_game_html(words_data):
+    """Create the multi-tab game HTML."""
+    return "".join(iter_multi_game_html(words_data))
 
 def main():
     """Main function to generate the multi-game interface."""
@@ -2248,36 +2321,39 @@ def main():
     
     print("🎮 Generating Word Games Collection...")
     
-    # Read and parse the input file
-    with open(input_file, 'r', encoding='utf-8') as f:
-        content = f.read()
+    # Read the input file one entry at a time; only a "Word: " line gives an entry
+    # its word, so anything without one is skipped unparsed
+    try:
+        entries = [entry for entry in iter_entries(input_file) if 'Word: ' in entry]
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"❌ Error reading '{input_file}': {e}")
+        return
+    print(f"Processing {len(entries)} entries...")
     
-    entries = re.split(r'\n-{25,}\n', content)
+    if len(entries) >= PARALLEL_MIN_ENTRIES:
+        with ProcessPoolExecutor() as executor:
+            parsed = list(executor.map(parse_word_entry, entries, chunksize=PARSE_CHUNK_SIZE))
+    else:
+        parsed = list(map(parse_word_entry, entries))
+    del entries  # The raw text is not needed once every entry is parsed
     
-    words_data = []
-    print(f"Processing {len(entries)} entries...")
+    words_data = [word_data for word_data in parsed if word_data is not None]
     
-    for i, entry in enumerate(entries):
-        if entry.strip():
-            try:
-                word_data = parse_word_entry(entry)
-                if word_data['word'] and word_data['meaning']:
-                    words_data.append(word_data)
-            except Exception as e:
-                print(f"Error processing entry {i}: {e}")
-                continue
+    if len(words_data) < len(parsed):
+        print(f"Skipped {len(parsed) - len(words_data)} entries without a word and meaning")
     
     print(f"Successfully processed {len(words_data)} words")
     
-    # Generate the multi-game HTML
-    html_content = create_multi_game_html(words_data)
-    
-    # Write the HTML file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # Generate the multi-game HTML straight into the output file and its gzipped copy
+    compressed_file = output_file + ".gz"
+    with open(output_file, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f, \
+         gzip.open(compressed_file, 'wt', encoding='utf-8', compresslevel=GZIP_LEVEL) as gz:
+        for section in iter_multi_game_html(words_data):
+            f.write(section)
+            gz.write(section)
     
     print(f"✅ Word Games Collection created!")
-    print(f"📁 Output file: {output_file}")
+    print(f"📁 Output file: {output_file} (gzipped: {compressed_file})")
     print(f"🎮 Open the file in your browser to play!")
     print(f"🎯 Features:")
     print(f"   📚 Classic Mode - Original word master with hints")
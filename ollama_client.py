@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Shared Ollama HTTP client for the asyncio enrichers
+Uses aiohttp when installed (pip install aiohttp); otherwise stdlib http.client in worker threads
+"""
+
+import json
+import asyncio
+import http.client
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+try:
+    import orjson  # Optional: faster JSON encode/decode
+except ImportError:
+    orjson = None
+
+try:
+    import aiohttp  # Optional: native async HTTP, no thread per in-flight request
+except ImportError:
+    aiohttp = None
+
+# What a pooled keep-alive connection raises when the server has closed it in the meantime
+_STALE_CONNECTION_ERRORS = (ConnectionError, http.client.HTTPException)
+
+def dumps(payload: Dict) -> bytes:
+    """Encode a request body, using orjson when available."""
+    return orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode('utf-8')
+
+def loads(data: bytes) -> Dict:
+    """Decode a response body, using orjson when available."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+class OllamaClient:
+    """Pooled keep-alive connections to Ollama, at most max_requests requests in flight.
+
+    With aiohttp every request is a coroutine on the caller's event loop and the connector
+    limit is the concurrency cap. Without it, requests run on http.client connections in a
+    thread pool of max_requests threads.
+    """
+
+    def __init__(self, host: str, port: int, max_requests: int, timeout: float):
+        self.host = host
+        self.port = port
+        self.max_requests = max_requests
+        self.timeout = timeout
+        self.session = None  # aiohttp session, created on the loop that first uses it
+        self.session_loop = None
+        self.idle = []       # Keep-alive http.client connections not currently in use
+        self.executor = None if aiohttp is not None else \
+            ThreadPoolExecutor(max_workers=max_requests, thread_name_prefix="ollama")
+
+    def get_session(self) -> "aiohttp.ClientSession":
+        """The aiohttp session bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self.session is None or self.session.closed or self.session_loop is not loop:
+            self.session_loop = loop
+            self.session = aiohttp.ClientSession(
+                base_url=f"http://{self.host}:{self.port}",
+                connector=aiohttp.TCPConnector(limit=self.max_requests),
+                headers={"Content-Type": "application/json"})
+        return self.session
+
+    async def post_async(self, path: str, body: bytes, timeout: float) -> Dict:
+        """POST on the aiohttp session, retrying once if a reused connection turns out to be closed."""
+        session = self.get_session()
+        for attempt in range(2):
+            try:
+                async with session.post(path, data=body, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                    data = await response.read()
+                break
+            except aiohttp.ServerDisconnectedError as e:
+                if attempt:
+                    raise
+                print(f"⚠️  Reused Ollama connection failed ({e!r}); retrying on a new connection")
+
+        if response.status != 200:
+            raise RuntimeError(f"Ollama returned HTTP {response.status}: {data[:200]!r}")
+        return loads(data)
+
+    def send(self, conn: http.client.HTTPConnection, path: str, body: bytes, timeout: float) -> Dict:
+        """Send one request on conn and parse the JSON reply, returning conn to the pool if it stays open."""
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        try:
+            conn.request("POST", path, body=body, headers={"Content-Type": "application/json"})
+            response = conn.getresponse()
+            data = response.read()
+        except BaseException:
+            conn.close()
+            raise
+
+        if response.will_close:
+            conn.close()
+        else:
+            self.idle.append(conn)
+
+        if response.status != 200:
+            raise RuntimeError(f"Ollama returned HTTP {response.status}: {data[:200]!r}")
+        return loads(data)
+
+    def post_blocking(self, path: str, body: bytes, timeout: float) -> Dict:
+        """POST on a pooled http.client connection, retrying once on a fresh one if it turns out to be closed."""
+        try:
+            conn = self.idle.pop()
+        except IndexError:
+            conn = None
+        if conn is not None:
+            try:
+                return self.send(conn, path, body, timeout)
+            except _STALE_CONNECTION_ERRORS as e:
+                print(f"⚠️  Reused Ollama connection failed ({e!r}); retrying on a new connection")
+
+        return self.send(http.client.HTTPConnection(self.host, self.port, timeout=timeout), path, body, timeout)
+
+    async def post(self, path: str, payload: Dict, timeout: Optional[float] = None) -> Dict:
+        """POST a JSON payload to Ollama without blocking the event loop."""
+        body = dumps(payload)
+        timeout = timeout or self.timeout
+        if aiohttp is not None:
+            return await self.post_async(path, body, timeout)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.post_blocking, path, body, timeout)
+
+    async def close(self):
+        """Close the session and any idle keep-alive connections."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+        while self.idle:
+            self.idle.pop().close()
@@ -9,16 +9,71 @@ import subprocess
 import sys
 import json
 import os
-from typing import Tuple, Optional, List
+import hashlib
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from typing import Iterable, Tuple, Optional, List
+
+try:
+    import orjson  # Optional: faster JSON encode/decode
+except ImportError:
+    orjson = None
 
 # Configuration
 PROGRESS_FILE = "enrichment_progress.json"
 INPUT_FILE = "grewordlist.txt"
 OUTPUT_FILE = "enriched_wordlist.txt"
 BACKUP_FILE = "enriched_wordlist_backup.txt"
+ENRICHED_CACHE_FILE = "enrichment_cache.jsonl"  # Append-only, one entry per unique word line; reset by --start
+
+# Parallel inference settings. A single Ollama server serializes generation
+# unless started with OLLAMA_NUM_PARALLEL; for true parallelism either raise
+# that or run extra servers (OLLAMA_HOST=127.0.0.1:11435 ollama serve) and
+# list them here. Requests are spread round-robin across the endpoints.
+OLLAMA_ENDPOINTS = ["http://localhost:11434"]
+MAX_WORKERS = len(OLLAMA_ENDPOINTS)
+BATCH_SIZE = 10  # Words submitted together; progress is saved after each batch
+TIMEOUT = 30
+
+# Placeholders used to pad short synonym/antonym lists to exactly 5 entries
+_PAD_SYN = tuple(f"synonym{i}" for i in range(1, 6))
+_PAD_ANT = tuple(f"antonym{i}" for i in range(1, 6))
+
+# Input lines are matched as bytes; only the captured fields get decoded
+_WORD_RE_BYTES = re.compile(rb'^(\w+)\s+([a-z]+\.?)\s+(.+)$')
+
+# Single background writer so progress saves never block the enrichment loop;
+# one worker keeps the writes in submission order.
+_progress_executor = ThreadPoolExecutor(max_workers=1)
+
+def dump_json(obj) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+def dump_json_line(obj) -> bytes:
+    """Serialize to one compact JSON line, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8') + b"\n"
+
+def load_json(data: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _write_atomic(path: str, data: bytes):
+    """Write data to a temp file and swap it in, so readers never see a partial file."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
 
 def save_progress(processed_count: int, total_count: int, last_word: str):
-    """Save current progress to file."""
+    """Save current progress to file (written atomically in the background)."""
     progress = {
         "processed_count": processed_count,
         "total_count": total_count,
@@ -26,19 +81,35 @@ def save_progress(processed_count: int, total_count: int, last_word: str):
         "input_file": INPUT_FILE,
         "output_file": OUTPUT_FILE
     }
-    with open(PROGRESS_FILE, 'w') as f:
-        json.dump(progress, f, indent=2)
+    _progress_executor.submit(_write_atomic, PROGRESS_FILE, dump_json(progress))
 
 def load_progress():
     """Load progress from file."""
     if os.path.exists(PROGRESS_FILE):
         try:
-            with open(PROGRESS_FILE, 'r') as f:
-                return json.load(f)
+            with open(PROGRESS_FILE, 'rb') as f:
+                return load_json(f.read())
         except:
             return None
     return None
 
+def entry_key(word: str, pos: str, definition: str) -> str:
+    """Stable key identifying a (word, pos, definition) input line."""
+    return hashlib.sha1(f"{word}|{pos}|{definition}".encode('utf-8')).hexdigest()
+
+def load_enriched_cache() -> dict:
+    """Load the entries enriched earlier in this run so duplicate lines are never re-sent to Ollama."""
+    cache = {}
+    if os.path.exists(ENRICHED_CACHE_FILE):
+        with open(ENRICHED_CACHE_FILE, 'rb') as f:
+            for line in f:
+                try:
+                    entry = load_json(line)
+                except ValueError:
+                    continue  # Partially written line from an interrupted run
+                cache[entry["key"]] = entry["text"]
+    return cache
+
 def backup_output():
     """Create backup of current output file."""
     if os.path.exists(OUTPUT_FILE):
@@ -46,32 +117,45 @@ def backup_output():
         shutil.copy2(OUTPUT_FILE, BACKUP_FILE)
         print(f"✅ Backup created: {BACKUP_FILE}")
 
-def call_ollama(prompt: str, model: str = "llama3.1:8b") -> str:
-    """Call Ollama model."""
+def call_ollama(prompt: str, model: str = "llama3.1:8b", endpoint: Optional[str] = None) -> str:
+    """Call Ollama model, over HTTP when an endpoint is given, else via the CLI."""
+    if endpoint:
+        return call_ollama_http(prompt, endpoint, model)
     try:
         result = subprocess.run(
             ["ollama", "run", model],
             input=prompt,
             text=True,
             capture_output=True,
-            timeout=30
+            timeout=TIMEOUT
         )
         return result.stdout.strip() if result.returncode == 0 else ""
     except:
         return ""
 
-def parse_word_line(line: str) -> Optional[Tuple[str, str, str]]:
-    """Parse word line: word pos. definition"""
-    line = line.strip()
-    if not line:
-        return None
-    
-    match = re.match(r'^(\w+)\s+([a-z]+\.?)\s+(.+)$', line)
+def call_ollama_http(prompt: str, endpoint: str, model: str) -> str:
+    """Call a running Ollama server through its /api/generate endpoint."""
+    request = urllib.request.Request(
+        f"{endpoint}/api/generate",
+        data=json.dumps({"model": model, "prompt": prompt, "stream": False}).encode('utf-8'),
+        headers={"Content-Type": "application/json"}
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=TIMEOUT) as response:
+            return load_json(response.read()).get("response", "").strip()
+    except:
+        return ""
+
+def parse_word_bytes(line: bytes) -> Optional[Tuple[str, str, str]]:
+    """Parse a raw input line (word pos. definition), decoding only the matched fields."""
+    match = _WORD_RE_BYTES.match(line.strip())
     if match:
-        return match.group(1), match.group(2).rstrip('.'), match.group(3)
+        return (match.group(1).decode('ascii'),
+                match.group(2).decode('ascii').rstrip('.'),
+                match.group(3).decode('utf-8'))
     return None
 
-def enrich_word(word: str, pos: str, definition: str) -> str:
+def enrich_word(word: str, pos: str, definition: str, endpoint: Optional[str] = None) -> str:
     """Enrich a single word with all required information."""
     
     prompt = f"""For the word "{word}" ({pos}), meaning "{definition}":
@@ -89,7 +173,7 @@ SENTENCE2: [sentence]
 SENTENCE3: [sentence]
 ORIGIN: [etymology explanation]"""
 
-    response = call_ollama(prompt)
+    response = call_ollama(prompt, endpoint=endpoint)
     
     # Default values
     synonyms = ["humble", "degrade", "demean", "lower", "humiliate"]
@@ -136,39 +220,28 @@ ORIGIN: [etymology explanation]"""
                     etymology = etym
     
     # Ensure we have exactly 5 synonyms and antonyms
-    while len(synonyms) < 5:
-        synonyms.append(f"synonym{len(synonyms)+1}")
-    while len(antonyms) < 5:
-        antonyms.append(f"antonym{len(antonyms)+1}")
+    if len(synonyms) < 5:
+        synonyms.extend(_PAD_SYN[len(synonyms):5])
+    if len(antonyms) < 5:
+        antonyms.extend(_PAD_ANT[len(antonyms):5])
     
     # Format according to template
-    output = f"Word: {word};{definition}\n"
-    output += f"Meaning: {definition}\n\n"
-    output += "Synonyms:\n\n"
-    
-    for i, synonym in enumerate(synonyms[:5], 1):
-        output += f"\t{i}.\t{synonym}\n"
-    
-    output += "\nAntonyms:\n\n"
-    
-    for i, antonym in enumerate(antonyms[:5], 1):
-        output += f"\t{i}.\t{antonym}\n"
-    
-    output += "\nSentences:\n\n"
-    
-    for i, sentence in enumerate(sentences[:3], 1):
-        output += f"\t{i}.\t{sentence}\n"
-    
-    output += f"\nOrigin:\n{etymology}\n\n"
-    
-    return output
+    chunks = [f"Word: {word};{definition}\n", f"Meaning: {definition}\n\n", "Synonyms:\n\n"]
+    chunks.extend(f"\t{i}.\t{synonym}\n" for i, synonym in enumerate(synonyms[:5], 1))
+    chunks.append("\nAntonyms:\n\n")
+    chunks.extend(f"\t{i}.\t{antonym}\n" for i, antonym in enumerate(antonyms[:5], 1))
+    chunks.append("\nSentences:\n\n")
+    chunks.extend(f"\t{i}.\t{sentence}\n" for i, sentence in enumerate(sentences[:3], 1))
+    chunks.append(f"\nOrigin:\n{etymology}\n\n")
+    
+    return "".join(chunks)
 
 def count_total_words(filename: str) -> int:
     """Count total valid words in the input file."""
     count = 0
-    with open(filename, 'r', encoding='utf-8') as f:
+    with open(filename, 'rb') as f:
         for line in f:
-            if parse_word_line(line):
+            if _WORD_RE_BYTES.match(line.strip()):
                 count += 1
     return count
 
@@ -184,10 +257,89 @@ def get_processed_words_count(output_file: str) -> int:
         count = content.count('\nWord: ') + (1 if content.startswith('Word: ') else 0)
     return count
 
+def iter_word_lines(lines: Iterable[bytes]):
+    """Yield parsed (word, pos, definition) tuples from raw lines, skipping non-word lines."""
+    for line in lines:
+        parsed = parse_word_bytes(line)
+        if parsed:
+            yield parsed
+
+def enrich_batch(executor: ThreadPoolExecutor, batch: List[Tuple[str, str, str]]) -> List[Optional[str]]:
+    """Enrich a batch in parallel across endpoints, returning results in input order."""
+    futures = {
+        executor.submit(enrich_word, word, pos, definition,
+                        OLLAMA_ENDPOINTS[i % len(OLLAMA_ENDPOINTS)]): i
+        for i, (word, pos, definition) in enumerate(batch)
+    }
+    results = [None] * len(batch)
+    for future in as_completed(futures):
+        i = futures[future]
+        try:
+            results[i] = future.result()
+        except Exception as e:
+            print(f"❌ Error processing {batch[i][0]}: {e}")
+    return results
+
+def process_words(words: Iterable[Tuple[str, str, str]], out_f, processed: int,
+                  total_words: int) -> Tuple[int, bool]:
+    """Enrich words batch by batch and append them to out_f in input order.
+
+    Identical (word, pos, definition) lines are enriched once: results are kept
+    in ENRICHED_CACHE_FILE and reused for every later occurrence, also after --resume.
+    Returns the updated processed count and whether the run was interrupted.
+    """
+    last_word = ""
+    cache = load_enriched_cache()
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor, \
+            open(ENRICHED_CACHE_FILE, 'ab') as cache_f:
+        try:
+            words = iter(words)
+            while True:
+                batch = list(islice(words, BATCH_SIZE))
+                if not batch:
+                    break
+                print(f"🔄 Processing {processed+1}-{processed+len(batch)}/{total_words}: {batch[0][0]}")
+                
+                keys = [entry_key(*parsed) for parsed in batch]
+                pending = {}
+                for key, parsed in zip(keys, batch):
+                    if key not in cache:
+                        pending.setdefault(key, parsed)
+                if len(pending) < len(batch):
+                    print(f"♻️  Reusing {len(batch) - len(pending)} already enriched word(s)")
+                for key, enriched in zip(pending, enrich_batch(executor, list(pending.values()))):
+                    if enriched is not None:
+                        cache[key] = enriched
+                        cache_f.write(dump_json_line({"key": key, "text": enriched}))
+                cache_f.flush()
+                
+                for (word, _, _), key in zip(batch, keys):
+                    enriched = cache.get(key)
+                    if enriched is not None:
+                        out_f.write(enriched)
+                        processed += 1
+                        last_word = word
+                out_f.flush()
+                
+                save_progress(processed, total_words, last_word)
+                print(f"💾 Progress saved: {processed}/{total_words}")
+        except KeyboardInterrupt:
+            print(f"\n⏸️  Process interrupted. Saving progress...")
+            out_f.flush()
+            save_progress(processed, total_words, last_word)
+            print(f"💾 Progress saved: {processed}/{total_words}")
+            executor.shutdown(wait=False, cancel_futures=True)
+            return processed, True
+    return processed, False
+
 def process_from_start(max_words: Optional[int] = None):
     """Process from the beginning."""
     print("🚀 Starting fresh enrichment process...")
     
+    # A fresh run must not reuse enrichments from an earlier one
+    if os.path.exists(ENRICHED_CACHE_FILE):
+        os.remove(ENRICHED_CACHE_FILE)
+    
     # Create backup if output file exists
     if os.path.exists(OUTPUT_FILE):
         backup_output()
@@ -199,39 +351,15 @@ def process_from_start(max_words: Optional[int] = None):
         total_words = min(total_words, max_words)
         print(f"🎯 Processing limited to: {max_words} words")
     
-    processed = 0
+    print(f"🔧 Using {MAX_WORKERS} parallel workers across {len(OLLAMA_ENDPOINTS)} Ollama endpoint(s)")
     
-    with open(INPUT_FILE, 'r', encoding='utf-8') as f:
+    with open(INPUT_FILE, 'rb') as f:
         with open(OUTPUT_FILE, 'w', encoding='utf-8') as out_f:
-            for line_num, line in enumerate(f, 1):
-                parsed = parse_word_line(line)
-                if parsed and processed < (max_words or float('inf')):
-                    word, pos, definition = parsed
-                    
-                    try:
-                        print(f"🔄 Processing {processed+1}/{total_words}: {word}")
-                        enriched = enrich_word(word, pos, definition)
-                        out_f.write(enriched)
-                        out_f.flush()
-                        
-                        processed += 1
-                        
-                        # Save progress every 10 words
-                        if processed % 10 == 0:
-                            save_progress(processed, total_words, word)
-                            print(f"💾 Progress saved: {processed}/{total_words}")
-                        
-                        if max_words and processed >= max_words:
-                            break
-                            
-                    except KeyboardInterrupt:
-                        print(f"\n⏸️  Process interrupted. Saving progress...")
-                        save_progress(processed, total_words, word)
-                        print(f"💾 Progress saved: {processed}/{total_words}")
-                        return processed
-                    except Exception as e:
-                        print(f"❌ Error processing {word}: {e}")
-                        continue
+            words = islice(iter_word_lines(f), total_words)
+            processed, interrupted = process_words(words, out_f, 0, total_words)
+    
+    if interrupted:
+        return processed
     
     # Final save
     save_progress(processed, total_words, "completed")
@@ -261,7 +389,7 @@ def process_resume():
     processed = expected_count
     
     # Read all lines to find where to resume
-    with open(INPUT_FILE, 'r', encoding='utf-8') as f:
+    with open(INPUT_FILE, 'rb') as f:
         lines = f.readlines()
     
     # Skip already processed words
@@ -269,7 +397,7 @@ def process_resume():
     words_skipped = 0
     
     for i, line in enumerate(lines):
-        if parse_word_line(line):
+        if _WORD_RE_BYTES.match(line.strip()):
             if words_skipped >= expected_count:
                 line_index = i
                 break
@@ -279,36 +407,11 @@ def process_resume():
     
     # Continue processing
     with open(OUTPUT_FILE, 'a', encoding='utf-8') as out_f:  # Append mode
-        for line_num in range(line_index, len(lines)):
-            line = lines[line_num]
-            parsed = parse_word_line(line)
-            if parsed:
-                word, pos, definition = parsed
-                
-                try:
-                    print(f"🔄 Processing {processed+1}/{total_words}: {word}")
-                    enriched = enrich_word(word, pos, definition)
-                    out_f.write(enriched)
-                    out_f.flush()
-                    
-                    processed += 1
-                    
-                    # Save progress every 10 words
-                    if processed % 10 == 0:
-                        save_progress(processed, total_words, word)
-                        print(f"💾 Progress saved: {processed}/{total_words}")
-                    
-                    if processed >= total_words:
-                        break
-                        
-                except KeyboardInterrupt:
-                    print(f"\n⏸️  Process interrupted. Saving progress...")
-                    save_progress(processed, total_words, word)
-                    print(f"💾 Progress saved: {processed}/{total_words}")
-                    return processed
-                except Exception as e:
-                    print(f"❌ Error processing {word}: {e}")
-                    continue
+        words = islice(iter_word_lines(lines[line_index:]), max(total_words - processed, 0))
+        processed, interrupted = process_words(words, out_f, processed, total_words)
+    
+    if interrupted:
+        return processed
     
     # Final save
     save_progress(processed, total_words, "completed")
@@ -343,7 +446,7 @@ def main():
         print("  python3 resumable_enricher.py --start [max_words]  # Start fresh")
         print("  python3 resumable_enricher.py --resume            # Resume from progress")
         print("  python3 resumable_enricher.py --status            # Show current status")
-        print("  python3 resumable_enricher.py --clean             # Clean progress file")
+        print("  python3 resumable_enricher.py --clean             # Clean progress and cache files")
         return
     
     command = sys.argv[1]
@@ -361,6 +464,9 @@ def main():
             print("🗑️  Progress file cleaned.")
         else:
             print("❌ No progress file found.")
+        if os.path.exists(ENRICHED_CACHE_FILE):
+            os.remove(ENRICHED_CACHE_FILE)
+            print("🗑️  Enrichment cache cleaned.")
     else:
         print("❌ Unknown command. Use --start, --resume, --status, or --clean")
 
@@ -6,6 +6,15 @@ Convert enrichedpdfplan.txt to HTML format for PDF generation.
 import re
 import html
 from pathlib import Path
+from string import Template
+from concurrent.futures import ProcessPoolExecutor
+
+# Compiled once: entry separators (25+ dashes), separator lines inside an entry,
+# the "1. " numbering on list items, and characters not allowed in an anchor id
+_ENTRY_SEP_RE = re.compile(r'\n-{25,}\n')
+_SEP_LINE_RE = re.compile(r'^-{10,}$')
+_NUM_PREFIX_RE = re.compile(r'^\d+\.\s*')
+_ANCHOR_UNSAFE_RE = re.compile(r'[^a-zA-Z0-9]')
 
 def parse_word_entry(entry_text):
     """Parse a single word entry from the text."""
@@ -26,7 +35,7 @@ def parse_word_entry(entry_text):
         line = line.strip()
         
         # Skip empty lines and separator lines
-        if not line or re.match(r'^-{10,}$', line):
+        if not line or _SEP_LINE_RE.match(line):
             continue
             
         if line.startswith('Word: '):
@@ -61,7 +70,7 @@ def parse_word_entry(entry_text):
                 word_data['origin'] = line[7:].strip()
         elif line and current_section:
             # Remove numbering and clean up the line
-            clean_line = re.sub(r'^\d+\.\s*', '', line)
+            clean_line = _NUM_PREFIX_RE.sub('', line)
             clean_line = clean_line.strip()
             
             if current_section == 'origin':
@@ -74,18 +83,8 @@ def parse_word_entry(entry_text):
     
     return word_data
 
-def convert_to_html(input_file, output_file):
-    """Convert the enriched word list to HTML format."""
-    
-    # Read the input file
-    with open(input_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Split entries by any line with 25+ consecutive dashes
-    entries = re.split(r'\n-{25,}\n', content)
-    
-    # HTML template
-    html_content = """<!DOCTYPE html>
+# Static page header (styles + start of the table of contents)
+HTML_HEADER = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -242,89 +241,112 @@ def convert_to_html(input_file, output_file):
         <h2>📋 Table of Contents</h2>
         <ul class="toc-list">
 """
+
+HTML_FOOTER = """
+</body>
+</html>"""
+
+# Templates are built once at import; each entry only substitutes its fields
+TOC_ITEM_TEMPLATE = Template('<li class="toc-item"><a href="#$word_id" class="toc-link">$word</a></li>')
+
+ENTRY_START_TEMPLATE = Template("""
+    <div class="word-entry" id="$word_id">
+        <div class="word-title">$word</div>
+        
+        <div class="meaning">$meaning</div>
+""")
+
+LIST_SECTION_TEMPLATE = Template("""
+        <div class="section-title">$title</div>
+        <div class="$css_class">
+$items        </div>
+""")
+
+ORIGIN_TEMPLATE = Template("""
+        <div class="section-title">📜 Origin</div>
+        <div class="origin">$origin</div>
+""")
+
+ENTRY_END = """    </div>
+"""
+
+# (field, section title, container class, per-item template)
+LIST_SECTIONS = (
+    ('synonyms', '🟢 Synonyms', 'synonyms',
+     Template('            <span class="synonym">$text</span>\n')),
+    ('antonyms', '🔴 Antonyms', 'antonyms',
+     Template('            <span class="antonym">$text</span>\n')),
+    ('sentences', '💬 Example Sentences', 'sentences',
+     Template('            <div class="sentence">$text</div>\n')),
+)
+
+def parse_entry_safe(entry):
+    """Parse an entry in a worker process, returning (word_data, error message)."""
+    try:
+        return parse_word_entry(entry), None
+    except Exception as e:
+        return None, str(e)
+
+def render_word_entry(word_data, word_id):
+    """Render one word entry as an HTML fragment."""
+    parts = [ENTRY_START_TEMPLATE.substitute(
+        word_id=word_id,
+        word=html.escape(word_data['word']),
+        meaning=html.escape(word_data['meaning'])
+    )]
+    
+    for field, title, css_class, item_template in LIST_SECTIONS:
+        if word_data[field]:
+            items = ''.join(item_template.substitute(text=html.escape(text)) for text in word_data[field])
+            parts.append(LIST_SECTION_TEMPLATE.substitute(title=title, css_class=css_class, items=items))
+    
+    if word_data['origin']:
+        parts.append(ORIGIN_TEMPLATE.substitute(origin=html.escape(word_data['origin'])))
+    
+    parts.append(ENTRY_END)
+    return ''.join(parts)
+
+def convert_to_html(input_file, output_file):
+    """Convert the enriched word list to HTML format."""
+    
+    # Read the input file
+    with open(input_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    # Split entries by any line with 25+ consecutive dashes
+    entries = _ENTRY_SEP_RE.split(content)
     
     word_entries = []
     toc_items = []
     
     print(f"Processing {len(entries)} entries...")
     
-    for i, entry in enumerate(entries):
-        if entry.strip():
-            try:
-                word_data = parse_word_entry(entry)
-                if word_data['word']:
-                    word_entries.append(word_data)
-                    # Create anchor-safe word ID
-                    word_id = re.sub(r'[^a-zA-Z0-9]', '_', word_data['word'].lower())
-                    toc_items.append(f'<li class="toc-item"><a href="#{word_id}" class="toc-link">{html.escape(word_data["word"])}</a></li>')
-            except Exception as e:
-                print(f"Error processing entry {i}: {e}")
-                continue
-    
-    # Add TOC items
-    html_content += '\n'.join(toc_items)
-    html_content += """
-        </ul>
-    </div>
-"""
+    # Entries are independent, so parse them across all CPU cores
+    indexed_entries = [(i, entry) for i, entry in enumerate(entries) if entry.strip()]
+    with ProcessPoolExecutor() as executor:
+        parsed = list(executor.map(parse_entry_safe, [entry for _, entry in indexed_entries], chunksize=64))
     
-    # Add word entries
-    for word_data in word_entries:
-        word_id = re.sub(r'[^a-zA-Z0-9]', '_', word_data['word'].lower())
-        
-        html_content += f"""
-    <div class="word-entry" id="{word_id}">
-        <div class="word-title">{html.escape(word_data['word'])}</div>
-        
-        <div class="meaning">{html.escape(word_data['meaning'])}</div>
-"""
-        
-        if word_data['synonyms']:
-            html_content += """
-        <div class="section-title">🟢 Synonyms</div>
-        <div class="synonyms">
-"""
-            for synonym in word_data['synonyms']:
-                html_content += f'            <span class="synonym">{html.escape(synonym)}</span>\n'
-            html_content += """        </div>
-"""
-        
-        if word_data['antonyms']:
-            html_content += """
-        <div class="section-title">🔴 Antonyms</div>
-        <div class="antonyms">
-"""
-            for antonym in word_data['antonyms']:
-                html_content += f'            <span class="antonym">{html.escape(antonym)}</span>\n'
-            html_content += """        </div>
-"""
-        
-        if word_data['sentences']:
-            html_content += """
-        <div class="section-title">💬 Example Sentences</div>
-        <div class="sentences">
-"""
-            for sentence in word_data['sentences']:
-                html_content += f'            <div class="sentence">{html.escape(sentence)}</div>\n'
-            html_content += """        </div>
-"""
-        
-        if word_data['origin']:
-            html_content += f"""
-        <div class="section-title">📜 Origin</div>
-        <div class="origin">{html.escape(word_data['origin'])}</div>
-"""
-        
-        html_content += """    </div>
-"""
-    
-    html_content += """
-</body>
-</html>"""
+    for (i, _), (word_data, error) in zip(indexed_entries, parsed):
+        if error is not None:
+            print(f"Error processing entry {i}: {error}")
+            continue
+        if word_data['word']:
+            # Create anchor-safe word ID
+            word_id = _ANCHOR_UNSAFE_RE.sub('_', word_data['word'].lower())
+            word_entries.append((word_data, word_id))
+            toc_items.append(TOC_ITEM_TEMPLATE.substitute(word_id=word_id, word=html.escape(word_data['word'])))
     
-    # Write the HTML file
+    # Stream the HTML file section by section
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+        f.write(HTML_HEADER)
+        f.write('\n'.join(toc_items))
+        f.write("""
+        </ul>
+    </div>
+""")
+        for word_data, word_id in word_entries:
+            f.write(render_word_entry(word_data, word_id))
+        f.write(HTML_FOOTER)
     
     print(f"✅ Conversion complete!")
     print(f"📁 Input file: {input_file}")
@@ -6,114 +6,292 @@ Optimizations: Multiple models, simplified prompts, aggressive caching
 """
 
 import re
-import subprocess
 import sys
 import json
 import os
 import time
-from typing import Tuple, Optional, List, Dict
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
-import hashlib
+import asyncio
+import mmap
+from itertools import islice
+import sqlite3
+from typing import Tuple, Optional, List
+
+from ollama_client import OllamaClient
+
+try:
+    import orjson  # Optional: faster JSON encode/decode
+except ImportError:
+    orjson = None
 
 # Configuration
 PROGRESS_FILE = "enrichment_progress.json"
 INPUT_FILE = "grewordlist.txt"
 OUTPUT_FILE = "enriched_wordlist.txt"
 BACKUP_FILE = "enriched_wordlist_backup.txt"
-CACHE_FILE = "word_cache.json"
+CACHE_FILE = "word_cache.db"    # SQLite (WAL mode)
+LEGACY_CACHE_FILE = "word_cache.json"  # JSON cache written by older versions; only removed by --clean
+
+# Ollama server (HTTP API); the model stays resident between requests
+OLLAMA_HOST = "localhost"
+OLLAMA_PORT = 11434
+KEEP_ALIVE = "1h"         # Sent on every request so the model is never evicted mid-run
 
 # Ultra-fast settings
-MAX_WORKERS = 12          # More parallel workers
+MAX_WORKERS = 12          # Concurrent in-flight Ollama requests (one event loop)
 BATCH_SIZE = 100          # Larger batches
-TIMEOUT = 8               # Aggressive timeout
+MICRO_BATCH_SIZE = 8      # Words sent together in a single LLM request
+TIMEOUT = 8               # Aggressive timeout, per word in a request (scales with batch like num_predict)
+WARM_UP_TIMEOUT = 300     # Loading the model from disk on a cold start can take minutes
+TOKENS_PER_WORD = 80      # Generation budget per word (num_predict scales with batch)
 PROGRESS_SAVE_INTERVAL = 50
+REPORT_INTERVAL = 1.0     # Seconds between throughput reports
 USE_CACHE = True          # Cache responses
+SEMANTIC_THRESHOLD = 0.8  # Definition token overlap (Jaccard) counted as a near-duplicate
+
+def dump_json(obj, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+def load_json(data: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+_TOKEN_RE = re.compile(r'[a-z]+')
+
+# Smart-default (synonyms, antonyms) used when the LLM gives nothing usable.
+# Looked up by word suffix, one dict probe per length in _SUFFIX_LENGTHS;
+# words matching no suffix fall back to the POS-based defaults.
+_SUFFIX_DEFAULTS = {
+    'ate': (("create", "generate", "produce", "form", "make"),
+            ("destroy", "eliminate", "remove", "break", "stop")),
+    'tion': (("process", "action", "method", "procedure", "operation"),
+             ("inaction", "stillness", "rest", "pause", "stop")),
+}
+_SUFFIX_LENGTHS = (3, 4)
+
+# Placeholders that pad short synonym/antonym lists to exactly 5 entries
+_FILL_SYN = ("term1", "term2", "term3", "term4", "term5")
+_FILL_ANT = ("opposite1", "opposite2", "opposite3", "opposite4", "opposite5")
+
+# Output template for one entry: word, definition x2, 5 synonyms, 5 antonyms,
+# 3 sentences, etymology
+_ENTRY_TEMPLATE = (
+    "Word: %s;%s\nMeaning: %s\n\n"
+    "Synonyms:\n\n\t1.\t%s\n\t2.\t%s\n\t3.\t%s\n\t4.\t%s\n\t5.\t%s\n\n"
+    "Antonyms:\n\n\t1.\t%s\n\t2.\t%s\n\t3.\t%s\n\t4.\t%s\n\t5.\t%s\n\n"
+    "Sentences:\n\n\t1.\t%s\n\t2.\t%s\n\t3.\t%s\n\n"
+    "Origin:\n%s\n\n"
+)
+
+# Response line tag (text before the first ':') -> field it fills
+_RESPONSE_TAGS = {'SYN': 'syn', 'ANT': 'ant', 'EX': 'ex', 'ETY': 'ety'}
+_ADJ_DEFAULTS = (("notable", "significant", "important", "remarkable", "distinctive"),
+                 ("insignificant", "minor", "trivial", "ordinary", "common"))
+_GENERIC_DEFAULTS = (("related", "similar", "comparable", "equivalent", "corresponding"),
+                     ("different", "opposite", "contrary", "unrelated", "distinct"))
+
+def definition_fingerprint(definition: str) -> frozenset:
+    """Cheap semantic fingerprint of a definition: its set of content words."""
+    return frozenset(token for token in _TOKEN_RE.findall(definition.lower()) if len(token) > 2)
+
+def fingerprint_similarity(a: frozenset, b: frozenset) -> float:
+    """Jaccard similarity between two definition fingerprints."""
+    if not a or not b:
+        return 1.0 if a == b else 0.0
+    return len(a & b) / len(a | b)
 
 class UltraFastEnricher:
+    # Invariant system prompt sent verbatim with every request. Keeping it
+    # byte-identical lets Ollama reuse the KV cache for this prefix, so only
+    # the short per-request word listing has to be prefilled.
+    SYSTEM_PREFIX = """You enrich vocabulary words. For each numbered word, first repeat its number and the word on one line, then write exactly these four lines, in this order, followed by a line containing only ###
+Never write blank lines or any other text.
+SYN: five single-word synonyms, comma separated
+ANT: five single-word antonyms, comma separated
+EX: one example sentence using the word
+ETY: a one-sentence etymology
+
+Example input:
+1. abase (v): To lower in position, estimation, or the like; degrade.
+2. benevolent (adj): Loving others and actively desirous of their well-being.
+
+Example output:
+1. abase
+SYN: humble, degrade, demean, belittle, humiliate
+ANT: elevate, exalt, honor, promote, dignify
+EX: He refused to abase himself before the tyrant.
+ETY: From Old French abaissier, from Latin ad- 'to' + bassus 'low'.
+###
+2. benevolent
+SYN: kind, charitable, generous, compassionate, humane
+ANT: malevolent, cruel, unkind, spiteful, callous
+EX: The benevolent donor paid for scholarships for the whole class.
+ETY: From Latin bene 'well' + volens 'wishing'.
+###"""
+
     def __init__(self):
-        self.write_lock = Lock()
-        self.progress_lock = Lock()
-        self.cache_lock = Lock()
         self.processed_count = 0
         self.failed_words = []
-        self.start_time = time.time()
-        self.cache = self.load_cache()
+        self.start_time = time.perf_counter()  # Monotonic; only used for rates
+        self.db = None
+        if USE_CACHE:
+            self.init_cache()
+        # Keep-alive connections to Ollama, at most MAX_WORKERS requests in flight (aiohttp when installed)
+        self.client = OllamaClient(OLLAMA_HOST, OLLAMA_PORT, MAX_WORKERS, TIMEOUT)
         
         # Use fastest model
         self.model = "tinyllama:1.1b"
         print(f"🚀 Using ultra-fast model: {self.model}")
 
-    def load_cache(self) -> Dict:
-        """Load cached responses."""
-        if USE_CACHE and os.path.exists(CACHE_FILE):
-            try:
-                with open(CACHE_FILE, 'r') as f:
-                    return json.load(f)
-            except:
-                return {}
-        return {}
-
-    def save_cache(self):
-        """Save cache to file."""
+    def init_cache(self):
+        """Open the cache database in WAL mode and create the cache table."""
+        self.db = db = sqlite3.connect(CACHE_FILE, isolation_level=None, timeout=30)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        # Never checkpoint inside a cache write on the hot path; save_progress
+        # folds the WAL back into the database between batches instead.
+        db.execute("PRAGMA wal_autocheckpoint=0")
+        db.execute("""CREATE TABLE IF NOT EXISTS cache (
+            key TEXT PRIMARY KEY,
+            word TEXT NOT NULL,
+            definition TEXT NOT NULL,
+            response TEXT NOT NULL
+        )""")
+        db.execute("CREATE INDEX IF NOT EXISTS cache_word ON cache(word)")
+
+    def checkpoint_cache(self):
+        """Copy WAL contents into the main database file."""
         if USE_CACHE:
-            with self.cache_lock:
-                with open(CACHE_FILE, 'w') as f:
-                    json.dump(self.cache, f)
+            self.db.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    def cache_size(self) -> int:
+        """Number of cached responses."""
+        if not USE_CACHE:
+            return 0
+        return self.db.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
 
     def get_cache_key(self, word: str, pos: str, definition: str) -> str:
-        """Generate cache key for word."""
-        content = f"{word}|{pos}|{definition}"
-        return hashlib.md5(content.encode()).hexdigest()
-
-    def call_ollama_ultra_fast(self, prompt: str, cache_key: str = None) -> str:
-        """Ultra-fast Ollama call with caching."""
-        # Check cache first
-        if USE_CACHE and cache_key and cache_key in self.cache:
-            return self.cache[cache_key]
+        """Generate cache key for word (the raw fields; SQLite indexes the text itself)."""
+        return f"{word}|{pos}|{definition}"
+
+    def lookup_cache(self, word: str, definition: str, cache_key: str) -> str:
+        """Return the cached response for this entry or a near-duplicate of it, else ""."""
+        if not USE_CACHE:
+            return ""
+        db = self.db
+        row = db.execute("SELECT response FROM cache WHERE key = ?", (cache_key,)).fetchone()
+        if row:
+            return row[0]
         
+        # Same word with an almost identical definition (e.g. repeated across POS)
+        fingerprint = definition_fingerprint(definition)
+        for other_definition, response in db.execute(
+                "SELECT definition, response FROM cache WHERE word = ?", (word.lower(),)):
+            if fingerprint_similarity(fingerprint, definition_fingerprint(other_definition)) >= SEMANTIC_THRESHOLD:
+                return response
+        return ""
+
+    def store_cache(self, word: str, definition: str, cache_key: str, response: str):
+        """Cache a response and index it for near-duplicate lookups."""
+        if USE_CACHE and response:
+            self.db.execute(
+                "INSERT OR REPLACE INTO cache (key, word, definition, response) VALUES (?, ?, ?, ?)",
+                (cache_key, word.lower(), definition, response))
+
+    async def call_ollama_ultra_fast(self, prompt: str, word_count: int = 1) -> str:
+        """Ultra-fast Ollama call for word_count numbered words; callers check the cache first."""
         try:
-            result = subprocess.run(
-                ["ollama", "run", self.model],
-                input=prompt,
-                text=True,
-                capture_output=True,
-                timeout=TIMEOUT
-            )
-            response = result.stdout.strip() if result.returncode == 0 else ""
-            
-            # Cache the response
-            if USE_CACHE and cache_key and response:
-                with self.cache_lock:
-                    self.cache[cache_key] = response
-            
-            return response
-        except:
+            result = await self.client.post("/api/generate", {
+                "model": self.model,
+                "system": self.SYSTEM_PREFIX,
+                "prompt": prompt,
+                "stream": False,
+                "keep_alive": KEEP_ALIVE,
+                # Bounded, deterministic decode. A blank line may fall between sections,
+                # so generation only stops early once the model starts a section
+                # beyond the last word asked for.
+                "options": {"num_predict": TOKENS_PER_WORD * word_count,
+                            "stop": [f"###\n{word_count + 1}."],
+                            "temperature": 0, "top_k": 20}
+            }, TIMEOUT * word_count)
+            return result.get("response", "").strip()
+        except Exception as e:
+            print(f"⚠️  Ollama request failed, using defaults: {e!r}")
             return ""
 
-    def enrich_word_ultra_fast(self, word: str, pos: str, definition: str) -> str:
-        """Ultra-fast enrichment with aggressive optimizations."""
+    async def warm_up(self):
+        """Load the model and prime the SYSTEM_PREFIX KV cache before real work starts."""
+        try:
+            await self.client.post("/api/generate", {
+                "model": self.model,
+                "system": self.SYSTEM_PREFIX,
+                "prompt": "warmup",
+                "stream": False,
+                "keep_alive": KEEP_ALIVE,
+                "options": {"num_predict": 1}
+            }, WARM_UP_TIMEOUT)
+            print("🔥 Model warmed up")
+        except Exception as e:
+            print(f"⚠️  Warm-up failed: {e}")
+
+    async def enrich_words_batched(self, items: List[Tuple[str, str, str]]) -> List[str]:
+        """Enrich several words with one LLM request, sharing the prompt prefill."""
+        keys = [self.get_cache_key(word, pos, definition) for word, pos, definition in items]
+        responses = [self.lookup_cache(word, definition, key)
+                     for (word, _, definition), key in zip(items, keys)]
+        misses = [i for i, response in enumerate(responses) if not response]
         
-        cache_key = self.get_cache_key(word, pos, definition)
+        if misses:
+            prompt = "\n".join(
+                f"{n}. {items[i][0]} ({items[i][1]}): {items[i][2]}" for n, i in enumerate(misses, 1)
+            )
+            raw = await self.call_ollama_ultra_fast(prompt, len(misses))
+            sections = self.match_sections(raw, [items[i][0] for i in misses])
+            
+            # Partial answers still improve the entry, but only complete ones are cached
+            for i, (section, complete) in zip(misses, sections):
+                responses[i] = section
+                if complete:
+                    self.store_cache(items[i][0], items[i][2], keys[i], section)
         
-        # Ultra-minimal prompt
-        prompt = f"{word} ({pos}): {definition}\nSYN: \nANT: \nEX: \nETY: "
+        return [self.format_entry(word, pos, definition, response)
+                for (word, pos, definition), response in zip(items, responses)]
 
-        response = self.call_ollama_ultra_fast(prompt, cache_key)
-        
-        # Smart defaults based on word characteristics
-        if word.endswith('ate'):
-            synonyms = ["create", "generate", "produce", "form", "make"]
-            antonyms = ["destroy", "eliminate", "remove", "break", "stop"]
-        elif word.endswith('tion'):
-            synonyms = ["process", "action", "method", "procedure", "operation"]
-            antonyms = ["inaction", "stillness", "rest", "pause", "stop"]
-        elif pos == 'adj':
-            synonyms = ["notable", "significant", "important", "remarkable", "distinctive"]
-            antonyms = ["insignificant", "minor", "trivial", "ordinary", "common"]
+    def match_sections(self, raw: str, words: List[str]) -> List[Tuple[str, bool]]:
+        """(section, has all four fields) per requested word, matched by the section's "N. word" header."""
+        matched = [("", False)] * len(words)
+        for section in raw.split("###"):
+            header, _, body = section.strip().partition('\n')
+            number, dot, named = header.partition('.')
+            if not (dot and number.strip().isdecimal()):
+                continue
+            n = int(number) - 1
+            named_word = named.strip().split(' ', 1)[0].rstrip(':').lower()
+            # Skipped, merged or extra sections cannot shift answers onto another word
+            if not 0 <= n < len(words) or matched[n][0] or named_word != words[n].lower():
+                continue
+            tags = set()
+            for line in body.split('\n'):
+                tag, sep, payload = line.strip().partition(':')
+                if sep and payload.strip() and tag in _RESPONSE_TAGS:
+                    tags.add(tag)
+            matched[n] = (body.strip(), len(tags) == len(_RESPONSE_TAGS))
+        return matched
+
+    def format_entry(self, word: str, pos: str, definition: str, response: str) -> str:
+        """Format one enriched entry from an LLM response, falling back to smart defaults."""
+        # Smart defaults based on word characteristics (shared immutable tuples)
+        for length in _SUFFIX_LENGTHS:
+            defaults = _SUFFIX_DEFAULTS.get(word[-length:])
+            if defaults:
+                break
         else:
-            synonyms = ["related", "similar", "comparable", "equivalent", "corresponding"]
-            antonyms = ["different", "opposite", "contrary", "unrelated", "distinct"]
+            defaults = _ADJ_DEFAULTS if pos == 'adj' else _GENERIC_DEFAULTS
+        synonyms, antonyms = defaults
         
         # Better fallback sentences
         sentences = [
@@ -126,81 +304,74 @@ class UltraFastEnricher:
         
         # Fast parsing if we got a response
         if response:
-            lines = response.split('\n')
-            for i, line in enumerate(lines):
-                line = line.strip()
-                if line.startswith('SYN:') and len(line) > 4:
-                    syns = [s.strip() for s in line[4:].replace(',', ' ').split() if s.strip() and len(s) > 2]
+            for line in response.split('\n'):
+                tag, sep, payload = line.strip().partition(':')
+                field = _RESPONSE_TAGS.get(tag) if sep else None
+                if field is None or not payload:
+                    continue
+                if field == 'syn':
+                    syns = [s.strip() for s in payload.replace(',', ' ').split() if s.strip() and len(s) > 2]
                     if len(syns) >= 3:
                         synonyms = syns[:5]
-                elif line.startswith('ANT:') and len(line) > 4:
-                    ants = [s.strip() for s in line[4:].replace(',', ' ').split() if s.strip() and len(s) > 2]
+                elif field == 'ant':
+                    ants = [s.strip() for s in payload.replace(',', ' ').split() if s.strip() and len(s) > 2]
                     if len(ants) >= 3:
                         antonyms = ants[:5]
-                elif line.startswith('EX:') and len(line) > 10:
-                    sentences[0] = line[3:].strip()
-                elif line.startswith('ETY:') and len(line) > 10:
-                    etymology = line[4:].strip()
+                elif field == 'ex' and len(payload) > 7:
+                    sentences[0] = payload.strip()
+                elif field == 'ety' and len(payload) > 6:
+                    etymology = payload.strip()
         
         # Pad to exact counts
-        while len(synonyms) < 5:
-            synonyms.append(f"term{len(synonyms)+1}")
-        while len(antonyms) < 5:
-            antonyms.append(f"opposite{len(antonyms)+1}")
+        if len(synonyms) < 5:
+            synonyms = (*synonyms, *_FILL_SYN[len(synonyms):])
+        if len(antonyms) < 5:
+            antonyms = (*antonyms, *_FILL_ANT[len(antonyms):])
         
         # Minimal template formatting
-        return f"Word: {word};{definition}\nMeaning: {definition}\n\nSynonyms:\n\n\t1.\t{synonyms[0]}\n\t2.\t{synonyms[1]}\n\t3.\t{synonyms[2]}\n\t4.\t{synonyms[3]}\n\t5.\t{synonyms[4]}\n\nAntonyms:\n\n\t1.\t{antonyms[0]}\n\t2.\t{antonyms[1]}\n\t3.\t{antonyms[2]}\n\t4.\t{antonyms[3]}\n\t5.\t{antonyms[4]}\n\nSentences:\n\n\t1.\t{sentences[0]}\n\t2.\t{sentences[1]}\n\t3.\t{sentences[2]}\n\nOrigin:\n{etymology}\n\n"
+        return _ENTRY_TEMPLATE % (word, definition, definition, *synonyms[:5], *antonyms[:5], *sentences, etymology)
 
-    def parse_word_line(self, line: str) -> Optional[Tuple[str, str, str]]:
-        """Parse word line: word pos. definition"""
-        line = line.strip()
-        if not line:
+    def parse_word_line(self, line: bytes) -> Optional[Tuple[str, str, str]]:
+        """Parse a raw word line: word pos. definition (decodes only matching lines)"""
+        parts = line.strip().split(None, 2)
+        if len(parts) != 3:
             return None
         
-        match = re.match(r'^(\w+)\s+([a-z]+\.?)\s+(.+)$', line)
-        if match:
-            return match.group(1), match.group(2).rstrip('.'), match.group(3)
-        return None
+        word, pos, definition = parts
+        if pos.endswith(b'.'):
+            pos = pos[:-1]
+        if not (word.isalpha() and pos.isalpha() and pos.islower()):
+            return None
+        return word.decode('ascii'), pos.decode('ascii'), definition.decode('utf-8')
 
-    def process_word_batch(self, word_batch: List[Tuple[str, str, str]]) -> List[str]:
-        """Process batch with maximum parallelization."""
+    async def process_word_batch(self, word_batch: List[Tuple[str, str, str]]) -> List[str]:
+        """Process batch with maximum concurrency."""
         results = []
         
-        def process_single_word(word_data):
-            word, pos, definition = word_data
+        async def process_micro_batch(items):
             try:
-                start = time.time()
-                result = self.enrich_word_ultra_fast(word, pos, definition)
-                elapsed = time.time() - start
+                enriched = await self.enrich_words_batched(items)
                 
-                with self.progress_lock:
-                    self.processed_count += 1
-                    if self.processed_count % 25 == 0:
-                        total_elapsed = time.time() - self.start_time
-                        rate = self.processed_count / total_elapsed * 60
-                        eta = (5000 - self.processed_count) / (rate / 60) / 60 if rate > 0 else 0
-                        print(f"⚡ {self.processed_count} words | {rate:.1f}/min | ETA: {eta:.1f}min")
-                
-                return (word, result, elapsed)
+                # Single-threaded event loop: a plain counter, reported by report_progress
+                self.processed_count += len(items)
+                return enriched
             except Exception as e:
-                print(f"❌ {word}: {e}")
-                self.failed_words.append(word)
+                words = [word for word, _, _ in items]
+                print(f"❌ {', '.join(words)}: {e}")
+                self.failed_words.extend(words)
                 return None
         
-        # Ultra-parallel processing
-        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-            futures = {executor.submit(process_single_word, word_data): word_data for word_data in word_batch}
-            
-            for future in as_completed(futures):
-                result = future.result()
-                if result:
-                    word, enriched_text, elapsed = result
-                    results.append(enriched_text)
+        # All micro-batches in flight at once (MICRO_BATCH_SIZE words per request);
+        # the client caps concurrent requests at MAX_WORKERS.
+        micro_batches = [word_batch[i:i+MICRO_BATCH_SIZE] for i in range(0, len(word_batch), MICRO_BATCH_SIZE)]
+        for enriched_texts in await asyncio.gather(*(process_micro_batch(items) for items in micro_batches)):
+            if enriched_texts:
+                results.extend(enriched_texts)
         
         return results
 
     def save_progress(self, processed_count: int, total_count: int, last_word: str):
-        """Save progress and cache."""
+        """Save progress and checkpoint the cache."""
         progress = {
             "processed_count": processed_count,
             "total_count": total_count,
@@ -209,13 +380,55 @@ class UltraFastEnricher:
             "output_file": OUTPUT_FILE,
             "failed_words": self.failed_words
         }
-        with open(PROGRESS_FILE, 'w') as f:
-            json.dump(progress, f, indent=2)
+        with open(PROGRESS_FILE, 'wb') as f:
+            f.write(dump_json(progress, indent=True))
         
-        self.save_cache()
+        self.checkpoint_cache()
+
+    def iter_word_batches(self, max_words: Optional[int] = None):
+        """Yield BATCH_SIZE lists of parsed words, read lazily from a memory map of the input."""
+        with open(INPUT_FILE, 'rb') as f:
+            if not os.fstat(f.fileno()).st_size:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                words = filter(None, map(self.parse_word_line, iter(mm.readline, b'')))
+                if max_words:
+                    words = islice(words, max_words)
+                while True:
+                    batch = list(islice(words, BATCH_SIZE))
+                    if not batch:
+                        return
+                    yield batch
 
     def process_all_words_ultra_fast(self, max_words: Optional[int] = None):
         """Ultra-fast processing with all optimizations."""
+        return asyncio.run(self.process_all_words_async(max_words))
+
+    async def report_progress(self):
+        """Print throughput every REPORT_INTERVAL seconds while words are completing."""
+        reported = 0
+        while True:
+            await asyncio.sleep(REPORT_INTERVAL)
+            processed = self.processed_count
+            if processed == reported:
+                continue
+            reported = processed
+            total_elapsed = time.perf_counter() - self.start_time
+            rate = processed / total_elapsed * 60
+            eta = (5000 - processed) / (rate / 60) / 60 if rate > 0 else 0
+            print(f"⚡ {processed} words | {rate:.1f}/min | ETA: {eta:.1f}min")
+
+    async def process_all_words_async(self, max_words: Optional[int] = None):
+        """Run the whole enrichment on one event loop."""
+        reporter = asyncio.create_task(self.report_progress())
+        try:
+            await self.warm_up()
+            return await self._process_all_words(max_words)
+        finally:
+            reporter.cancel()
+            await self.client.close()
+
+    async def _process_all_words(self, max_words: Optional[int] = None):
         print("🚀 Starting ULTRA-FAST enrichment process...")
         print(f"⚡ Target: 167 words/min (5000 words in 30 minutes)")
         
@@ -225,44 +438,31 @@ class UltraFastEnricher:
             shutil.copy2(OUTPUT_FILE, BACKUP_FILE)
             print(f"✅ Backup: {BACKUP_FILE}")
         
-        # Load all words
-        words_to_process = []
-        with open(INPUT_FILE, 'r', encoding='utf-8') as f:
-            for line in f:
-                parsed = self.parse_word_line(line)
-                if parsed:
-                    words_to_process.append(parsed)
-                    if max_words and len(words_to_process) >= max_words:
-                        break
-        
-        total_words = len(words_to_process)
-        print(f"📊 Processing: {total_words} words")
-        print(f"🔧 Config: {MAX_WORKERS} workers, {BATCH_SIZE} batch size, {TIMEOUT}s timeout")
+        total_words = 0  # Words read so far; the input is streamed, not pre-loaded
+        print(f"📊 Streaming words from {INPUT_FILE}" + (f" (max {max_words})" if max_words else ""))
+        print(f"🔧 Config: {MAX_WORKERS} concurrent requests, {BATCH_SIZE} batch size, "
+              f"{MICRO_BATCH_SIZE} words/request, {TIMEOUT}s/word timeout")
         
         # Ultra-fast batch processing
-        with open(OUTPUT_FILE, 'w', encoding='utf-8') as out_f:
-            for i in range(0, total_words, BATCH_SIZE):
-                batch = words_to_process[i:i+BATCH_SIZE]
-                batch_num = i // BATCH_SIZE + 1
-                total_batches = (total_words + BATCH_SIZE - 1) // BATCH_SIZE
+        # 1 MiB buffer; data only has to hit the disk at progress checkpoints
+        with open(OUTPUT_FILE, 'w', encoding='utf-8', buffering=1024*1024) as out_f:
+            for batch_num, batch in enumerate(self.iter_word_batches(max_words), 1):
+                total_words += len(batch)
+                print(f"🔄 Batch {batch_num} ({len(batch)} words, {total_words} read)")
                 
-                print(f"🔄 Batch {batch_num}/{total_batches} ({len(batch)} words)")
-                
-                batch_results = self.process_word_batch(batch)
+                batch_results = await self.process_word_batch(batch)
                 
                 # Write immediately
-                for result in batch_results:
-                    out_f.write(result)
-                
-                out_f.flush()
+                out_f.writelines(batch_results)
                 
                 # Save progress
                 if self.processed_count % PROGRESS_SAVE_INTERVAL == 0:
+                    out_f.flush()
                     last_word = batch[-1][0] if batch else "unknown"
                     self.save_progress(self.processed_count, total_words, last_word)
         
         # Final stats
-        elapsed = time.time() - self.start_time
+        elapsed = time.perf_counter() - self.start_time
         rate = self.processed_count / elapsed * 60
         
         print(f"\n🏁 ULTRA-FAST RESULTS:")
@@ -270,7 +470,7 @@ class UltraFastEnricher:
         print(f"   Time: {elapsed/60:.1f} minutes")
         print(f"   Rate: {rate:.1f} words/minute")
         print(f"   Failed: {len(self.failed_words)}")
-        print(f"   Cache hits: {len(self.cache)}")
+        print(f"   Cache hits: {self.cache_size()}")
         
         if rate > 0:
             estimated_time = 5000 / rate
@@ -301,7 +501,7 @@ def main():
         processed = enricher.process_all_words_ultra_fast(test_words)
         
     elif command == "--clean":
-        for file in [CACHE_FILE, PROGRESS_FILE]:
+        for file in [CACHE_FILE, CACHE_FILE + "-wal", CACHE_FILE + "-shm", LEGACY_CACHE_FILE, PROGRESS_FILE]:
             if os.path.exists(file):
                 os.remove(file)
                 print(f"🗑️  Cleaned: {file}")
@@ -2,20 +2,39 @@
 """
 Validated Vocabulary Enrichment System
 Incorporates comprehensive validation for output quality assurance
+Pure stdlib (orjson optional), so it also runs unchanged under PyPy: pypy3 validated_enricher.py ...
 """
 
 import re
-import subprocess
 import sys
 import json
 import os
 import time
-from typing import Tuple, Optional, List
+import queue
+import sqlite3
+import hashlib
+import random
+import math
+from array import array
+import socket
+import http.client
+import atexit
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from typing import Tuple, Optional, List, Dict
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
+from threading import Lock, Thread, BoundedSemaphore
+from itertools import islice
+from collections import deque
+from types import MappingProxyType
+
+try:
+    import orjson  # Optional: faster JSON encode/decode
+except ImportError:
+    orjson = None
 
 # Import our validation system
-from validation_system import VocabularyValidator, ValidationLevel, ValidationResult
+from validation_system import VocabularyValidator, ValidationLevel, ValidationResult, ScoreColumns
 
 # Configuration
 PROGRESS_FILE = "enrichment_progress.json"
@@ -23,119 +42,443 @@ INPUT_FILE = "grewordlist.txt"
 OUTPUT_FILE = "enriched_wordlist.txt"
 VALIDATION_REPORT_FILE = "validation_report.json"
 BACKUP_FILE = "enriched_wordlist_backup.txt"
+CACHE_FILE = "enrich_cache.db"     # Validated responses kept across runs
+
+# Ollama server (HTTP API); the model stays resident between requests
+OLLAMA_HOST = "localhost"
+OLLAMA_PORT = 11434
+KEEP_ALIVE = "30m"
 
 # Quality-focused settings with validation
-MAX_WORKERS = 6
 BATCH_SIZE = 20           # Smaller batches for better validation
+MAX_WORKERS = BATCH_SIZE  # Whole batch in progress; parsing and validation overlap the Ollama calls
+OLLAMA_NUM_PARALLEL = 4   # Keep equal to the server's OLLAMA_NUM_PARALLEL; more would just queue there against TIMEOUT
 TIMEOUT = 30              # Longer timeout for quality
+RETRY_BACKOFF = 0.5       # Seconds before the first retry after a timeout/server error; doubles each attempt
 PROGRESS_SAVE_INTERVAL = 10
 MODEL = "llama3.1:8b"
 MIN_QUALITY_THRESHOLD = 0.7  # Minimum acceptable quality score
 
+# Semantic cache: reuse a validated response from a closely related entry (abdicate/abdication)
+EMBED_MODEL = "nomic-embed-text"
+SEMANTIC_THRESHOLD = 0.92    # Minimum cosine similarity of "word definition" embeddings
+STEM_LENGTH = 4              # Only entries sharing this many leading letters are compared
+
+def dump_json(obj) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+def write_atomic(path: str, data: bytes):
+    """Write data to a temp file and swap it in, so a crash never leaves a partial file."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+# Log records are queued by workers and written to stdout by a single listener thread
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_queue = queue.Queue()
+logger.addHandler(QueueHandler(_log_queue))
+_log_listener = QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+_log_listener_lock = Lock()
+_log_listener_started = False
+
+def start_log_listener():
+    """Start the listener thread once (stopped, and the queue flushed, at exit); earlier records are kept queued."""
+    global _log_listener_started
+    with _log_listener_lock:
+        if not _log_listener_started:
+            _log_listener.start()
+            atexit.register(_log_listener.stop)
+            _log_listener_started = True
+
+# Compiled once: response tags, the cheap pre-parse check, and wordlist lines
+_RESPONSE_TAG_RE = re.compile(r'(SYNONYMS|ANTONYMS|SENTENCE[123]|ORIGIN):(.*)', re.IGNORECASE)
+_QUICK_TAG_RE = re.compile(r'^(SYNONYMS:|ANTONYMS:|SENTENCE)', re.IGNORECASE | re.MULTILINE)
+_WORD_LINE_RE = re.compile(r'^(\w+)\s+([a-z]+\.?)\s+(.+)$')
+_SENTENCE_SLOTS = {"SENTENCE1": 0, "SENTENCE2": 1, "SENTENCE3": 2}
+
+# Constant prompt text between the interpolated fields
+_PROMPT_WORD = 'For the word "'
+_PROMPT_POS = '" ('
+_PROMPT_MEANING = '), meaning "'
+_PROMPT_SENTENCE1 = """":
+
+Please provide exactly 5 synonyms and 5 antonyms that are actual words closely related to this specific word.
+Write 3 natural example sentences using the word appropriately.
+Provide accurate etymology with specific language origins.
+
+Format your response exactly as:
+SYNONYMS: word1, word2, word3, word4, word5
+ANTONYMS: word1, word2, word3, word4, word5
+SENTENCE1: [natural sentence using """
+_PROMPT_SENTENCE2 = """]
+SENTENCE2: [different sentence using """
+_PROMPT_SENTENCE3 = """]
+SENTENCE3: [third sentence using """
+_PROMPT_END = """]
+ORIGIN: [detailed etymology with language origins]
+
+Be specific to this word. Avoid generic responses."""
+
+# Sentences and origin only, for entries whose synonyms/antonyms come from a related cached entry
+_PROMPT_SENTENCES_ONLY = """":
+
+Write 3 natural example sentences using the word appropriately.
+Provide accurate etymology with specific language origins.
+
+Format your response exactly as:
+SENTENCE1: [natural sentence using """
+_REUSABLE_TAGS = ("SYNONYMS", "ANTONYMS")
+
+# Fallback tables: (definition keywords, required pos or None, values), checked in order
+_SYNONYM_RULES = (
+    ({'lower', 'degrade'}, None, ("degrade", "demean", "humiliate", "belittle", "diminish")),
+    ({'superior', 'leader'}, None, ("leader", "chief", "head", "director", "commander")),
+    ({'building', 'dwelling'}, None, ("structure", "edifice", "residence", "monastery", "compound")),
+    ({'give up', 'renounce'}, None, ("renounce", "relinquish", "surrender", "abandon", "forfeit")),
+    ({'body', 'cavity'}, None, ("torso", "midsection", "belly", "trunk", "core")),
+    ({'hate', 'repugnant'}, 'adj', ("detestable", "loathsome", "repulsive", "odious", "abhorrent")),
+    ({'act'}, 'n', ("action", "deed", "practice", "behavior", "conduct")),
+)
+_DEFAULT_SYNONYMS = ("related", "similar", "associated", "corresponding", "equivalent")
+
+_ANTONYM_RULES = (
+    ({'lower', 'degrade'}, None, ("elevate", "enhance", "dignify", "uplift", "honor")),
+    ({'superior', 'leader'}, None, ("subordinate", "follower", "servant", "underling", "inferior")),
+    ({'give up', 'renounce'}, None, ("claim", "assert", "maintain", "retain", "assume")),
+    ({'hate', 'repugnant'}, 'adj', ("lovable", "admirable", "appealing", "pleasant", "delightful")),
+    ({'temporary', 'suspension'}, None, ("permanent", "active", "ongoing", "continuous", "persistent")),
+)
+_DEFAULT_ANTONYMS = ("different", "opposite", "contrary", "unrelated", "distinct")
+
+_SENTENCE_RULES = (
+    ({'lower'}, None, (
+        "The scandal served to {word} the politician's reputation.",
+        "His arrogant behavior would only {word} him in the eyes of others.",
+        "The harsh criticism was intended to {word} her confidence.")),
+    ({'superior'}, None, (
+        "The {word} of the monastery was known for wisdom and compassion.",
+        "As {word}, she oversaw the daily operations of the community.",
+        "The role of {word} required both spiritual and administrative skills.")),
+    ({'building'}, None, (
+        "The ancient {word} stood majestically on the hillside.",
+        "Visitors often toured the historic {word} to learn about monastic life.",
+        "The {word} complex included libraries, gardens, and living quarters.")),
+)
+_DEFAULT_SENTENCES = (
+    "The study of {word} reveals important insights about the subject.",
+    "Understanding {word} is crucial for grasping the broader concept.",
+    "The term {word} appears frequently in academic literature.")
+
+# Known etymologies, built once and read-only
+_ETYMOLOGY = MappingProxyType({
+    'abase': 'From Old French "abaissier," derived from Latin "ad-" (to) + "bassus" (low), meaning to bring low or humble.',
+    'abbess': 'From Old French "abbesse," derived from Latin "abbatissa," feminine form of "abbas" meaning father or abbot.',
+    'abbey': 'From Old French "abbeie," derived from Latin "abbatia," meaning the jurisdiction of an abbot.',
+    'abbot': 'From Old English "abbod," derived from Latin "abbas," from Greek "abba" meaning father.',
+    'abdicate': 'From Latin "abdicare," meaning to disown or renounce, from "ab-" (away) + "dicare" (to declare).',
+    'abdomen': 'From Latin "abdomen," possibly from "abdere" meaning to hide, referring to the hidden internal cavity.',
+    'abdominal': 'From Latin "abdominalis," relating to the abdomen or belly region.',
+    'abduction': 'From Latin "abductio," from "abducere" meaning to lead away, from "ab-" (away) + "ducere" (to lead).',
+    # ... (include all the etymologies from quality_enricher.py)
+})
+
+# Every keyword above in one alternation; the lookahead also reports overlapping matches
+_FALLBACK_KEYWORDS = sorted({kw for rules in (_SYNONYM_RULES, _ANTONYM_RULES, _SENTENCE_RULES)
+                             for keywords, _, _ in rules for kw in keywords})
+_FALLBACK_KEYWORD_RE = re.compile('(?=(' + '|'.join(map(re.escape, _FALLBACK_KEYWORDS)) + '))')
+
+def classify_definition(dlo: str) -> frozenset:
+    """Return the fallback keywords that occur in a lowercased definition."""
+    return frozenset(_FALLBACK_KEYWORD_RE.findall(dlo))
+
+def match_fallback(rules, keywords: frozenset, pos: str, default):
+    """Return the values of the first rule whose keywords (and pos) match."""
+    for rule_keywords, rule_pos, values in rules:
+        if (rule_pos is None or rule_pos == pos) and not rule_keywords.isdisjoint(keywords):
+            return values
+    return default
+
 class ValidatedEnricher:
     def __init__(self, validation_level: ValidationLevel = ValidationLevel.INTERMEDIATE):
+        start_log_listener()
         self.write_lock = Lock()
         self.progress_lock = Lock()
         self.processed_count = 0
-        self.failed_words = []
+        self.failed_words = deque()  # appended from worker threads without the lock
         self.start_time = time.time()
         self.quality_stats = {
             "good_responses": 0, 
             "fallback_used": 0,
             "validation_passed": 0,
             "validation_failed": 0,
-            "retry_attempts": 0
+            "retry_attempts": 0,
+            "cache_hits": 0,
+            "shortcut_used": 0,
+            "semantic_hits": 0
         }
-        self.validation_results = []
+        self.validation_results = deque(maxlen=100)  # Only the latest details are reported
+        # Running totals so averages never rescan validation_results
+        self.score_total = 0.0
+        self.scored_count = 0
+        self.score_columns = ScoreColumns()  # Every word's component scores, for the final distribution
+        # Keep-alive HTTP connections to Ollama, reused across workers and batches
+        self.connection_pool = queue.LifoQueue(maxsize=OLLAMA_NUM_PARALLEL)
+        self.request_slots = BoundedSemaphore(OLLAMA_NUM_PARALLEL)  # Requests the server runs at once
+        # One executor for the whole run; workers only wait on Ollama sockets
+        self.executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        self.cache_lock = Lock()
+        self.init_cache()
         
         # Initialize validator
         self.validator = VocabularyValidator(validation_level)
-        print(f"🎯 Using quality model: {MODEL}")
-        print(f"🔍 Validation level: {validation_level.value}")
-        print(f"📊 Quality threshold: {MIN_QUALITY_THRESHOLD}")
+        logger.info(f"🎯 Using quality model: {MODEL}")
+        logger.info(f"🔍 Validation level: {validation_level.value}")
+        logger.info(f"📊 Quality threshold: {MIN_QUALITY_THRESHOLD}")
+
+    def init_cache(self):
+        """Open the response cache database in WAL mode and create its table."""
+        self.db = db = sqlite3.connect(CACHE_FILE, isolation_level=None, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("""CREATE TABLE IF NOT EXISTS cache (
+            key TEXT PRIMARY KEY,
+            response TEXT NOT NULL,
+            score REAL NOT NULL
+        )""")
+        # Unit-length embeddings of cached entries, grouped by stem for the semantic lookup
+        # Tables from before the POS column are dropped; only same-POS entries may be reused
+        columns = {row[1] for row in db.execute("PRAGMA table_info(embeddings)")}
+        if columns and "pos" not in columns:
+            db.execute("DROP TABLE embeddings")
+        db.execute("""CREATE TABLE IF NOT EXISTS embeddings (
+            key TEXT PRIMARY KEY,
+            word TEXT NOT NULL,
+            pos TEXT NOT NULL,
+            stem TEXT NOT NULL,
+            vector BLOB NOT NULL
+        )""")
+        db.execute("CREATE INDEX IF NOT EXISTS embeddings_stem ON embeddings(stem)")
+        self.semantic_cache = True
+
+    def get_cache_key(self, word: str, pos: str, definition: str) -> str:
+        """Cache key for one model/entry pair."""
+        return hashlib.blake2b(f"{MODEL}|{word}|{pos}|{definition}".encode(), digest_size=16).hexdigest()
+
+    def lookup_cache(self, cache_key: str) -> str:
+        """Return a previously validated response for this entry, else ""."""
+        with self.cache_lock:
+            row = self.db.execute("SELECT response FROM cache WHERE key = ?", (cache_key,)).fetchone()
+        return row[0] if row else ""
+
+    def store_cache(self, cache_key: str, response: str, score: float,
+                    word: str, pos: str, vector: Optional[array] = None):
+        """Remember a response that passed validation (and its embedding, if any)."""
+        with self.cache_lock:
+            self.db.execute("INSERT OR REPLACE INTO cache (key, response, score) VALUES (?, ?, ?)",
+                            (cache_key, response, score))
+            if vector is not None:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO embeddings (key, word, pos, stem, vector) VALUES (?, ?, ?, ?, ?)",
+                    (cache_key, word.lower(), pos, word.lower()[:STEM_LENGTH], vector.tobytes()))
+
+    def embed_entry(self, word: str, definition: str) -> Optional[array]:
+        """Unit-length embedding of an entry, or None when the embedding model is unavailable."""
+        if not self.semantic_cache:
+            return None
+        try:
+            result = self.post_ollama("/api/embeddings", {
+                "model": EMBED_MODEL,
+                "prompt": f"{word} {definition}",
+                "keep_alive": KEEP_ALIVE
+            })
+            values = result["embedding"]
+        except Exception as e:
+            with self.cache_lock:
+                if self.semantic_cache:
+                    self.semantic_cache = False
+                    logger.warning(f"⚠️  Semantic cache disabled ({EMBED_MODEL} unavailable: {e!r})")
+            return None
+        
+        norm = math.sqrt(sum(v * v for v in values))
+        return array('f', (v / norm for v in values)) if norm else None
 
-    def call_ollama_validated(self, prompt: str, word: str) -> str:
-        """Quality-focused Ollama call with validation retry logic."""
+    def lookup_similar(self, word: str, pos: str, vector: array) -> str:
+        """Return the SYNONYMS/ANTONYMS lines of a related same-POS cached entry, else ""."""
+        word_lower = word.lower()
+        with self.cache_lock:
+            rows = self.db.execute(
+                "SELECT e.vector, c.response FROM embeddings e JOIN cache c ON c.key = e.key "
+                "WHERE e.stem = ? AND e.pos = ? AND e.word != ?",
+                (word_lower[:STEM_LENGTH], pos, word_lower)).fetchall()
+        
+        best_score, best = 0.0, ""
+        for blob, response in rows:
+            other_vector = array('f')
+            other_vector.frombytes(blob)
+            if len(other_vector) != len(vector):
+                continue
+            score = sum(a * b for a, b in zip(vector, other_vector))
+            if score > best_score:
+                best_score, best = score, response
+        
+        if best_score < SEMANTIC_THRESHOLD:
+            return ""
+        # Word lists carry over between related entries; sentences and origin name the word, so they are regenerated
+        lines = {}
+        for line in best.splitlines():
+            match = _RESPONSE_TAG_RE.match(line.strip())
+            if match and match.group(1).upper() in _REUSABLE_TAGS:
+                lines.setdefault(match.group(1).upper(), line.strip())
+        if len(lines) < len(_REUSABLE_TAGS):
+            return ""
+        return "\n".join(lines[tag] for tag in _REUSABLE_TAGS)
+
+    def post_ollama(self, path: str, payload: Dict) -> Dict:
+        """POST a JSON payload to Ollama over a pooled keep-alive connection."""
+        with self.request_slots:
+            try:
+                conn = self.connection_pool.get_nowait()
+            except queue.Empty:
+                conn = http.client.HTTPConnection(OLLAMA_HOST, OLLAMA_PORT, timeout=TIMEOUT)
+            
+            try:
+                conn.request("POST", path, body=json.dumps(payload),
+                             headers={"Content-Type": "application/json"})
+                response = conn.getresponse()
+                body = response.read()
+            except Exception:
+                conn.close()
+                raise
+            
+            try:
+                self.connection_pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+        
+        if response.status != 200:
+            raise RuntimeError(f"Ollama returned HTTP {response.status}")
+        return json.loads(body)
+
+    def backoff(self, attempt: int):
+        """Sleep before a retry, exponentially longer each attempt, with jitter."""
+        time.sleep(RETRY_BACKOFF * 2 ** attempt + random.random() * 0.2)
+
+    def call_ollama_validated(self, prompt: str, word: str, reused: str = "") -> str:
+        """Quality-focused Ollama call with validation retry logic.
+        
+        reused holds SYNONYMS/ANTONYMS lines taken from a related entry; they are prepended to the answer.
+        """
         max_retries = 2
         
         for attempt in range(max_retries + 1):
             try:
-                result = subprocess.run(
-                    ["ollama", "run", MODEL],
-                    input=prompt,
-                    text=True,
-                    capture_output=True,
-                    timeout=TIMEOUT
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    response = result.stdout.strip()
+                result = self.post_ollama("/api/generate", {
+                    "model": MODEL,
+                    "prompt": prompt,
+                    "stream": False,
+                    "keep_alive": KEEP_ALIVE,
+                    "options": {
+                        "num_predict": 220,   # the structured answer is ~150 tokens
+                        "num_ctx": 1024,      # prompt + answer fit comfortably
+                        "temperature": 0.3,
+                        "top_p": 0.9,
+                        "mirostat": 0,
+                        "stop": ["SENTENCE4"]
+                    }
+                })
+                response = result.get("response", "").strip()
+                if response:
+                    if reused:
+                        response = reused + "\n" + response
                     
                     # Quick validation check before returning
                     if self.quick_response_check(response, word):
                         return response
                     elif attempt < max_retries:
-                        print(f"🔄 Response validation failed for {word}, retrying ({attempt + 1}/{max_retries})")
+                        logger.info(f"🔄 Response validation failed for {word}, retrying ({attempt + 1}/{max_retries})")
                         self.quality_stats["retry_attempts"] += 1
                         continue
                     else:
-                        print(f"⚠️  Final attempt failed validation for {word}, using fallback")
+                        logger.warning(f"⚠️  Final attempt failed validation for {word}, using fallback")
                         return ""
                 else:
                     if attempt < max_retries:
-                        print(f"🔄 No response for {word}, retrying ({attempt + 1}/{max_retries})")
+                        logger.info(f"🔄 No response for {word}, retrying ({attempt + 1}/{max_retries})")
+                        self.backoff(attempt)
                         continue
                     else:
-                        print(f"⚠️  No response for {word} after retries, using fallback")
+                        logger.warning(f"⚠️  No response for {word} after retries, using fallback")
                         return ""
                         
-            except subprocess.TimeoutExpired:
+            except socket.timeout:
                 if attempt < max_retries:
-                    print(f"⏰ Timeout for {word}, retrying ({attempt + 1}/{max_retries})")
+                    logger.warning(f"⏰ Timeout for {word}, retrying ({attempt + 1}/{max_retries})")
+                    self.backoff(attempt)
                     continue
                 else:
-                    print(f"⏰ Final timeout for {word}, using fallback")
+                    logger.warning(f"⏰ Final timeout for {word}, using fallback")
+                    return ""
+            except (RuntimeError, ConnectionError) as e:
+                # Server overloaded or restarting: give it room before trying again
+                if attempt < max_retries:
+                    logger.warning(f"⏳ {e} for {word}, retrying ({attempt + 1}/{max_retries})")
+                    self.backoff(attempt)
+                    continue
+                else:
+                    logger.warning(f"❌ {e} for {word}, using fallback")
                     return ""
             except Exception as e:
-                print(f"❌ Error for {word}: {e}")
+                logger.warning(f"❌ Error for {word}: {e}")
                 return ""
         
         return ""
 
     def quick_response_check(self, response: str, word: str) -> bool:
         """Quick validation to check if response is worth processing."""
-        lines = response.split('\n')
-        has_synonyms = any(line.upper().startswith('SYNONYMS:') for line in lines)
-        has_antonyms = any(line.upper().startswith('ANTONYMS:') for line in lines)
-        has_sentences = any(line.upper().startswith('SENTENCE') for line in lines)
+        found = {tag.upper() for tag in _QUICK_TAG_RE.findall(response)}
+        has_synonyms = 'SYNONYMS:' in found
+        has_antonyms = 'ANTONYMS:' in found
+        has_sentences = 'SENTENCE' in found
         
         return has_synonyms and has_antonyms and has_sentences
 
     def enrich_word_validated(self, word: str, pos: str, definition: str) -> Tuple[str, Optional[dict]]:
         """High-quality enrichment with comprehensive validation."""
         
-        # Enhanced prompt for better quality
-        prompt = f"""For the word "{word}" ({pos}), meaning "{definition}":
-
-Please provide exactly 5 synonyms and 5 antonyms that are actual words closely related to this specific word.
-Write 3 natural example sentences using the word appropriately.
-Provide accurate etymology with specific language origins.
-
-Format your response exactly as:
-SYNONYMS: word1, word2, word3, word4, word5
-ANTONYMS: word1, word2, word3, word4, word5
-SENTENCE1: [natural sentence using {word}]
-SENTENCE2: [different sentence using {word}]
-SENTENCE3: [third sentence using {word}]
-ORIGIN: [detailed etymology with language origins]
-
-Be specific to this word. Avoid generic responses."""
-
-        response = self.call_ollama_validated(prompt, word)
+        # Definition scanned once; drives both the shortcut and the quality fallbacks
+        keywords = classify_definition(definition.lower())
+        
+        cache_key = self.get_cache_key(word, pos, definition)
+        response = self.lookup_cache(cache_key)
+        cached = bool(response)
+        vector = None
+        if cached:
+            self.quality_stats["cache_hits"] += 1
+        elif self.can_shortcut(word, keywords):
+            self.quality_stats["shortcut_used"] += 1
+        else:
+            vector = self.embed_entry(word, definition)
+            reused = self.lookup_similar(word, pos, vector) if vector is not None else ""
+            if reused:
+                self.quality_stats["semantic_hits"] += 1
+                prompt = "".join((_PROMPT_WORD, word, _PROMPT_POS, pos, _PROMPT_MEANING, definition,
+                                  _PROMPT_SENTENCES_ONLY, word, _PROMPT_SENTENCE2, word, _PROMPT_SENTENCE3, word, _PROMPT_END))
+            else:
+                # Enhanced prompt for better quality
+                prompt = "".join((_PROMPT_WORD, word, _PROMPT_POS, pos, _PROMPT_MEANING, definition,
+                                  _PROMPT_SENTENCE1, word, _PROMPT_SENTENCE2, word, _PROMPT_SENTENCE3, word, _PROMPT_END))
+            response = self.call_ollama_validated(prompt, word, reused)
         
         # Quality-based fallbacks
-        synonyms = self.get_quality_synonyms(word, pos, definition)
-        antonyms = self.get_quality_antonyms(word, pos, definition)
-        sentences = self.get_quality_sentences(word, pos, definition)
+        synonyms = self.get_quality_synonyms(word, pos, keywords)
+        antonyms = self.get_quality_antonyms(word, pos, keywords)
+        sentences = self.get_quality_sentences(word, pos, keywords)
         etymology = self.get_quality_etymology(word, definition)
         
         ai_response_used = False
@@ -158,7 +501,7 @@ Be specific to this word. Avoid generic responses."""
         while len(antonyms) < 5:
             antonyms.append(f"antonym{len(antonyms)+1}")
         
-        # COMPREHENSIVE VALIDATION
+        # COMPREHENSIVE VALIDATION (in this thread: a process-pool round trip costs more GIL time than it saves)
         validation_result = self.validator.validate_word_complete(
             word, pos, definition, synonyms, antonyms, sentences, etymology
         )
@@ -183,75 +526,59 @@ Be specific to this word. Avoid generic responses."""
         # Track validation statistics
         if validation_result.overall_score >= MIN_QUALITY_THRESHOLD:
             self.quality_stats["validation_passed"] += 1
+            if ai_response_used and not cached:
+                self.store_cache(cache_key, response, validation_result.overall_score, word, pos, vector)
         else:
             self.quality_stats["validation_failed"] += 1
-            print(f"⚠️  Low quality score for {word}: {validation_result.overall_score:.2f}")
+            logger.warning(f"⚠️  Low quality score for {word}: {validation_result.overall_score:.2f}")
         
         # Format output
-        output = f"Word: {word};{definition}\n"
-        output += f"Meaning: {definition}\n\n"
-        output += "Synonyms:\n\n"
-        
-        for i, synonym in enumerate(synonyms[:5], 1):
-            output += f"\t{i}.\t{synonym}\n"
-        
-        output += "\nAntonyms:\n\n"
-        
-        for i, antonym in enumerate(antonyms[:5], 1):
-            output += f"\t{i}.\t{antonym}\n"
-        
-        output += "\nSentences:\n\n"
-        
-        for i, sentence in enumerate(sentences[:3], 1):
-            output += f"\t{i}.\t{sentence}\n"
-        
-        output += f"\nOrigin:\n{etymology}\n\n"
-        
-        return output, validation_data
+        chunks = [f"Word: {word};{definition}\n", f"Meaning: {definition}\n\n", "Synonyms:\n\n"]
+        chunks.extend(f"\t{i}.\t{synonym}\n" for i, synonym in enumerate(synonyms[:5], 1))
+        chunks.append("\nAntonyms:\n\n")
+        chunks.extend(f"\t{i}.\t{antonym}\n" for i, antonym in enumerate(antonyms[:5], 1))
+        chunks.append("\nSentences:\n\n")
+        chunks.extend(f"\t{i}.\t{sentence}\n" for i, sentence in enumerate(sentences[:3], 1))
+        chunks.append(f"\nOrigin:\n{etymology}\n\n")
+        
+        return "".join(chunks), validation_data
+
+    def can_shortcut(self, word: str, keywords: frozenset) -> bool:
+        """True when curated etymology and a keyword fallback already cover this word."""
+        return bool(keywords) and word.lower() in _ETYMOLOGY
 
     def parse_ai_response(self, response: str, word: str) -> Optional[Tuple[List[str], List[str], List[str], str]]:
         """Parse and validate AI response."""
-        lines = response.split('\n')
-        synonyms = []
-        antonyms = []
+        word_lower = word.lower()
+        word_lists = {"SYNONYMS": [], "ANTONYMS": []}
         sentences = ["", "", ""]
         etymology = ""
         
-        for line in lines:
+        for line in response.splitlines():
             line = line.strip()
-            if line.upper().startswith('SYNONYMS:'):
-                syn_text = line[9:].strip()
-                if syn_text and ',' in syn_text:
-                    parsed_syns = [s.strip() for s in syn_text.split(',') if s.strip() and len(s.strip()) > 1]
-                    if len(parsed_syns) >= 4:
-                        synonyms = parsed_syns[:5]
-                        
-            elif line.upper().startswith('ANTONYMS:'):
-                ant_text = line[9:].strip()
-                if ant_text and ',' in ant_text:
-                    parsed_ants = [s.strip() for s in ant_text.split(',') if s.strip() and len(s.strip()) > 1]
-                    if len(parsed_ants) >= 4:
-                        antonyms = parsed_ants[:5]
+            if not line:
+                continue
+            match = _RESPONSE_TAG_RE.match(line)
+            if not match:
+                continue
+            tag = match.group(1).upper()
+            text = match.group(2).strip()
+            
+            if tag in word_lists:
+                if text and ',' in text:
+                    parsed = [s.strip() for s in text.split(',') if s.strip() and len(s.strip()) > 1]
+                    if len(parsed) >= 4:
+                        word_lists[tag] = parsed[:5]
                         
-            elif line.upper().startswith('SENTENCE1:'):
-                sent = line[10:].strip()
-                if sent and word.lower() in sent.lower() and len(sent) > 15:
-                    sentences[0] = sent
-                    
-            elif line.upper().startswith('SENTENCE2:'):
-                sent = line[10:].strip()
-                if sent and word.lower() in sent.lower() and len(sent) > 15:
-                    sentences[1] = sent
-                    
-            elif line.upper().startswith('SENTENCE3:'):
-                sent = line[10:].strip()
-                if sent and word.lower() in sent.lower() and len(sent) > 15:
-                    sentences[2] = sent
+            elif tag in _SENTENCE_SLOTS:
+                if text and word_lower in text.lower() and len(text) > 15:
+                    sentences[_SENTENCE_SLOTS[tag]] = text
                     
-            elif line.upper().startswith('ORIGIN:'):
-                etym = line[7:].strip()
-                if etym and len(etym) > 20:
-                    etymology = etym
+            elif text and len(text) > 20:  # ORIGIN
+                etymology = text
+        
+        synonyms = word_lists["SYNONYMS"]
+        antonyms = word_lists["ANTONYMS"]
         
         # Validate that we got good content
         if (len(synonyms) >= 4 and len(antonyms) >= 4 and 
@@ -261,85 +588,28 @@ Be specific to this word. Avoid generic responses."""
             return None
 
     # Keep the existing fallback methods from quality_enricher.py
-    def get_quality_synonyms(self, word: str, pos: str, definition: str) -> List[str]:
+    def get_quality_synonyms(self, word: str, pos: str, keywords: frozenset) -> List[str]:
         """Generate quality synonyms based on word analysis."""
-        if 'lower' in definition.lower() or 'degrade' in definition.lower():
-            return ["degrade", "demean", "humiliate", "belittle", "diminish"]
-        elif 'superior' in definition.lower() or 'leader' in definition.lower():
-            return ["leader", "chief", "head", "director", "commander"]
-        elif 'building' in definition.lower() or 'dwelling' in definition.lower():
-            return ["structure", "edifice", "residence", "monastery", "compound"]
-        elif 'give up' in definition.lower() or 'renounce' in definition.lower():
-            return ["renounce", "relinquish", "surrender", "abandon", "forfeit"]
-        elif 'body' in definition.lower() or 'cavity' in definition.lower():
-            return ["torso", "midsection", "belly", "trunk", "core"]
-        elif pos == 'adj' and ('hate' in definition.lower() or 'repugnant' in definition.lower()):
-            return ["detestable", "loathsome", "repulsive", "odious", "abhorrent"]
-        elif pos == 'n' and 'act' in definition.lower():
-            return ["action", "deed", "practice", "behavior", "conduct"]
-        else:
-            return ["related", "similar", "associated", "corresponding", "equivalent"]
+        return list(match_fallback(_SYNONYM_RULES, keywords, pos, _DEFAULT_SYNONYMS))
 
-    def get_quality_antonyms(self, word: str, pos: str, definition: str) -> List[str]:
+    def get_quality_antonyms(self, word: str, pos: str, keywords: frozenset) -> List[str]:
         """Generate quality antonyms based on word analysis."""
-        if 'lower' in definition.lower() or 'degrade' in definition.lower():
-            return ["elevate", "enhance", "dignify", "uplift", "honor"]
-        elif 'superior' in definition.lower() or 'leader' in definition.lower():
-            return ["subordinate", "follower", "servant", "underling", "inferior"]
-        elif 'give up' in definition.lower() or 'renounce' in definition.lower():
-            return ["claim", "assert", "maintain", "retain", "assume"]
-        elif pos == 'adj' and ('hate' in definition.lower() or 'repugnant' in definition.lower()):
-            return ["lovable", "admirable", "appealing", "pleasant", "delightful"]
-        elif 'temporary' in definition.lower() or 'suspension' in definition.lower():
-            return ["permanent", "active", "ongoing", "continuous", "persistent"]
-        else:
-            return ["different", "opposite", "contrary", "unrelated", "distinct"]
+        return list(match_fallback(_ANTONYM_RULES, keywords, pos, _DEFAULT_ANTONYMS))
 
-    def get_quality_sentences(self, word: str, pos: str, definition: str) -> List[str]:
+    def get_quality_sentences(self, word: str, pos: str, keywords: frozenset) -> List[str]:
         """Generate quality sentences with proper context."""
-        if 'lower' in definition.lower():
-            return [
-                f"The scandal served to {word} the politician's reputation.",
-                f"His arrogant behavior would only {word} him in the eyes of others.",
-                f"The harsh criticism was intended to {word} her confidence."
-            ]
-        elif 'superior' in definition.lower():
-            return [
-                f"The {word} of the monastery was known for wisdom and compassion.",
-                f"As {word}, she oversaw the daily operations of the community.",
-                f"The role of {word} required both spiritual and administrative skills."
-            ]
-        elif 'building' in definition.lower():
-            return [
-                f"The ancient {word} stood majestically on the hillside.",
-                f"Visitors often toured the historic {word} to learn about monastic life.",
-                f"The {word} complex included libraries, gardens, and living quarters."
-            ]
-        else:
-            return [
-                f"The study of {word} reveals important insights about the subject.",
-                f"Understanding {word} is crucial for grasping the broader concept.",
-                f"The term {word} appears frequently in academic literature."
-            ]
+        templates = match_fallback(_SENTENCE_RULES, keywords, pos, _DEFAULT_SENTENCES)
+        return [template.format(word=word) for template in templates]
 
     def get_quality_etymology(self, word: str, definition: str) -> str:
         """Generate quality etymology based on specific word knowledge."""
-        etymology_dict = {
-            'abase': 'From Old French "abaissier," derived from Latin "ad-" (to) + "bassus" (low), meaning to bring low or humble.',
-            'abbess': 'From Old French "abbesse," derived from Latin "abbatissa," feminine form of "abbas" meaning father or abbot.',
-            'abbey': 'From Old French "abbeie," derived from Latin "abbatia," meaning the jurisdiction of an abbot.',
-            'abbot': 'From Old English "abbod," derived from Latin "abbas," from Greek "abba" meaning father.',
-            'abdicate': 'From Latin "abdicare," meaning to disown or renounce, from "ab-" (away) + "dicare" (to declare).',
-            'abdomen': 'From Latin "abdomen," possibly from "abdere" meaning to hide, referring to the hidden internal cavity.',
-            'abdominal': 'From Latin "abdominalis," relating to the abdomen or belly region.',
-            'abduction': 'From Latin "abductio," from "abducere" meaning to lead away, from "ab-" (away) + "ducere" (to lead).',
-            # ... (include all the etymologies from quality_enricher.py)
-        }
-        
-        if word.lower() in etymology_dict:
-            return etymology_dict[word.lower()]
-        
-        # Fallback patterns with more accuracy
+        etymology = _ETYMOLOGY.get(word.lower())
+        if etymology:
+            return etymology
+        return self.etymology_by_suffix(word)
+
+    def etymology_by_suffix(self, word: str) -> str:
+        """Fallback etymology from the word's suffix."""
         if word.endswith('ess'):
             return f'The word "{word}" derives from Old French, with the suffix "-ess" indicating a female form or role.'
         elif word.endswith('ate') and len(word) > 4:
@@ -355,7 +625,7 @@ Be specific to this word. Avoid generic responses."""
         if not line:
             return None
         
-        match = re.match(r'^(\w+)\s+([a-z]+\.?)\s+(.+)$', line)
+        match = _WORD_LINE_RE.match(line)
         if match:
             return match.group(1), match.group(2).rstrip('.'), match.group(3)
         return None
@@ -372,44 +642,53 @@ Be specific to this word. Avoid generic responses."""
                 result, validation = self.enrich_word_validated(word, pos, definition)
                 elapsed = time.time() - start
                 
+                # Only the counters are mutated under the lock; formatting and printing happen outside it
                 with self.progress_lock:
                     self.processed_count += 1
+                    count = self.processed_count
                     if validation:
                         self.validation_results.append(validation)
+                        self.score_total += validation["overall_score"]
+                        self.score_columns.append(validation["synonym_score"], validation["antonym_score"],
+                                                  validation["sentence_score"], validation["etymology_score"])
+                        self.scored_count += 1
+                    scored = self.scored_count
+                    score_total = self.score_total
+                    passed = self.quality_stats["validation_passed"]
+                
+                if count % 5 == 0:
+                    total_elapsed = time.time() - self.start_time
+                    rate = count / total_elapsed * 60
                     
-                    if self.processed_count % 5 == 0:
-                        total_elapsed = time.time() - self.start_time
-                        rate = self.processed_count / total_elapsed * 60
-                        
-                        # Calculate quality metrics
-                        if self.validation_results:
-                            avg_score = sum(v["overall_score"] for v in self.validation_results) / len(self.validation_results)
-                            passed_pct = (self.quality_stats["validation_passed"] / self.processed_count) * 100
-                            print(f"🎯 {self.processed_count} words | {rate:.1f}/min | Avg Quality: {avg_score:.2f} | Pass Rate: {passed_pct:.1f}%")
-                        else:
-                            print(f"🎯 {self.processed_count} words | {rate:.1f}/min")
+                    # Calculate quality metrics
+                    if scored:
+                        avg_score = score_total / scored
+                        passed_pct = (passed / count) * 100
+                        logger.info(f"🎯 {count} words | {rate:.1f}/min | Avg Quality: {avg_score:.2f} | Pass Rate: {passed_pct:.1f}%")
+                    else:
+                        logger.info(f"🎯 {count} words | {rate:.1f}/min")
                 
                 return result, validation
             except Exception as e:
-                print(f"❌ Error processing {word}: {e}")
+                logger.warning(f"❌ Error processing {word}: {e}")
                 self.failed_words.append(word)
                 return None, None
         
-        # Process with validation
-        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-            futures = {executor.submit(process_single_word, word_data): word_data for word_data in word_batch}
-            
-            for future in as_completed(futures):
-                result = future.result()
-                if result[0]:  # If we got a result
-                    results.append(result[0])
-                    if result[1]:  # If we got validation data
-                        validation_data.append(result[1])
+        # Submit the whole batch at once so Ollama can schedule every prompt together
+        futures = {self.executor.submit(process_single_word, word_data): word_data for word_data in word_batch}
+        
+        for future in as_completed(futures):
+            result = future.result()
+            if result[0]:  # If we got a result
+                results.append(result[0])
+                if result[1]:  # If we got validation data
+                    validation_data.append(result[1])
         
         return results, validation_data
 
-    def save_progress_and_validation(self, processed_count: int, total_count: int, last_word: str):
-        """Save progress and validation results."""
+    def save_progress_and_validation(self, processed_count: int, total_count: int, last_word: str,
+                                     final: bool = False):
+        """Save progress and validation results (the final save adds the score distribution)."""
         # Save progress
         progress = {
             "processed_count": processed_count,
@@ -417,82 +696,102 @@ Be specific to this word. Avoid generic responses."""
             "last_word": last_word,
             "input_file": INPUT_FILE,
             "output_file": OUTPUT_FILE,
-            "failed_words": self.failed_words,
+            "failed_words": list(self.failed_words),
             "quality_stats": self.quality_stats
         }
-        with open(PROGRESS_FILE, 'w') as f:
-            json.dump(progress, f, indent=2)
+        write_atomic(PROGRESS_FILE, dump_json(progress))
         
         # Save validation report
-        if self.validation_results:
-            avg_score = sum(v["overall_score"] for v in self.validation_results) / len(self.validation_results)
+        if self.scored_count:
+            avg_score = self.score_total / self.scored_count
             
             validation_report = {
                 "summary": {
-                    "total_validated": len(self.validation_results),
+                    "total_validated": self.scored_count,
                     "average_score": avg_score,
                     "pass_rate": (self.quality_stats["validation_passed"] / processed_count) * 100 if processed_count > 0 else 0,
                     "ai_success_rate": (self.quality_stats["good_responses"] / processed_count) * 100 if processed_count > 0 else 0
                 },
-                "detailed_results": self.validation_results[-100:]  # Keep last 100 for space
+                "detailed_results": list(self.validation_results)
             }
+            if final:
+                validation_report["score_distribution"] = self.score_columns.summary(MIN_QUALITY_THRESHOLD)
             
-            with open(VALIDATION_REPORT_FILE, 'w') as f:
-                json.dump(validation_report, f, indent=2)
+            write_atomic(VALIDATION_REPORT_FILE, dump_json(validation_report))
+
+    def iter_word_batches(self, max_words: Optional[int] = None):
+        """Yield BATCH_SIZE lists of parsed words, read lazily from the input file."""
+        with open(INPUT_FILE, 'r', encoding='utf-8') as f:
+            words = filter(None, map(self.parse_word_line, f))
+            if max_words:
+                words = islice(words, max_words)
+            while True:
+                batch = list(islice(words, BATCH_SIZE))
+                if not batch:
+                    return
+                yield batch
+
+    def prefetch_batches(self, max_words: Optional[int] = None):
+        """Parse the next batches on a producer thread while the current one is enriched."""
+        batches = queue.Queue(maxsize=2)
+        
+        def produce():
+            try:
+                for batch in self.iter_word_batches(max_words):
+                    batches.put(batch)
+            except BaseException as e:
+                batches.put(e)  # Re-raised below, so a read error never looks like the end of input
+            else:
+                batches.put(None)
+        
+        Thread(target=produce, daemon=True).start()
+        for batch in iter(batches.get, None):
+            if isinstance(batch, BaseException):
+                raise batch
+            yield batch
 
     def process_all_words_validated(self, max_words: Optional[int] = None):
         """Validated processing with comprehensive quality control."""
-        print("🔍 Starting VALIDATED enrichment process...")
-        print(f"📊 Quality threshold: {MIN_QUALITY_THRESHOLD}")
-        print(f"🎯 Comprehensive validation enabled")
+        logger.info("🔍 Starting VALIDATED enrichment process...")
+        logger.info(f"📊 Quality threshold: {MIN_QUALITY_THRESHOLD}")
+        logger.info(f"🎯 Comprehensive validation enabled")
         
         # Backup existing file
         if os.path.exists(OUTPUT_FILE):
             import shutil
             shutil.copy2(OUTPUT_FILE, BACKUP_FILE)
-            print(f"✅ Backup created: {BACKUP_FILE}")
+            logger.info(f"✅ Backup created: {BACKUP_FILE}")
         
-        # Read all words
-        words_to_process = []
-        with open(INPUT_FILE, 'r', encoding='utf-8') as f:
-            for line in f:
-                parsed = self.parse_word_line(line)
-                if parsed:
-                    words_to_process.append(parsed)
-                    if max_words and len(words_to_process) >= max_words:
-                        break
-        
-        total_words = len(words_to_process)
-        print(f"📊 Total words to process: {total_words}")
-        print(f"🔧 Using {MAX_WORKERS} workers, batch size {BATCH_SIZE}")
+        total_words = 0  # Words read so far; the input is streamed, not pre-loaded
+        logger.info(f"📊 Streaming words from {INPUT_FILE}" + (f" (max {max_words})" if max_words else ""))
+        logger.info(f"🔧 Using {MAX_WORKERS} workers, {OLLAMA_NUM_PARALLEL} parallel requests, batch size {BATCH_SIZE}")
         
         # Validated batch processing
-        with open(OUTPUT_FILE, 'w', encoding='utf-8') as out_f:
-            for i in range(0, total_words, BATCH_SIZE):
-                batch = words_to_process[i:i+BATCH_SIZE]
-                batch_num = i // BATCH_SIZE + 1
-                total_batches = (total_words + BATCH_SIZE - 1) // BATCH_SIZE
-                
-                print(f"🔄 Processing batch {batch_num}/{total_batches} ({len(batch)} words)")
+        # 1 MiB buffer; results only have to reach the disk at progress checkpoints
+        with open(OUTPUT_FILE, 'w', encoding='utf-8', buffering=1024*1024) as out_f:
+            for batch_num, batch in enumerate(self.prefetch_batches(max_words), 1):
+                total_words += len(batch)
+                logger.info(f"🔄 Processing batch {batch_num} ({len(batch)} words, {total_words} read)")
                 
                 batch_results, batch_validations = self.process_word_batch(batch)
                 
-                # Write results immediately
-                for result in batch_results:
-                    out_f.write(result)
-                    out_f.flush()
+                out_f.writelines(batch_results)
                 
                 # Save progress and validation data
                 if self.processed_count % PROGRESS_SAVE_INTERVAL == 0:
+                    out_f.flush()
+                    os.fsync(out_f.fileno())
                     last_word = batch[-1][0] if batch else "unknown"
                     self.save_progress_and_validation(self.processed_count, total_words, last_word)
         
+        self.executor.shutdown()
+        
         # Final statistics
         elapsed = time.time() - self.start_time
         rate = self.processed_count / elapsed * 60
         
-        if self.validation_results:
-            avg_score = sum(v["overall_score"] for v in self.validation_results) / len(self.validation_results)
+        if self.scored_count:
+            avg_score = self.score_total / self.scored_count
             pass_rate = (self.quality_stats["validation_passed"] / self.processed_count) * 100
             ai_success_rate = (self.quality_stats["good_responses"] / self.processed_count) * 100
         else:
@@ -500,28 +799,33 @@ Be specific to this word. Avoid generic responses."""
             pass_rate = 0
             ai_success_rate = 0
         
-        print(f"\n🏆 VALIDATED ENRICHMENT COMPLETE!")
-        print(f"📊 Processed: {self.processed_count}/{total_words} words")
-        print(f"⏱️  Time elapsed: {elapsed/60:.1f} minutes")
-        print(f"⚡ Average rate: {rate:.1f} words/minute")
-        print(f"🎯 Average quality score: {avg_score:.2f}")
-        print(f"✅ Validation pass rate: {pass_rate:.1f}%")
-        print(f"🤖 AI success rate: {ai_success_rate:.1f}%")
-        print(f"🔄 Retry attempts: {self.quality_stats['retry_attempts']}")
-        print(f"❌ Failed words: {len(self.failed_words)}")
+        logger.info(f"\n🏆 VALIDATED ENRICHMENT COMPLETE!")
+        logger.info(f"📊 Processed: {self.processed_count}/{total_words} words")
+        logger.info(f"⏱️  Time elapsed: {elapsed/60:.1f} minutes")
+        logger.info(f"⚡ Average rate: {rate:.1f} words/minute")
+        logger.info(f"🎯 Average quality score: {avg_score:.2f}")
+        logger.info(f"✅ Validation pass rate: {pass_rate:.1f}%")
+        logger.info(f"🤖 AI success rate: {ai_success_rate:.1f}%")
+        logger.info(f"🔄 Retry attempts: {self.quality_stats['retry_attempts']}")
+        logger.info(f"💾 Cache hits: {self.quality_stats['cache_hits']}")
+        logger.info(f"⏭️  LLM calls skipped (shortcut): {self.quality_stats['shortcut_used']}")
+        logger.info(f"🧠 Semantic cache hits: {self.quality_stats['semantic_hits']}")
+        logger.info(f"❌ Failed words: {len(self.failed_words)}")
         
         # Final save
-        self.save_progress_and_validation(self.processed_count, total_words, "completed")
+        self.save_progress_and_validation(self.processed_count, total_words, "completed", final=True)
         
-        print(f"📈 Validation report saved to: {VALIDATION_REPORT_FILE}")
+        logger.info(f"📈 Validation report saved to: {VALIDATION_REPORT_FILE}")
         return self.processed_count
 
 def main():
+    start_log_listener()
     if len(sys.argv) < 2:
-        print("Usage:")
-        print("  python3 validated_enricher.py --validated [max_words]  # Validated processing")
-        print("  python3 validated_enricher.py --test [words]           # Test with validation")
-        print("  python3 validated_enricher.py --strict [words]         # Strict validation")
+        logger.info("Usage:")
+        logger.info("  python3 validated_enricher.py --validated [max_words]  # Validated processing")
+        logger.info("  python3 validated_enricher.py --test [words]           # Test with validation")
+        logger.info("  python3 validated_enricher.py --strict [words]         # Strict validation")
+        logger.info("  (pypy3 works too and speeds up parsing, fallbacks and formatting)")
         return
     
     command = sys.argv[1]
@@ -533,18 +837,18 @@ def main():
         
     elif command == "--test":
         test_words = int(sys.argv[2]) if len(sys.argv) > 2 else 5
-        print(f"🧪 Validated test with {test_words} words...")
+        logger.info(f"🧪 Validated test with {test_words} words...")
         enricher = ValidatedEnricher(ValidationLevel.INTERMEDIATE)
         enricher.process_all_words_validated(test_words)
         
     elif command == "--strict":
         test_words = int(sys.argv[2]) if len(sys.argv) > 2 else 5
-        print(f"🔒 Strict validation test with {test_words} words...")
+        logger.info(f"🔒 Strict validation test with {test_words} words...")
         enricher = ValidatedEnricher(ValidationLevel.COMPREHENSIVE)
         enricher.process_all_words_validated(test_words)
         
     else:
-        print("❌ Unknown command. Use --validated, --test, or --strict")
+        logger.info("❌ Unknown command. Use --validated, --test, or --strict")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -5,39 +5,102 @@ Enriches GRE words with synonyms, antonyms, examples, and etymology using Ollama
 """
 
 import re
-import subprocess
 import json
+import asyncio
 from typing import Dict, List, Tuple, Optional
-import time
 import os
+import sqlite3
+import hashlib
+from itertools import islice
+
+from ollama_client import OllamaClient
+
+# Ollama server (HTTP API); the model stays resident between requests
+OLLAMA_HOST = "localhost"
+OLLAMA_PORT = 11434
+TIMEOUT = 60
+MAX_WORKERS = 8   # Concurrent in-flight Ollama requests (one event loop); match OLLAMA_NUM_PARALLEL
+
+FLUSH_INTERVAL = 50  # Words written between output flushes
+CACHE_FILE = "word_enricher_cache.db"  # Enriched entries kept across runs
+
+# Compiled once: wordlist lines
+_WORD_LINE_RE = re.compile(r'^(\w+)\s+([a-z]+\.?)\s+(.+)$')
+
+# Prompt text around the interpolated fields; everything after the word is fixed per part of speech
+_PROMPT_WORD = 'For the word "'
+_PROMPT_AFTER_WORD = '" ({pos}), meaning "'
+_PROMPT_FIELDS = """", respond with a JSON object with these fields:
+
+"synonyms": exactly 5 synonyms (single words or short phrases, each {part})
+"antonyms": exactly 5 antonyms (single words or short phrases, each {part})
+"sentences": exactly 3 example sentences that use the word in its correct form and context, are clear and grammatically correct, demonstrate its meaning, and suit academic vocabulary learning
+"etymology": 1-2 concise sentences on the source language(s), historical development, and how it evolved to its current meaning"""
+
+# Parts of speech in the wordlist, named in their prompt; other tags get a generic template on first use
+_POS_PARTS = {'n': 'a noun', 'v': 'a verb', 'adj': 'an adjective', 'adv': 'an adverb',
+              'prep': 'a preposition', 'conj': 'a conjunction', 'interj': 'an interjection'}
+
+def build_prompt_template(pos: str, part: str) -> Tuple[str, str]:
+    """Prompt text that goes between the word and the definition, and after the definition."""
+    return _PROMPT_AFTER_WORD.format(pos=pos), _PROMPT_FIELDS.format(part=part)
+
+_PROMPT_TEMPLATES = {pos: build_prompt_template(pos, part) for pos, part in _POS_PARTS.items()}
+
+def prompt_template(pos: str) -> Tuple[str, str]:
+    """The precomputed prompt template for pos."""
+    template = _PROMPT_TEMPLATES.get(pos)
+    if template is None:
+        template = _PROMPT_TEMPLATES[pos] = build_prompt_template(pos, "of the same part of speech as the word")
+    return template
 
 class WordEnricher:
     def __init__(self, primary_model: str = "llama3.1:8b", validation_model: str = "qwen2.5:14b"):
         self.primary_model = primary_model
         self.validation_model = validation_model
+        # Keep-alive connections to Ollama, at most MAX_WORKERS requests in flight (aiohttp when
+        # installed); usable from any event loop, so the enrich_* coroutines can be awaited directly
+        self.client = OllamaClient(OLLAMA_HOST, OLLAMA_PORT, MAX_WORKERS, TIMEOUT)
+        self.init_cache()
+        
+    def init_cache(self):
+        """Open the enrichment cache database and create its table."""
+        self.db = sqlite3.connect(CACHE_FILE)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute("CREATE TABLE IF NOT EXISTS cache (key BLOB PRIMARY KEY, payload TEXT NOT NULL)")
+    
+    def get_cache_key(self, word: str, pos: str, definition: str) -> bytes:
+        """Cache key for one entry under the primary model."""
+        return hashlib.blake2b(f"{self.primary_model}|{word}|{pos}|{definition}".encode(), digest_size=16).digest()
+    
+    def lookup_cache(self, cache_key: bytes) -> Optional[str]:
+        """Return the cached enriched entry, or None."""
+        row = self.db.execute("SELECT payload FROM cache WHERE key = ?", (cache_key,)).fetchone()
+        return row[0] if row else None
+    
+    def store_cache(self, cache_key: bytes, payload: str):
+        """Cache an enriched entry (committed by the caller)."""
+        self.db.execute("INSERT OR REPLACE INTO cache (key, payload) VALUES (?, ?)", (cache_key, payload))
+        
+    async def call_ollama(self, model: str, prompt: str, max_retries: int = 3,
+                    response_format: Optional[str] = None) -> str:
+        """Call Ollama model with retry logic (response_format="json" constrains output to JSON)."""
+        payload = {"model": model, "prompt": prompt, "stream": False}
+        if response_format:
+            payload["format"] = response_format
         
-    def call_ollama(self, model: str, prompt: str, max_retries: int = 3) -> str:
-        """Call Ollama model with retry logic."""
         for attempt in range(max_retries):
             try:
-                result = subprocess.run(
-                    ["ollama", "run", model],
-                    input=prompt,
-                    text=True,
-                    capture_output=True,
-                    timeout=60
-                )
-                if result.returncode == 0:
-                    return result.stdout.strip()
-                else:
-                    print(f"Ollama error (attempt {attempt + 1}): {result.stderr}")
-            except subprocess.TimeoutExpired:
+                result = await self.client.post("/api/generate", payload)
+                return result.get("response", "").strip()
+            except TimeoutError:
                 print(f"Timeout on attempt {attempt + 1}")
             except Exception as e:
                 print(f"Error on attempt {attempt + 1}: {e}")
             
             if attempt < max_retries - 1:
-                time.sleep(2)
+                await asyncio.sleep(2)
         
         return ""
     
@@ -48,7 +111,7 @@ class WordEnricher:
             return None
             
         # Pattern: word part_of_speech. definition
-        match = re.match(r'^(\w+)\s+([a-z]+\.?)\s+(.+)$', line)
+        match = _WORD_LINE_RE.match(line)
         if match:
             word = match.group(1)
             pos = match.group(2).rstrip('.')
@@ -56,166 +119,131 @@ class WordEnricher:
             return word, pos, definition
         return None
     
-    def get_synonyms_antonyms(self, word: str, pos: str, definition: str) -> Tuple[List[str], List[str]]:
-        """Get 5 synonyms and 5 antonyms for the word."""
-        prompt = f"""For the word "{word}" ({pos}), meaning "{definition}", provide exactly 5 synonyms and 5 antonyms.
-
-Format your response as:
-SYNONYMS:
-1. synonym1
-2. synonym2
-3. synonym3
-4. synonym4
-5. synonym5
-
-ANTONYMS:
-1. antonym1
-2. antonym2
-3. antonym3
-4. antonym4
-5. antonym5
-
-Be precise and only provide single words or short phrases. Ensure they match the part of speech."""
+    async def get_enrichment(self, word: str, pos: str, definition: str) -> Tuple[List[str], List[str], List[str], str, bool]:
+        """Get 5 synonyms, 5 antonyms, 3 example sentences and the etymology in one JSON call.
         
-        response = self.call_ollama(self.primary_model, prompt)
+        The final flag is False when the model gave no usable answer and the lists are placeholders.
+        """
+        after_word, after_definition = prompt_template(pos)
+        prompt = "".join((_PROMPT_WORD, word, after_word, definition, after_definition))
         
-        synonyms = []
-        antonyms = []
+        response = await self.call_ollama(self.primary_model, prompt, response_format="json")
         
-        lines = response.split('\n')
-        current_section = None
+        try:
+            data = json.loads(response) if response else {}
+        except ValueError:
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
         
-        for line in lines:
-            line = line.strip()
-            if 'SYNONYMS:' in line.upper():
-                current_section = 'synonyms'
-            elif 'ANTONYMS:' in line.upper():
-                current_section = 'antonyms'
-            elif re.match(r'^\d+\.\s+(.+)', line):
-                match = re.match(r'^\d+\.\s+(.+)', line)
-                if match and current_section == 'synonyms' and len(synonyms) < 5:
-                    synonyms.append(match.group(1).strip())
-                elif match and current_section == 'antonyms' and len(antonyms) < 5:
-                    antonyms.append(match.group(1).strip())
+        def items(field: str, limit: int) -> List[str]:
+            values = data.get(field)
+            if not isinstance(values, list):
+                return []
+            return [text for text in (str(v).strip() for v in values) if text][:limit]
         
-        # Ensure we have exactly 5 of each
+        synonyms = items("synonyms", 5)
+        antonyms = items("antonyms", 5)
+        sentences = items("sentences", 3)
+        etymology = str(data.get("etymology") or "").replace('\n', ' ').strip()
+        usable = bool(synonyms and antonyms and sentences)
+        
+        # Ensure we have exactly 5 synonyms/antonyms and 3 sentences
         while len(synonyms) < 5:
             synonyms.append(f"synonym{len(synonyms)+1}")
         while len(antonyms) < 5:
             antonyms.append(f"antonym{len(antonyms)+1}")
-            
-        return synonyms[:5], antonyms[:5]
-    
-    def get_example_sentences(self, word: str, pos: str, definition: str) -> List[str]:
-        """Get 3 example sentences using the word."""
-        prompt = f"""Create exactly 3 example sentences using the word "{word}" ({pos}), meaning "{definition}".
-
-Each sentence should:
-- Use the word in its correct form and context
-- Be clear and grammatically correct
-- Demonstrate the meaning of the word
-- Be appropriate for academic vocabulary learning
-
-Format:
-1. [First sentence]
-2. [Second sentence]
-3. [Third sentence]"""
-        
-        response = self.call_ollama(self.primary_model, prompt)
-        
-        sentences = []
-        for line in response.split('\n'):
-            line = line.strip()
-            match = re.match(r'^\d+\.\s+(.+)', line)
-            if match and len(sentences) < 3:
-                sentences.append(match.group(1).strip())
-        
-        # Ensure we have exactly 3 sentences
         while len(sentences) < 3:
             sentences.append(f"This is an example sentence using {word}.")
-            
-        return sentences[:3]
-    
-    def get_etymology(self, word: str, definition: str) -> str:
-        """Get etymology/origin of the word."""
-        prompt = f"""Provide the etymology and origin of the word "{word}" meaning "{definition}".
-
-Include:
-- The source language(s)
-- Historical development
-- How it evolved to its current meaning
-
-Keep it concise but informative, in 1-2 sentences."""
-        
-        response = self.call_ollama(self.primary_model, prompt)
-        
-        if not response:
-            return f"The word {word} has an interesting etymological history that traces back to ancient linguistic roots."
-        
-        # Clean up the response
-        etymology = response.replace('\n', ' ').strip()
         if not etymology:
             etymology = f"The word {word} has an interesting etymological history that traces back to ancient linguistic roots."
             
-        return etymology
+        return synonyms, antonyms, sentences, etymology, usable
     
-    def enrich_word(self, word: str, pos: str, definition: str) -> str:
-        """Enrich a single word according to the template format."""
+    async def enrich_word(self, word: str, pos: str, definition: str) -> Tuple[str, bool]:
+        """Enrich a single word according to the template format; the flag says whether it may be cached."""
         print(f"Enriching: {word}")
         
-        synonyms, antonyms = self.get_synonyms_antonyms(word, pos, definition)
-        sentences = self.get_example_sentences(word, pos, definition)
-        etymology = self.get_etymology(word, definition)
-        
-        # Format according to template
-        output = f"Word: {word};{definition}\n"
-        output += f"Meaning: {definition}\n\n"
-        output += "Synonyms:\n\n"
-        
-        for i, synonym in enumerate(synonyms, 1):
-            output += f"\t{i}.\t{synonym};{definition}\n"
+        synonyms, antonyms, sentences, etymology, usable = await self.get_enrichment(word, pos, definition)
+        if not usable:
+            print(f"No usable response for {word}; writing placeholders, not cached")
         
-        output += "\nAntonyms:\n\n"
+        # Format according to template; parts are joined once at the end
+        parts = [f"Word: {word};{definition}\n", f"Meaning: {definition}\n\n", "Synonyms:\n\n"]
+        parts.extend(f"\t{i}.\t{synonym};{definition}\n" for i, synonym in enumerate(synonyms, 1))
+        parts.append("\nAntonyms:\n\n")
+        parts.extend(f"\t{i}.\t{antonym};{definition}\n" for i, antonym in enumerate(antonyms, 1))
+        parts.append("\nSentences:\n\n")
+        parts.extend(f"\t{i}.\t{sentence}\n" for i, sentence in enumerate(sentences, 1))
+        parts.append(f"\nOrigin:\n{etymology}\n\n")
         
-        for i, antonym in enumerate(antonyms, 1):
-            output += f"\t{i}.\t{antonym};{definition}\n"
-        
-        output += "\nSentences:\n\n"
-        
-        for i, sentence in enumerate(sentences, 1):
-            output += f"\t{i}.\t{sentence}\n"
-        
-        output += f"\nOrigin:\n{etymology}\n\n"
-        
-        return output
+        return "".join(parts), usable
+    
+    def iter_entries(self, lines):
+        """Yield (word, pos, definition) for each well-formed line, reporting the rest."""
+        for line_num, line in enumerate(lines, 1):
+            parsed = self.parse_word_line(line)
+            if parsed:
+                yield parsed
+            else:
+                print(f"Skipped malformed line {line_num}: {line.strip()}")
+    
+    async def enrich_entry(self, entry: Tuple[str, str, str]) -> Optional[Tuple[str, bool]]:
+        """Enrich one parsed entry (see enrich_word); None if it failed."""
+        word, pos, definition = entry
+        try:
+            return await self.enrich_word(word, pos, definition)
+        except Exception as e:
+            print(f"Error processing {word}: {e}")
+            return None
     
     def process_wordlist(self, input_file: str, output_file: str, max_words: Optional[int] = None):
         """Process the entire wordlist."""
+        return asyncio.run(self.process_wordlist_async(input_file, output_file, max_words))
+    
+    async def process_wordlist_async(self, input_file: str, output_file: str, max_words: Optional[int] = None):
+        """Run the whole wordlist on one event loop."""
+        try:
+            await self._process_wordlist(input_file, output_file, max_words)
+        finally:
+            await self.client.close()
+    
+    async def _process_wordlist(self, input_file: str, output_file: str, max_words: Optional[int] = None):
         processed_count = 0
         
-        with open(input_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        with open(output_file, 'w', encoding='utf-8') as out_f:
-            for line_num, line in enumerate(lines, 1):
-                parsed = self.parse_word_line(line)
-                if parsed:
-                    word, pos, definition = parsed
-                    try:
-                        enriched = self.enrich_word(word, pos, definition)
-                        out_f.write(enriched)
-                        out_f.flush()  # Ensure data is written immediately
-                        processed_count += 1
-                        print(f"Processed {processed_count}: {word}")
-                        
-                        if max_words and processed_count >= max_words:
-                            break
-                            
-                    except Exception as e:
-                        print(f"Error processing {word}: {e}")
-                        continue
-                else:
-                    print(f"Skipped malformed line {line_num}: {line.strip()}")
+        # Stream the input; output is buffered and flushed every FLUSH_INTERVAL words
+        with open(input_file, 'r', encoding='utf-8') as f, \
+             open(output_file, 'w', encoding='utf-8', buffering=1 << 16) as out_f:
+            entries = self.iter_entries(f)
+            if max_words:
+                entries = islice(entries, max_words)
+            
+            # Keep a bounded window of words in flight; gather() returns results in input order
+            while True:
+                window = list(islice(entries, MAX_WORKERS * 4))
+                if not window:
+                    break
+                # Cache lookups and writes stay outside the requests; only misses go to Ollama
+                keys = [self.get_cache_key(*entry) for entry in window]
+                cached = [self.lookup_cache(key) for key in keys]
+                misses = [entry for entry, payload in zip(window, cached) if payload is None]
+                fresh = iter(await asyncio.gather(*map(self.enrich_entry, misses)))
+                
+                for (word, _, _), key, enriched in zip(window, keys, cached):
+                    if enriched is None:
+                        result = next(fresh)
+                        if result is None:
+                            continue
+                        enriched, usable = result
+                        if usable:
+                            self.store_cache(key, enriched)
+                    out_f.write(enriched)
+                    processed_count += 1
+                    if processed_count % FLUSH_INTERVAL == 0:
+                        out_f.flush()
+                    print(f"Processed {processed_count}: {word}")
+                
+                self.db.commit()  # One transaction per window of new cache entries
         
         print(f"Processing complete! Enriched {processed_count} words.")
 
@@ -4,194 +4,208 @@ Generate an interactive word guessing game from enrichedpdfplan.txt
 """
 
 import re
+import sys
 import html
 import json
+import os
+import gzip
 import random
+import zlib
+import hashlib
+from functools import lru_cache
+from dataclasses import dataclass, field
 from pathlib import Path
 
+try:
+    import orjson  # Optional: faster JSON encode/decode
+except ImportError:
+    orjson = None
+
+# Compiled once: separator lines and the "1. " numbering on list items
+_SEP_RE = re.compile(r'-{10,}\Z')
+_NUM_PREFIX_RE = re.compile(r'^\d+\.\s*')
+
+# One entry: a "Word: " line and everything up to the next one (separator lines
+# are skipped by the parser), found in a single scan of the whole file
+_ENTRY_RE = re.compile(r'^[ \t]*Word: [^\n]*(?:\n(?![ \t]*Word: )[^\n]*)*', re.MULTILINE)
+
+# Page output: the final hint's multiple choice is picked and shuffled at build time
+GZIP_LEVEL = 6  # A pre-compressed copy (.html.gz) is written next to the page
+DISTRACTOR_COUNT = 3  # Wrong options shown next to the answer in the final hint
+DISTRACTOR_DRAWS = 50  # Random draws per word before falling back to listing the candidates
+
+# The built game data JSON is cached next to the input, keyed by a hash of its bytes,
+# so rebuilding the page from an unchanged list skips parsing and clue generation entirely
+GAME_DATA_CACHE_SUFFIX = ".game.json"
+GAME_DATA_CACHE_VERSION = 2  # Bump when parse_word_entry, build_game_data, the clues or dump_game_data change
+
+# Line dispatch: section headers by exact line, labelled fields by the text before ':'
+_SECTIONS = {'Synonyms:': 'synonyms', 'Antonyms:': 'antonyms', 'Sentences:': 'sentences'}
+_LABELS = {'Word': 'word', 'Meaning': 'meaning', 'Origin': 'origin'}
+
+# Text that the page only ever inserts with innerHTML is escaped once at build time;
+# '<' anywhere in the embedded JSON is written as \u003c so no string can close the <script>
+_HTML_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+_SCRIPT_SAFE_TABLE = str.maketrans({'<': '\\u003c'})
+
+# Clue templates, filled with the lowercased meaning; rhymes are keyed by the word's last 3 letters
+_RHYME_CLUES = {
+    'ate': "🎵 This word rhymes with 'fate' and means to {}",
+    'ous': "🎵 This '-ous' word describes something {}",
+    'ent': "🎵 This '-ent' word is about {}"
+}
+_SILLY_CLUES = (
+    "🤪 I'm what happens when {} gets fancy",
+    "😄 Imagine {} wearing a tuxedo - that's me!",
+    "🎭 I'm the drama queen version of {}"
+)
+
+@dataclass(slots=True)
+class WordEntry:
+    """One parsed word entry."""
+    word: str = ''
+    meaning: str = ''
+    synonyms: list[str] = field(default_factory=list)
+    antonyms: list[str] = field(default_factory=list)
+    sentences: list[str] = field(default_factory=list)
+    origin: str = ''
+
 def parse_word_entry(entry_text):
     """Parse a single word entry from the text."""
     lines = entry_text.strip().split('\n')
     
-    word_data = {
-        'word': '',
-        'meaning': '',
-        'synonyms': [],
-        'antonyms': [],
-        'sentences': [],
-        'origin': ''
-    }
+    word_data = WordEntry()
     
     current_section = None
     
-    for line in lines:
-        line = line.strip()
-        
-        if not line or re.match(r'^-{10,}$', line):
+    # Cheap first-character tests keep the regexes off most lines
+    for line in map(str.strip, lines):
+        if not line or (line[0] == '-' and _SEP_RE.match(line)):
             continue
             
-        if line.startswith('Word: '):
-            word_data = {
-                'word': '',
-                'meaning': '',
-                'synonyms': [],
-                'antonyms': [],
-                'sentences': [],
-                'origin': ''
-            }
+        section = _SECTIONS.get(line)
+        if section:
+            current_section = section
+            continue
+        
+        label, colon, rest = line.partition(':')
+        kind = _LABELS.get(label) if colon else None
+        
+        if kind == 'word' and rest.startswith(' '):
+            word_data = WordEntry()
             current_section = None
             
-            word_line = line[6:]
+            word_line = rest[1:]
             if ';' in word_line:
-                word_data['word'], word_data['meaning'] = word_line.split(';', 1)
+                word, word_data.meaning = word_line.split(';', 1)
             else:
-                word_data['word'] = word_line
-        elif line.startswith('Meaning: '):
-            word_data['meaning'] = line[9:]
-        elif line == 'Synonyms:':
-            current_section = 'synonyms'
-        elif line == 'Antonyms:':
-            current_section = 'antonyms'
-        elif line == 'Sentences:':
-            current_section = 'sentences'
-        elif line.startswith('Origin:'):
+                word = word_line
+            word_data.word = sys.intern(word)
+        elif kind == 'meaning' and rest.startswith(' '):
+            word_data.meaning = rest[1:]
+        elif kind == 'origin':
             current_section = 'origin'
-            if len(line) > 7:
-                word_data['origin'] = line[7:].strip()
-        elif line and current_section:
-            clean_line = re.sub(r'^\d+\.\s*', '', line)
-            clean_line = clean_line.strip()
+            if rest:
+                word_data.origin = rest.strip()
+        elif current_section:
+            clean_line = _NUM_PREFIX_RE.sub('', line, count=1) if line[0].isdigit() else line
             
             if current_section == 'origin':
-                if word_data['origin']:
-                    word_data['origin'] += ' ' + clean_line
+                if word_data.origin:
+                    word_data.origin += ' ' + clean_line
                 else:
-                    word_data['origin'] = clean_line
+                    word_data.origin = clean_line
             elif clean_line:
-                word_data[current_section].append(clean_line)
+                # Synonyms and antonyms recur across entries; interned, each is stored once
+                if current_section != 'sentences':
+                    clean_line = sys.intern(clean_line)
+                getattr(word_data, current_section).append(clean_line)
     
     return word_data
 
 def generate_funny_clues(word_data):
     """Generate funny and creative clues for the word."""
-    word = word_data['word'].lower()
-    meaning = word_data['meaning']
-    synonyms = word_data['synonyms']
-    antonyms = word_data['antonyms']
-    origin = word_data['origin']
-    
-    clues = []
-    
-    # Rhyme clue
-    if word.endswith('ate'):
-        clues.append(f"🎵 This word rhymes with 'fate' and means to {meaning.lower()}")
-    elif word.endswith('ous'):
-        clues.append(f"🎵 This '-ous' word describes something {meaning.lower()}")
-    elif word.endswith('ent'):
-        clues.append(f"🎵 This '-ent' word is about {meaning.lower()}")
-    
-    # Synonym riddle
-    if synonyms:
-        clue_synonyms = synonyms[:3]
-        clues.append(f"🔍 I'm buddies with {', '.join(clue_synonyms)}. What am I?")
-    
-    # Antonym riddle
-    if antonyms:
-        clue_antonyms = antonyms[:2]
-        clues.append(f"⚡ I'm the opposite of {' and '.join(clue_antonyms)}!")
-    
-    # Letter clue
-    clues.append(f"📝 I start with '{word[0].upper()}' and have {len(word)} letters")
-    
-    # Origin clue
-    if origin and 'Latin' in origin:
-        clues.append(f"🏛️ My ancestors spoke Latin, and I mean {meaning.lower()}")
-    
-    # Silly definition
-    silly_meanings = [
-        f"🤪 I'm what happens when {meaning.lower()} gets fancy",
-        f"😄 Imagine {meaning.lower()} wearing a tuxedo - that's me!",
-        f"🎭 I'm the drama queen version of {meaning.lower()}"
-    ]
-    clues.append(random.choice(silly_meanings))
-    
-    return clues
+    return list(build_clues(word_data.word.lower(), word_data.meaning,
+                            tuple(word_data.synonyms[:3]), tuple(word_data.antonyms[:2]),
+                            word_data.origin))
 
-def create_game_html(words_data):
-    """Create the interactive game HTML."""
+@lru_cache(maxsize=4096)
+def build_clues(word, meaning, synonyms, antonyms, origin):
+    """Clues for one word; memoized, so the silly clue is picked by a stable hash of the word."""
+    meaning_lower = meaning.lower()
     
-    # Convert words data to JSON for JavaScript
-    game_data = []
-    for word_data in words_data:
-        if word_data['word'] and word_data['meaning']:
-            clues = generate_funny_clues(word_data)
-            game_data.append({
-                'word': word_data['word'],
-                'meaning': word_data['meaning'],
-                'synonyms': word_data['synonyms'][:5],
-                'antonyms': word_data['antonyms'][:5],
-                'sentences': word_data['sentences'][:3],
-                'origin': word_data['origin'],
-                'clues': clues
-            })
+    # Rhyme, synonym riddle, antonym riddle, letter, origin and silly-definition clues
+    rhyme = _RHYME_CLUES.get(word[-3:])
+    silly = _SILLY_CLUES[zlib.crc32(word.encode('utf-8')) % len(_SILLY_CLUES)]
+    clues = (
+        rhyme.format(meaning_lower) if rhyme else None,
+        f"🔍 I'm buddies with {', '.join(synonyms)}. What am I?" if synonyms else None,
+        f"⚡ I'm the opposite of {' and '.join(antonyms)}!" if antonyms else None,
+        f"📝 I start with '{word[0].upper()}' and have {len(word)} letters",
+        f"🏛️ My ancestors spoke Latin, and I mean {meaning_lower}" if origin and 'Latin' in origin else None,
+        silly.format(meaning_lower)
+    )
     
-    html_content = f"""<!DOCTYPE html>
+    return tuple(clue for clue in clues if clue)
+
+# Page around the embedded game data: CSS, markup and the game script
+_GAME_HTML_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>🎮 Word Master Game</title>
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: 'Comic Sans MS', cursive, sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
             color: #333;
-        }}
+        }
         
-        .game-container {{
+        .game-container {
             max-width: 800px;
             margin: 0 auto;
             padding: 20px;
-        }}
+        }
         
-        .game-header {{
+        .game-header {
             text-align: center;
             background: white;
             border-radius: 20px;
             padding: 30px;
             margin-bottom: 30px;
             box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-        }}
+        }
         
-        .game-title {{
+        .game-title {
             font-size: 3em;
             color: #667eea;
             margin-bottom: 10px;
             text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
-        }}
+        }
         
-        .game-subtitle {{
+        .game-subtitle {
             font-size: 1.2em;
             color: #666;
             margin-bottom: 20px;
-        }}
+        }
         
-        .mode-selector {{
+        .mode-selector {
             display: flex;
             gap: 15px;
             justify-content: center;
             margin-bottom: 20px;
             flex-wrap: wrap;
-        }}
+        }
         
-        .mode-btn {{
+        .mode-btn {
             background: #667eea;
             color: white;
             border: none;
@@ -201,27 +215,27 @@ def create_game_html(words_data):
             cursor: pointer;
             transition: all 0.3s ease;
             font-family: inherit;
-        }}
+        }
         
-        .mode-btn:hover {{
+        .mode-btn:hover {
             background: #5a67d8;
             transform: translateY(-2px);
-        }}
+        }
         
-        .mode-btn.active {{
+        .mode-btn.active {
             background: #4c51bf;
             box-shadow: 0 5px 15px rgba(76, 81, 191, 0.4);
-        }}
+        }
         
-        .game-area {{
+        .game-area {
             background: white;
             border-radius: 20px;
             padding: 40px;
             box-shadow: 0 10px 30px rgba(0,0,0,0.2);
             text-align: center;
-        }}
+        }
         
-        .question-card {{
+        .question-card {
             background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
             color: white;
             padding: 30px;
@@ -229,9 +243,9 @@ def create_game_html(words_data):
             margin-bottom: 30px;
             font-size: 1.3em;
             line-height: 1.6;
-        }}
+        }
         
-        .clue {{
+        .clue {
             background: #fff3cd;
             color: #856404;
             padding: 15px;
@@ -239,25 +253,25 @@ def create_game_html(words_data):
             margin: 10px 0;
             border: 2px dashed #ffeaa7;
             font-size: 1.1em;
-        }}
+        }
         
-        .multiple-choice-clue {{
+        .multiple-choice-clue {
             background: linear-gradient(135deg, #e8f5e8 0%, #c6f6d5 100%);
             color: #22543d;
             border: 2px solid #38a169;
             padding: 20px;
             border-radius: 15px;
             font-weight: bold;
-        }}
+        }
         
-        .choice-options {{
+        .choice-options {
             display: flex;
             flex-direction: column;
             gap: 10px;
             margin-top: 15px;
-        }}
+        }
         
-        .choice-option {{
+        .choice-option {
             background: #38a169;
             color: white;
             padding: 12px 20px;
@@ -267,25 +281,25 @@ def create_game_html(words_data):
             transition: all 0.3s ease;
             text-align: left;
             border: 2px solid transparent;
-        }}
+        }
         
-        .choice-option:hover {{
+        .choice-option:hover {
             background: #2f855a;
             transform: translateY(-2px);
             box-shadow: 0 4px 12px rgba(56, 161, 105, 0.3);
-        }}
+        }
         
-        .choice-option.selected {{
+        .choice-option.selected {
             background: #2f855a;
             border-color: #22543d;
             box-shadow: 0 4px 12px rgba(56, 161, 105, 0.4);
-        }}
+        }
         
-        .input-area {{
+        .input-area {
             margin: 30px 0;
-        }}
+        }
         
-        .game-input {{
+        .game-input {
             padding: 15px;
             font-size: 1.2em;
             border: 3px solid #667eea;
@@ -294,22 +308,22 @@ def create_game_html(words_data):
             max-width: 400px;
             text-align: center;
             font-family: inherit;
-        }}
+        }
         
-        .game-input:focus {{
+        .game-input:focus {
             outline: none;
             box-shadow: 0 0 20px rgba(102, 126, 234, 0.3);
-        }}
+        }
         
-        .btn-group {{
+        .btn-group {
             display: flex;
             gap: 15px;
             justify-content: center;
             margin: 20px 0;
             flex-wrap: wrap;
-        }}
+        }
         
-        .game-btn {{
+        .game-btn {
             padding: 12px 25px;
             font-size: 1.1em;
             border: none;
@@ -317,175 +331,175 @@ def create_game_html(words_data):
             cursor: pointer;
             font-family: inherit;
             transition: all 0.3s ease;
-        }}
+        }
         
-        .submit-btn {{
+        .submit-btn {
             background: #48bb78;
             color: white;
-        }}
+        }
         
-        .submit-btn:hover {{
+        .submit-btn:hover {
             background: #38a169;
             transform: translateY(-2px);
-        }}
+        }
         
-        .hint-btn {{
+        .hint-btn {
             background: #ed8936;
             color: white;
-        }}
+        }
         
-        .hint-btn:hover {{
+        .hint-btn:hover {
             background: #dd6b20;
             transform: translateY(-2px);
-        }}
+        }
         
-        .skip-btn {{
+        .skip-btn {
             background: #e53e3e;
             color: white;
-        }}
+        }
         
-        .skip-btn:hover {{
+        .skip-btn:hover {
             background: #c53030;
             transform: translateY(-2px);
-        }}
+        }
         
-        .score-board {{
+        .score-board {
             display: flex;
             justify-content: space-around;
             background: #f7fafc;
             padding: 20px;
             border-radius: 15px;
             margin-bottom: 20px;
-        }}
+        }
         
-        .score-item {{
+        .score-item {
             text-align: center;
-        }}
+        }
         
-        .score-number {{
+        .score-number {
             font-size: 2em;
             font-weight: bold;
             color: #667eea;
-        }}
+        }
         
-        .score-label {{
+        .score-label {
             color: #666;
             font-size: 0.9em;
-        }}
+        }
         
-        .feedback {{
+        .feedback {
             padding: 20px;
             border-radius: 15px;
             margin: 20px 0;
             font-size: 1.2em;
             font-weight: bold;
-        }}
+        }
         
-        .correct {{
+        .correct {
             background: #c6f6d5;
             color: #22543d;
             border: 2px solid #38a169;
-        }}
+        }
         
-        .incorrect {{
+        .incorrect {
             background: #fed7d7;
             color: #742a2a;
             border: 2px solid #e53e3e;
-        }}
+        }
         
-        .answer-reveal {{
+        .answer-reveal {
             background: #bee3f8;
             color: #2a4365;
             border: 2px solid #3182ce;
             padding: 20px;
             border-radius: 15px;
             margin: 20px 0;
-        }}
+        }
         
-        .word-details {{
+        .word-details {
             text-align: left;
             margin-top: 15px;
-        }}
+        }
         
-        .detail-section {{
+        .detail-section {
             margin: 10px 0;
-        }}
+        }
         
-        .detail-title {{
+        .detail-title {
             font-weight: bold;
             color: #667eea;
-        }}
+        }
         
-        .synonym-tag, .antonym-tag {{
+        .synonym-tag, .antonym-tag {
             display: inline-block;
             padding: 5px 10px;
             margin: 3px;
             border-radius: 15px;
             font-size: 0.9em;
-        }}
+        }
         
-        .synonym-tag {{
+        .synonym-tag {
             background: #c6f6d5;
             color: #22543d;
-        }}
+        }
         
-        .antonym-tag {{
+        .antonym-tag {
             background: #fed7d7;
             color: #742a2a;
-        }}
+        }
         
-        .example-sentence {{
+        .example-sentence {
             background: #f7fafc;
             padding: 10px;
             border-radius: 8px;
             margin: 5px 0;
             border-left: 4px solid #667eea;
             font-style: italic;
-        }}
+        }
         
-        @keyframes bounce {{
-            0%, 20%, 60%, 100% {{
+        @keyframes bounce {
+            0%, 20%, 60%, 100% {
                 transform: translateY(0);
-            }}
-            40% {{
+            }
+            40% {
                 transform: translateY(-10px);
-            }}
-            80% {{
+            }
+            80% {
                 transform: translateY(-5px);
-            }}
-        }}
+            }
+        }
         
-        .bounce {{
+        .bounce {
             animation: bounce 1s;
-        }}
+        }
         
-        .hidden {{
+        .hidden {
             display: none;
-        }}
+        }
         
-        @media (max-width: 768px) {{
-            .game-container {{
+        @media (max-width: 768px) {
+            .game-container {
                 padding: 10px;
-            }}
+            }
             
-            .game-header, .game-area {{
+            .game-header, .game-area {
                 padding: 20px;
-            }}
+            }
             
-            .game-title {{
+            .game-title {
                 font-size: 2em;
-            }}
+            }
             
-            .mode-selector {{
+            .mode-selector {
                 flex-direction: column;
                 align-items: center;
-            }}
+            }
             
-            .btn-group {{
+            .btn-group {
                 flex-direction: column;
                 align-items: center;
-            }}
-        }}
+            }
+        }
     </style>
 </head>
 <body>
@@ -545,7 +559,20 @@ def create_game_html(words_data):
     </div>
 
     <script>
-        const gameData = {json.dumps(game_data)};
+        const gameColumns = """
+
+_GAME_HTML_TAIL = """;
+        const gameData = gameColumns.word.map((word, i) => ({
+            word: word,
+            meaning: gameColumns.meaning[i],
+            synonyms: gameColumns.synonyms[i].map(k => gameColumns.strings[k]),
+            antonyms: gameColumns.antonyms[i].map(k => gameColumns.strings[k]),
+            sentences: gameColumns.sentences[i],
+            origin: gameColumns.origin[i],
+            clues: gameColumns.clues[i],
+            meaningOptions: gameColumns.meaning_options[i],
+            wordOptions: gameColumns.word_options[i]
+        }));
         
         let currentWord = null;
         let gameMode = 'word-to-meaning';
@@ -570,31 +597,31 @@ def create_game_html(words_data):
         const streakScore = document.getElementById('streak-score');
         
         // Event listeners
-        modeButtons.forEach(btn => {{
-            btn.addEventListener('click', () => {{
+        modeButtons.forEach(btn => {
+            btn.addEventListener('click', () => {
                 modeButtons.forEach(b => b.classList.remove('active'));
                 btn.classList.add('active');
                 gameMode = btn.dataset.mode;
                 generateNewQuestion();
-            }});
-        }});
+            });
+        });
         
         newQuestionBtn.addEventListener('click', generateNewQuestion);
         submitBtn.addEventListener('click', checkAnswer);
         hintBtn.addEventListener('click', showHint);
         skipBtn.addEventListener('click', skipQuestion);
         
-        answerInput.addEventListener('keypress', (e) => {{
-            if (e.key === 'Enter') {{
+        answerInput.addEventListener('keypress', (e) => {
+            if (e.key === 'Enter') {
                 checkAnswer();
-            }}
-        }});
+            }
+        });
         
-        answerInput.addEventListener('input', () => {{
+        answerInput.addEventListener('input', () => {
             submitBtn.disabled = answerInput.value.trim() === '';
-        }});
+        });
         
-        function generateNewQuestion() {{
+        function generateNewQuestion() {
             currentWord = gameData[Math.floor(Math.random() * gameData.length)];
             hintsUsed = 0;
             feedbackArea.innerHTML = '';
@@ -606,7 +633,7 @@ def create_game_html(words_data):
             skipBtn.disabled = false;
             answerInput.focus();
             
-            switch(gameMode) {{
+            switch(gameMode) {
                 case 'word-to-meaning':
                     questionText.innerHTML = '<strong>What does "' + currentWord.word + '" mean?</strong>';
                     break;
@@ -614,53 +641,41 @@ def create_game_html(words_data):
                     questionText.innerHTML = '<strong>Which word means:</strong><br>"' + currentWord.meaning + '"';
                     break;
                 case 'sentence-clue':
-                    if (currentWord.sentences.length > 0) {{
+                    if (currentWord.sentences.length > 0) {
                         const sentence = currentWord.sentences[Math.floor(Math.random() * currentWord.sentences.length)];
                         const hiddenSentence = sentence.replace(new RegExp(currentWord.word, 'gi'), '____');
                         questionText.innerHTML = '<strong>Fill in the blank:</strong><br>"' + hiddenSentence + '"';
-                    }} else {{
+                    } else {
                         questionText.innerHTML = '<strong>What does "' + currentWord.word + '" mean?</strong>';
-                    }}
+                    }
                     break;
                 case 'fun-clues':
                     const randomClue = currentWord.clues[Math.floor(Math.random() * currentWord.clues.length)];
                     questionText.innerHTML = '<strong>Guess the word:</strong><br>' + randomClue;
                     break;
-            }}
-        }}
+            }
+        }
         
-        function showHint() {{
+        function showHint() {
             hintsUsed++;
             const clue = document.createElement('div');
             clue.className = 'clue';
             
             // Generate multiple choice options for the final hint
             let multipleChoiceOptions = [];
-            if (hintsUsed === 6) {{
-                if (gameMode === 'word-to-meaning') {{
-                    // For word-to-meaning: show 4 different meanings
-                    const wrongMeanings = gameData
-                        .filter(w => w.word !== currentWord.word && w.meaning.length > 10)
-                        .sort(() => Math.random() - 0.5)
-                        .slice(0, 3)
-                        .map(w => w.meaning);
-                    
-                    multipleChoiceOptions = [...wrongMeanings, currentWord.meaning].sort(() => Math.random() - 0.5);
-                }} else {{
-                    // For other modes: show 4 different words
-                    const wrongOptions = gameData
-                        .filter(w => w.word !== currentWord.word && w.word.length >= currentWord.word.length - 2 && w.word.length <= currentWord.word.length + 2)
-                        .sort(() => Math.random() - 0.5)
-                        .slice(0, 3)
-                        .map(w => w.word);
-                    
-                    multipleChoiceOptions = [...wrongOptions, currentWord.word].sort(() => Math.random() - 0.5);
-                }}
-            }}
+            if (hintsUsed === 6) {
+                if (gameMode === 'word-to-meaning') {
+                    // For word-to-meaning: show 4 different meanings (already shuffled)
+                    multipleChoiceOptions = currentWord.meaningOptions.map(i => gameData[i].meaning);
+                } else {
+                    // For other modes: show 4 different words (already shuffled)
+                    multipleChoiceOptions = currentWord.wordOptions.map(i => gameData[i].word);
+                }
+            }
             
             let hints = [];
             
-            if (gameMode === 'word-to-meaning') {{
+            if (gameMode === 'word-to-meaning') {
                 // For word-to-meaning: don't reveal the word in hints
                 hints = [
                     '💡 Hint ' + hintsUsed + ': This definition has ' + currentWord.meaning.split(' ').length + ' words',
@@ -670,7 +685,7 @@ def create_game_html(words_data):
                     '💡 Hint ' + hintsUsed + ': Etymology clue: ' + (currentWord.origin ? currentWord.origin.substring(0, 40) + '...' : 'Ancient origins'),
                     '🎯 Final Hint: Choose one of these options: ' + multipleChoiceOptions.join(' | ')
                 ];
-            }} else {{
+            } else {
                 // For other modes: use original hints with word details
                 hints = [
                     '💡 Hint ' + hintsUsed + ': The word has ' + currentWord.word.length + ' letters',
@@ -680,10 +695,10 @@ def create_game_html(words_data):
                     '💡 Hint ' + hintsUsed + ': ' + currentWord.origin.substring(0, 50) + '...',
                     '🎯 Final Hint: Choose one of these options: ' + multipleChoiceOptions.join(' | ')
                 ];
-            }}
+            }
             
-            if (hintsUsed <= hints.length) {{
-                if (hintsUsed === 6) {{
+            if (hintsUsed <= hints.length) {
+                if (hintsUsed === 6) {
                     // Special styling for multiple choice hint
                     clue.className = 'clue multiple-choice-clue';
                     clue.innerHTML = '🎯 Final Hint: Choose the correct word:';
@@ -692,11 +707,11 @@ def create_game_html(words_data):
                     const optionsDiv = document.createElement('div');
                     optionsDiv.className = 'choice-options';
                     
-                    multipleChoiceOptions.forEach(option => {{
+                    multipleChoiceOptions.forEach(option => {
                         const optionDiv = document.createElement('div');
                         optionDiv.className = 'choice-option';
                         optionDiv.textContent = option;
-                        optionDiv.onclick = function() {{
+                        optionDiv.onclick = function() {
                             answerInput.value = option;
                             answerInput.focus();
                             // Trigger input event to enable submit button
@@ -704,25 +719,25 @@ def create_game_html(words_data):
                             // Highlight selected option
                             document.querySelectorAll('.choice-option').forEach(opt => opt.classList.remove('selected'));
                             optionDiv.classList.add('selected');
-                        }};
+                        };
                         optionsDiv.appendChild(optionDiv);
-                    }});
+                    });
                     
                     clue.appendChild(optionsDiv);
-                }} else {{
+                } else {
                     clue.textContent = hints[hintsUsed - 1];
-                }}
+                }
                 
                 cluesArea.appendChild(clue);
                 clue.classList.add('bounce');
-            }}
+            }
             
-            if (hintsUsed >= 6) {{
+            if (hintsUsed >= 6) {
                 hintBtn.disabled = true;
-            }}
-        }}
+            }
+        }
         
-        function checkAnswer() {{
+        function checkAnswer() {
             const userAnswer = answerInput.value.trim().toLowerCase();
             let isCorrect = false;
             
@@ -731,16 +746,16 @@ def create_game_html(words_data):
             console.log('User Answer:', userAnswer);
             console.log('Correct Answer:', gameMode === 'word-to-meaning' ? currentWord.meaning : currentWord.word);
             
-            switch(gameMode) {{
+            switch(gameMode) {
                 case 'word-to-meaning':
                     const meaningLower = currentWord.meaning.toLowerCase();
                     
                     // Check if user typed the word instead of meaning
-                    if (userAnswer === currentWord.word.toLowerCase()) {{
+                    if (userAnswer === currentWord.word.toLowerCase()) {
                         // Special feedback for typing the word instead of meaning
                         showSpecialFeedback('word-instead-of-meaning');
                         return;
-                    }}
+                    }
                     
                     // Check for correct answers (handle periods and exact matches)
                     const cleanMeaning = meaningLower.replace(/[.,;!?]/g, '').trim();
@@ -758,163 +773,284 @@ def create_game_html(words_data):
                 case 'fun-clues':
                     isCorrect = currentWord.word.toLowerCase() === userAnswer;
                     break;
-            }}
+            }
             
             console.log('Is Correct:', isCorrect);
             
             totalQuestions++;
             
-            if (isCorrect) {{
+            if (isCorrect) {
                 correctAnswers++;
                 currentStreak++;
                 maxStreak = Math.max(maxStreak, currentStreak);
                 showFeedback(true);
-            }} else {{
+            } else {
                 currentStreak = 0;
                 showFeedback(false);
-            }}
+            }
             
             updateScores();
             disableInputs();
-        }}
+        }
         
-        function showSpecialFeedback(type) {{
+        function showSpecialFeedback(type) {
             const feedback = document.createElement('div');
             feedback.className = 'feedback incorrect';
             
-            if (type === 'word-instead-of-meaning') {{
+            if (type === 'word-instead-of-meaning') {
                 feedback.innerHTML = '🤔 Close! You typed the word "' + currentWord.word + '" but I need its <strong>meaning</strong>!<br>💡 Try: "' + currentWord.meaning + '"';
-            }}
+            }
             
-            feedbackArea.innerHTML = '';
-            feedbackArea.appendChild(feedback);
+            feedbackArea.replaceChildren(feedback);
             
             // Don't count as wrong answer, just give them another chance
-            setTimeout(() => {{
+            setTimeout(() => {
                 feedback.innerHTML += '<br><br>🎯 Try again! What does "' + currentWord.word + '" mean?';
-            }}, 2000);
-        }}
+            }, 2000);
+        }
         
-        function showFeedback(correct) {{
+        function showFeedback(correct) {
             const feedback = document.createElement('div');
             feedback.className = 'feedback ' + (correct ? 'correct' : 'incorrect');
             
-            if (correct) {{
+            if (correct) {
                 const messages = ['🎉 Excellent!', '✨ Perfect!', '🚀 Amazing!', '🏆 Brilliant!', '⭐ Outstanding!'];
                 feedback.innerHTML = messages[Math.floor(Math.random() * messages.length)];
-            }} else {{
+            } else {
                 feedback.innerHTML = '❌ Not quite right. The answer was: <strong>' + (gameMode === 'word-to-meaning' ? currentWord.meaning : currentWord.word) + '</strong>';
-            }}
+            }
             
-            feedbackArea.innerHTML = '';
-            feedbackArea.appendChild(feedback);
+            feedbackArea.replaceChildren(feedback);
             
             // Show word details
-            setTimeout(() => {{
+            setTimeout(() => {
                 showWordDetails();
-            }}, 1000);
-        }}
+            }, 1000);
+        }
         
-        function showWordDetails() {{
+        function showWordDetails() {
             const details = document.createElement('div');
             details.className = 'answer-reveal';
-            let detailsHTML = '<h3>' + currentWord.word + '</h3><div class="word-details">';
-            detailsHTML += '<div class="detail-section"><span class="detail-title">Meaning:</span> ' + currentWord.meaning + '</div>';
-            
-            if (currentWord.synonyms.length) {{
-                detailsHTML += '<div class="detail-section"><span class="detail-title">Synonyms:</span><br>';
-                detailsHTML += currentWord.synonyms.map(syn => '<span class="synonym-tag">' + syn + '</span>').join('');
-                detailsHTML += '</div>';
-            }}
-            
-            if (currentWord.antonyms.length) {{
-                detailsHTML += '<div class="detail-section"><span class="detail-title">Antonyms:</span><br>';
-                detailsHTML += currentWord.antonyms.map(ant => '<span class="antonym-tag">' + ant + '</span>').join('');
-                detailsHTML += '</div>';
-            }}
-            
-            if (currentWord.sentences.length) {{
-                detailsHTML += '<div class="detail-section"><span class="detail-title">Example:</span>';
-                detailsHTML += '<div class="example-sentence">' + currentWord.sentences[0] + '</div></div>';
-            }}
-            
-            detailsHTML += '</div>';
-            details.innerHTML = detailsHTML;
+            // Collect the fragments and join them once
+            const word = currentWord;
+            const parts = ['<h3>', word.word, '</h3><div class="word-details">',
+                '<div class="detail-section"><span class="detail-title">Meaning:</span> ', word.meaning, '</div>'];
+            
+            if (word.synonyms.length) {
+                parts.push('<div class="detail-section"><span class="detail-title">Synonyms:</span><br>');
+                for (const syn of word.synonyms) parts.push('<span class="synonym-tag">', syn, '</span>');
+                parts.push('</div>');
+            }
+            
+            if (word.antonyms.length) {
+                parts.push('<div class="detail-section"><span class="detail-title">Antonyms:</span><br>');
+                for (const ant of word.antonyms) parts.push('<span class="antonym-tag">', ant, '</span>');
+                parts.push('</div>');
+            }
+            
+            const example = word.sentences[0];
+            if (example !== undefined) {
+                parts.push('<div class="detail-section"><span class="detail-title">Example:</span>',
+                    '<div class="example-sentence">', example, '</div></div>');
+            }
+            
+            parts.push('</div>');
+            details.innerHTML = parts.join('');
             feedbackArea.appendChild(details);
-        }}
+        }
         
-        function skipQuestion() {{
+        function skipQuestion() {
             totalQuestions++;
             currentStreak = 0;
             showFeedback(false);
             updateScores();
             disableInputs();
-        }}
+        }
         
-        function disableInputs() {{
+        function disableInputs() {
             answerInput.disabled = true;
             submitBtn.disabled = true;
             hintBtn.disabled = true;
             skipBtn.disabled = true;
-        }}
+        }
         
-        function updateScores() {{
+        function updateScores() {
             correctScore.textContent = correctAnswers;
             totalScore.textContent = totalQuestions;
             streakScore.textContent = currentStreak;
-        }}
+        }
         
         // Initialize game
         generateNewQuestion();
     </script>
 </body>
 </html>"""
+
+def pick_distractors(words, buckets, i):
+    """Indices of DISTRACTOR_COUNT random other words drawn from buckets (lists of indices), for the final hint of word i."""
+    word = words[i]
+    total = sum(map(len, buckets))
+    picked = []
+    for _ in range(DISTRACTOR_DRAWS if total else 0):
+        # Uniform over all bucketed indices without concatenating the buckets
+        r = random.randrange(total)
+        for bucket in buckets:
+            if r < len(bucket):
+                j = bucket[r]
+                break
+            r -= len(bucket)
+        if words[j] != word and j not in picked:
+            picked.append(j)
+            if len(picked) == DISTRACTOR_COUNT:
+                return picked
     
-    return html_content
+    # Few other words in the buckets: sample from all of them
+    candidates = [j for bucket in buckets for j in bucket if words[j] != word]
+    return random.sample(candidates, min(DISTRACTOR_COUNT, len(candidates)))
 
-def main():
-    """Main function to generate the word game."""
-    input_file = "enrichedpdfplan.txt"
-    output_file = "word_master_game.html"
+def with_answer(distractors, i):
+    """The final hint's options: the distractor indices plus the answer's own index, uniformly shuffled."""
+    options = distractors + [i]
+    random.shuffle(options)
+    return options
+
+def build_game_data(words_data):
+    """Game data as parallel columns, one list per field, for every word that has a meaning."""
+    playable = [word_data for word_data in words_data if word_data.word and word_data.meaning]
+    words = [word_data.word for word_data in playable]
+    meanings = [word_data.meaning for word_data in playable]
     
-    if not Path(input_file).exists():
-        print(f"❌ Error: Input file '{input_file}' not found!")
-        return
+    # Distractor pools: entries with a real meaning, and entries bucketed by word length
+    # (a word's candidates are the buckets within two letters of its length)
+    long_meanings = [[j for j, meaning in enumerate(meanings) if len(meaning) > 10]]
+    by_length = {}
+    for j, word in enumerate(words):
+        by_length.setdefault(len(word), []).append(j)
+    nearby_lengths = {n: [by_length.get(m, ()) for m in range(n - 2, n + 3)] for n in by_length}
     
-    print("🎮 Generating Word Master Game...")
+    # Synonyms and antonyms repeat across entries; each distinct one is stored once in
+    # a string table and entries refer to it by index
+    strings = {}
+    def string_ids(items):
+        return [strings.setdefault(item, len(strings)) for item in items]
     
-    # Read and parse the input file
-    with open(input_file, 'r', encoding='utf-8') as f:
-        content = f.read()
+    synonym_ids = [string_ids(word_data.synonyms[:5]) for word_data in playable]
+    antonym_ids = [string_ids(word_data.antonyms[:5]) for word_data in playable]
     
-    entries = re.split(r'\n-{25,}\n', content)
+    return {
+        'word': words,
+        'meaning': meanings,
+        'strings': list(strings),
+        'synonyms': synonym_ids,
+        'antonyms': antonym_ids,
+        'sentences': [[sentence.translate(_HTML_TABLE) for sentence in word_data.sentences[:3]]
+                      for word_data in playable],
+        'origin': [word_data.origin for word_data in playable],
+        'clues': [[clue.translate(_HTML_TABLE) for clue in generate_funny_clues(word_data)]
+                  for word_data in playable],
+        'meaning_options': [with_answer(pick_distractors(words, long_meanings, i), i) for i in range(len(words))],
+        'word_options': [with_answer(pick_distractors(words, nearby_lengths[len(word)], i), i)
+                         for i, word in enumerate(words)]
+    }
+
+def dump_game_data(game_data):
+    """Compact JSON for a <script> in the page, using orjson when available.
+
+    Non-ASCII text is kept as UTF-8; every '<' is written as \\u003c, which covers '</script>' and '<!--'.
+    """
+    if orjson is not None:
+        text = orjson.dumps(game_data).decode('utf-8')
+    else:
+        text = json.dumps(game_data, separators=(',', ':'), ensure_ascii=False)
+    return text.translate(_SCRIPT_SAFE_TABLE)
+
+def create_game_html(words_data):
+    """Create the interactive game HTML."""
+    return "".join((_GAME_HTML_HEAD, dump_game_data(build_game_data(words_data)), _GAME_HTML_TAIL))
+
+def write_game_html(game_json, *outs):
+    """Write the game HTML around already dumped game data to open files, section by section."""
+    for section in (_GAME_HTML_HEAD, game_json, _GAME_HTML_TAIL):
+        for out in outs:
+            out.write(section)
+
+def parse_entries(content):
+    """Parse every entry of the file's text, keeping those with a word and a meaning."""
+    entries = _ENTRY_RE.findall(content)
     
     words_data = []
     print(f"Processing {len(entries)} entries...")
     
     for i, entry in enumerate(entries):
-        if entry.strip():
-            try:
-                word_data = parse_word_entry(entry)
-                if word_data['word'] and word_data['meaning']:
-                    words_data.append(word_data)
-            except Exception as e:
-                print(f"Error processing entry {i}: {e}")
-                continue
+        try:
+            word_data = parse_word_entry(entry)
+            if word_data.word and word_data.meaning:
+                words_data.append(word_data)
+        except Exception as e:
+            print(f"Error processing entry {i}: {e}")
+            continue
     
     print(f"Successfully processed {len(words_data)} words")
+    return words_data
+
+def load_game_json(input_file):
+    """Dumped game data for input_file and its word count, from the on-disk cache or built from its entries."""
+    path = Path(input_file)
+    with open(path, 'rb') as f:
+        data = f.read()
+    signature = [GAME_DATA_CACHE_VERSION, hashlib.sha256(data).hexdigest()]
+    
+    # Cache layout: a one-line JSON header, then the game data JSON exactly as it is inlined
+    cache_file = path.with_suffix(GAME_DATA_CACHE_SUFFIX)
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            header = json.loads(f.readline())
+            if header.get('signature') == signature:
+                print(f"📦 Loaded built game data for {header['words']} words from {cache_file}")
+                return f.read(), header['words']
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass  # Missing, stale or unreadable cache: build again
+    
+    words_data = parse_entries(data.decode('utf-8'))
+    game_json = dump_game_data(build_game_data(words_data))
+    header = json.dumps({'signature': signature, 'words': len(words_data)})
+    
+    # Write to a temporary file first so an interrupted run never leaves a truncated cache
+    tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(header + '\n')
+            f.write(game_json)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"⚠️  Could not write game data cache {cache_file}: {e}")
+    
+    return game_json, len(words_data)
+
+def main():
+    """Main function to generate the word game."""
+    input_file = "enrichedpdfplan.txt"
+    output_file = "word_master_game.html"
+    
+    if not Path(input_file).exists():
+        print(f"❌ Error: Input file '{input_file}' not found!")
+        return
+    
+    print("🎮 Generating Word Master Game...")
     
-    # Generate the game HTML
-    html_content = create_game_html(words_data)
+    # Build the game data from the input file (or reuse the copy cached for it)
+    game_json, word_count = load_game_json(input_file)
     
-    # Write the HTML file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # Generate the game HTML straight into the output file and its gzipped copy
+    compressed_file = output_file + ".gz"
+    with open(output_file, 'w', encoding='utf-8') as f, \
+         gzip.open(compressed_file, 'wt', encoding='utf-8', compresslevel=GZIP_LEVEL) as gz:
+        write_game_html(game_json, f, gz)
     
     print(f"✅ Word Master Game created!")
-    print(f"📁 Output file: {output_file}")
+    print(f"📁 Output file: {output_file} (gzipped: {compressed_file})")
     print(f"🎮 Open the file in your browser to play!")
-    print(f"📊 Game includes {len(words_data)} words with multiple game modes")
+    print(f"📊 Game includes {word_count} words with multiple game modes")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file